@@ -0,0 +1,157 @@
+import argparse
+import os
+import sys
+import tempfile
+import time
+import types
+from typing import Callable
+
+import ujson as json
+
+REPO_FOLDER = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SHEET_SETTINGS = {
+    "cost_for_laser": {"Nitrogen": 150, "CO2": 100},
+    "materials": ["Mild Steel", "304 SS"],
+    "thicknesses": ["16 Gauge", "10 Gauge"],
+    "pounds_per_square_foot": {
+        material: {"16 Gauge": {"pounds_per_square_foot": 2.5, "latest_change": ""}, "10 Gauge": {"pounds_per_square_foot": 5.6, "latest_change": ""}}
+        for material in ("Mild Steel", "304 SS")
+    },
+    "price_per_pound": {material: {"price_per_pound": 1.2, "latest_change": ""} for material in ("Mild Steel", "304 SS")},
+    "cutting_methods": {material_id: {"name": material_id, "cut": "CO2"} for material_id in ("ST", "SS", "AL", "GALV", "GALN")},
+    "thickness_ids": {},
+}
+
+
+def get_argument_parser(description: str) -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument(
+        "--repo",
+        default=REPO_FOLDER,
+        help="checkout to benchmark, point it at a git worktree of an older commit to get the before numbers",
+    )
+    return parser
+
+
+def set_up(repo: str) -> str:
+    """Imports utils from repo and moves into an empty data folder, Settings and the inventories read and write relative to the working directory."""
+    sys.path.insert(0, os.path.abspath(repo))
+    folder = tempfile.mkdtemp(prefix="inventory_manager_benchmark_")
+    os.makedirs(f"{folder}/data")
+    os.chdir(folder)
+    write_json("sheet_settings", SHEET_SETTINGS)
+    return folder
+
+
+def write_json(filename: str, data: dict):
+    with open(f"data/{filename}.json", "w", encoding="utf-8") as file:
+        json.dump(data, file)
+
+
+def get_category_names(count: int) -> list[str]:
+    return [f"Category {index}" for index in range(count)]
+
+
+def get_part_name(index: int) -> str:
+    return f"PART-{index:05d}"
+
+
+def get_component_name(index: int) -> str:
+    return f"PN-{index:05d}"
+
+
+def get_laser_cut_part_data(index: int, category_names: list[str]) -> dict:
+    category_name = category_names[index % len(category_names)]
+    return {
+        "quantity": index % 50,
+        "categories": [category_name],
+        "category_quantities": {category_name: 1 + index % 4},
+        "machine_time": 1.5,
+        "weight": 2.25,
+        "part_number": str(index),
+        "surface_area": 12.5,
+        "cutting_length": 48.0,
+        "file_name": f"{get_part_name(index)}.pdf",
+        "gauge": ("16 Gauge", "10 Gauge")[index % 2],
+        "material": ("Mild Steel", "304 SS")[index % 2],
+        "price": 4.75,
+        "shelf_number": f"S{index % 40}",
+        "notes": "",
+        "bending_files": [f"bending/{get_part_name(index)}.pdf"],
+        "welding_files": [],
+        "cnc_milling_files": [],
+    }
+
+
+def get_component_data(index: int, category_names: list[str]) -> dict:
+    category_name = category_names[index % len(category_names)]
+    return {
+        "quantity": index % 80,
+        "categories": [category_name],
+        "category_quantities": {category_name: 1 + index % 3},
+        "part_name": f"Component {index}",
+        "price": 0.35,
+        "shelf_number": f"C{index % 25}",
+        "notes": "",
+        "image_path": "",
+    }
+
+
+def write_inventories(laser_cut_part_count: int, component_count: int, category_count: int = 25):
+    category_names = get_category_names(category_count)
+    write_json(
+        "laser_cut_inventory",
+        {
+            "categories": category_names,
+            "laser_cut_parts": {get_part_name(index): get_laser_cut_part_data(index, category_names) for index in range(laser_cut_part_count)},
+            "recut_parts": {},
+        },
+    )
+    write_json(
+        "components_inventory",
+        {
+            "categories": category_names,
+            "components": {get_component_name(index): get_component_data(index, category_names) for index in range(component_count)},
+        },
+    )
+
+
+def get_job_data(laser_cut_part_indexes: list[int], component_indexes: list[int], category_names: list[str], assembly_count: int = 10) -> dict:
+    assemblies = {}
+    for assembly_index in range(assembly_count):
+        assemblies[f"Assembly {assembly_index}"] = {
+            "assembly_data": {"has_items": True, "has_sub_assemblies": False},
+            "laser_cut_parts": {get_part_name(index): get_laser_cut_part_data(index, category_names) for index in laser_cut_part_indexes[assembly_index::assembly_count]},
+            "components": {get_component_name(index): get_component_data(index, category_names) for index in component_indexes[assembly_index::assembly_count]},
+            "sub_assemblies": {},
+        }
+    return {"job_data": {"type": 1}, "nests": {}, "groups": {"Group": {"group_data": {}, "assemblies": assemblies}}}
+
+
+def load_inventories() -> types.SimpleNamespace:
+    """The same objects MainWindow hands to JobManager, without any of the UI."""
+    from utils.components_inventory.components_inventory import ComponentsInventory
+    from utils.laser_cut_inventory.laser_cut_inventory import LaserCutInventory
+    from utils.paint_inventory.paint_inventory import PaintInventory
+    from utils.sheet_settings.sheet_settings import SheetSettings
+    from utils.sheets_inventory.sheets_inventory import SheetsInventory
+    from utils.workspace.workspace_settings import WorkspaceSettings
+
+    parent = types.SimpleNamespace(sheet_settings=SheetSettings())
+    parent.components_inventory = ComponentsInventory()
+    parent.paint_inventory = PaintInventory(parent)
+    parent.workspace_settings = WorkspaceSettings()
+    parent.laser_cut_inventory = LaserCutInventory(parent)
+    parent.sheets_inventory = SheetsInventory(parent)
+    return parent
+
+
+def time_best(function: Callable[[], object], repeat: int) -> float:
+    """Fastest of repeat runs in seconds, the slower ones mostly measure whatever else the machine was doing."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
@@ -0,0 +1,53 @@
+"""Time Job.to_dict() against a large synthetic inventory.
+
+Job.to_dict() looks up every laser cut part and component of the job in the inventories before saving them,
+so it shows what the name indexes buy. For the before numbers run it against a checkout from before they landed:
+
+    git worktree add /tmp/before <commit>
+    python benchmarks/job_save_benchmark.py --repo /tmp/before
+    python benchmarks/job_save_benchmark.py
+"""
+
+from common import get_argument_parser, get_category_names, get_job_data, load_inventories, set_up, time_best, write_inventories
+
+
+def main():
+    parser = get_argument_parser(__doc__.splitlines()[0])
+    parser.add_argument("--parts", type=int, default=10_000, help="laser cut parts and components in the inventories")
+    parser.add_argument("--job-parts", type=int, default=2_000, help="laser cut parts and components in the job")
+    parser.add_argument("--repeat", type=int, default=5)
+    arguments = parser.parse_args()
+
+    set_up(arguments.repo)
+    write_inventories(arguments.parts, arguments.parts)
+
+    from utils.workspace.job import Job
+    from utils.workspace.job_manager import JobManager
+
+    inventories = load_inventories()
+    job_manager = JobManager(inventories)
+    # Spread over the whole inventory, a scan from the front would get lucky with the first few thousand names
+    step = max(arguments.parts // arguments.job_parts, 1)
+    indexes = list(range(0, arguments.parts, step))[: arguments.job_parts]
+    job = Job("Benchmark", get_job_data(indexes, indexes, get_category_names(25)), job_manager)
+    laser_cut_parts = job.get_all_laser_cut_parts()
+    components = job.get_all_components()
+
+    def look_up():
+        for laser_cut_part in laser_cut_parts:
+            inventories.laser_cut_inventory.get_laser_cut_part_by_name(laser_cut_part.name)
+        for component in components:
+            inventories.components_inventory.get_component_by_name(component.name)
+
+    lookup_time = time_best(look_up, arguments.repeat)
+    save_time = time_best(job.to_dict, arguments.repeat)
+
+    print(f"repo: {arguments.repo}")
+    print(f"inventory: {arguments.parts} laser cut parts, {arguments.parts} components")
+    print(f"job: {len(laser_cut_parts)} laser cut parts, {len(components)} components")
+    print(f"lookups:         {lookup_time * 1000:10.2f} ms")
+    print(f"Job.to_dict():   {save_time * 1000:10.2f} ms (includes saving both inventories)")
+
+
+if __name__ == "__main__":
+    main()
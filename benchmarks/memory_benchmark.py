@@ -0,0 +1,71 @@
+"""Measure the RSS of a large synthetic inventory plus a set of loaded jobs.
+
+Most of it is LaserCutPart and Component instances, so it shows what their __slots__ save.
+For the before numbers run it against a checkout from before they landed:
+
+    git worktree add /tmp/before <commit>
+    python benchmarks/memory_benchmark.py --repo /tmp/before
+    python benchmarks/memory_benchmark.py
+"""
+
+import gc
+import resource
+
+from common import get_argument_parser, get_category_names, get_job_data, load_inventories, set_up, write_inventories
+
+
+def get_rss() -> int:
+    """Resident set size in bytes, the peak is all we get where /proc is missing."""
+    try:
+        with open("/proc/self/status", encoding="utf-8") as file:
+            for line in file:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def format_size(size: int) -> str:
+    return f"{size / 1024 / 1024:8.1f} MiB"
+
+
+def main():
+    parser = get_argument_parser(__doc__.splitlines()[0])
+    parser.add_argument("--parts", type=int, default=20_000, help="laser cut parts and components in the inventories")
+    parser.add_argument("--jobs", type=int, default=50)
+    parser.add_argument("--job-parts", type=int, default=400, help="laser cut parts and components in each job")
+    arguments = parser.parse_args()
+
+    set_up(arguments.repo)
+    write_inventories(arguments.parts, arguments.parts)
+    category_names = get_category_names(25)
+    jobs_data = []
+    for job_index in range(arguments.jobs):
+        indexes = [(job_index * arguments.job_parts + index) % arguments.parts for index in range(arguments.job_parts)]
+        jobs_data.append(get_job_data(indexes, indexes, category_names))
+
+    from utils.workspace.job import Job
+    from utils.workspace.job_manager import JobManager
+
+    gc.collect()
+    start_rss = get_rss()
+    inventories = load_inventories()
+    gc.collect()
+    inventory_rss = get_rss()
+    job_manager = JobManager(inventories)
+    for job_index, job_data in enumerate(jobs_data):
+        job_manager.add_job(Job(f"Job {job_index}", job_data, job_manager))
+    gc.collect()
+    jobs_rss = get_rss()
+
+    print(f"repo: {arguments.repo}")
+    print(f"inventory: {arguments.parts} laser cut parts, {arguments.parts} components")
+    print(f"jobs: {arguments.jobs} with {arguments.job_parts} laser cut parts and {arguments.job_parts} components each")
+    print(f"inventories: {format_size(inventory_rss - start_rss)}")
+    print(f"jobs:        {format_size(jobs_rss - inventory_rss)}")
+    print(f"total RSS:   {format_size(jobs_rss)}")
+
+
+if __name__ == "__main__":
+    main()
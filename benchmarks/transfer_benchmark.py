@@ -0,0 +1,147 @@
+"""Time uploads and downloads of the largest synthetic data files over a throttled local link, with and without gzip.
+
+A local Flask server stands in for the inventory server (it advertises gzip and inflates gzipped request bodies),
+ServerClient talks to it through a TCP proxy that holds each direction to --rate KiB/s.
+"""
+
+import gzip
+import io
+import logging
+import socket
+import threading
+import time
+
+from common import get_argument_parser, get_category_names, get_job_data, set_up, time_best, write_inventories, write_json
+
+
+class ThrottledProxy:
+    """Forwards local TCP connections to port, sleeping so neither direction goes faster than bytes_per_second."""
+
+    CHUNK_SIZE: int = 16 * 1024
+
+    def __init__(self, port: int, bytes_per_second: int):
+        self.port = port
+        self.bytes_per_second = bytes_per_second
+        self.listener = socket.create_server(("127.0.0.1", 0))
+        threading.Thread(target=self.accept_connections, daemon=True).start()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.listener.getsockname()[1]}"
+
+    def accept_connections(self):
+        while True:
+            client, _ = self.listener.accept()
+            upstream = socket.create_connection(("127.0.0.1", self.port))
+            threading.Thread(target=self.forward, args=(client, upstream), daemon=True).start()
+            threading.Thread(target=self.forward, args=(upstream, client), daemon=True).start()
+
+    def forward(self, source: socket.socket, destination: socket.socket):
+        try:
+            while data := source.recv(self.CHUNK_SIZE):
+                time.sleep(len(data) / self.bytes_per_second)
+                destination.sendall(data)
+            destination.shutdown(socket.SHUT_WR)
+        except OSError:  # The other direction closed both sockets
+            pass
+
+
+class InflateRequests:
+    """WSGI middleware for Content-Encoding: gzip request bodies, werkzeug leaves them to the application."""
+
+    def __init__(self, app):
+        self.app = app
+
+    def __call__(self, environ, start_response):
+        if environ.get("HTTP_CONTENT_ENCODING", "").lower() == "gzip":
+            body = gzip.decompress(environ["wsgi.input"].read(int(environ.get("CONTENT_LENGTH") or 0)))
+            environ["wsgi.input"] = io.BytesIO(body)
+            environ["CONTENT_LENGTH"] = str(len(body))
+            del environ["HTTP_CONTENT_ENCODING"]
+        return self.app(environ, start_response)
+
+
+def start_server(files: dict[str, bytes]) -> tuple[int, dict[str, int]]:
+    """Serves files under /file/ and takes uploads on /upload, returns the port and the size of each received upload."""
+    from flask import Flask, Response, request
+    from werkzeug.serving import make_server
+
+    logging.getLogger("werkzeug").setLevel(logging.ERROR)
+    app = Flask(__name__)
+    received_sizes: dict[str, int] = {}
+
+    @app.route("/file/<file_name>")
+    def get_file(file_name: str) -> Response:
+        content = files[file_name]
+        if "gzip" in request.headers.get("Accept-Encoding", ""):
+            return Response(gzip.compress(content, compresslevel=6), mimetype="application/json", headers={"Content-Encoding": "gzip"})
+        return Response(content, mimetype="application/json")
+
+    @app.route("/upload", methods=["POST"])
+    def upload() -> Response:
+        for file in request.files.values():
+            received_sizes[file.filename] = len(file.read())
+        return Response("Uploaded")
+
+    @app.after_request
+    def advertise_gzip(response: Response) -> Response:
+        response.headers["Accept-Encoding"] = "gzip"
+        return response
+
+    app.wsgi_app = InflateRequests(app.wsgi_app)
+    server = make_server("127.0.0.1", 0, app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server.server_port, received_sizes
+
+
+def format_size(size: int) -> str:
+    return f"{size / 1024 / 1024:7.2f} MiB"
+
+
+def main():
+    parser = get_argument_parser(__doc__.splitlines()[0])
+    parser.add_argument("--parts", type=int, default=10_000, help="laser cut parts and components in the inventories")
+    parser.add_argument("--job-parts", type=int, default=2_000, help="laser cut parts and components in the job")
+    parser.add_argument("--rate", type=int, default=1024, help="link speed in KiB/s for each direction")
+    parser.add_argument("--repeat", type=int, default=3)
+    arguments = parser.parse_args()
+
+    set_up(arguments.repo)
+    write_inventories(arguments.parts, arguments.parts)
+    indexes = list(range(arguments.job_parts))
+    write_json("job", get_job_data(indexes, indexes, get_category_names(25)))
+    files: dict[str, bytes] = {}
+    for file_name in ("laser_cut_inventory.json", "components_inventory.json", "job.json"):
+        with open(f"data/{file_name}", "rb") as file:
+            files[file_name] = file.read()
+
+    from utils.server_client import ServerClient
+
+    port, received_sizes = start_server(files)
+    proxy = ThrottledProxy(port, arguments.rate * 1024)
+    server_client = ServerClient()
+    server_client.server_url = proxy.url
+
+    def upload(file_name: str, compress: bool):
+        server_client.request_compression_supported = compress
+        response = server_client.post("/upload", files={"file": (file_name, files[file_name], "application/json")}, compress=True, timeout=600)
+        response.raise_for_status()
+        if received_sizes.pop(file_name) != len(files[file_name]):
+            raise RuntimeError(f"{file_name} did not arrive intact")
+
+    def download(file_name: str, compress: bool):
+        response = server_client.get(f"/file/{file_name}", headers={"Accept-Encoding": "gzip" if compress else "identity"}, timeout=600)
+        response.raise_for_status()
+        if response.content != files[file_name]:
+            raise RuntimeError(f"{file_name} did not arrive intact")
+
+    print(f"repo: {arguments.repo}")
+    print(f"link: {arguments.rate} KiB/s each way")
+    print(f"{'file':<28}{'size':>12}{'gzipped':>12}{'upload':>10}{'gzip':>10}{'download':>10}{'gzip':>10}")
+    for file_name, content in files.items():
+        times = [time_best(lambda: transfer(file_name, compress), arguments.repeat) for transfer in (upload, download) for compress in (False, True)]
+        print(f"{file_name:<28}{format_size(len(content)):>12}{format_size(len(gzip.compress(content, compresslevel=6))):>12}" + "".join(f"{seconds:9.2f}s" for seconds in times))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+import os
+import sys
+import types
+
+import pytest
+import ujson as json
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def data_folder(tmp_path, monkeypatch):
+    """Runs the test in an empty folder, the inventories read and write data/ relative to the working directory."""
+    (tmp_path / "data").mkdir()
+    monkeypatch.chdir(tmp_path)
+    return tmp_path / "data"
+
+
+SHEET_SETTINGS = {
+    "cost_for_laser": {"Nitrogen": 150, "CO2": 100},
+    "materials": ["Mild Steel"],
+    "thicknesses": ["16 Gauge", "10 Gauge"],
+    "pounds_per_square_foot": {"Mild Steel": {"16 Gauge": {"pounds_per_square_foot": 2.5, "latest_change": ""}, "10 Gauge": {"pounds_per_square_foot": 5.6, "latest_change": ""}}},
+    "price_per_pound": {"Mild Steel": {"price_per_pound": 1.2, "latest_change": ""}},
+    "cutting_methods": {material_id: {"name": material_id, "cut": "CO2"} for material_id in ("ST", "SS", "AL", "GALV", "GALN")},
+    "thickness_ids": {},
+}
+
+
+@pytest.fixture
+def inventories(data_folder):
+    from utils.components_inventory.components_inventory import ComponentsInventory
+    from utils.laser_cut_inventory.laser_cut_inventory import LaserCutInventory
+    from utils.paint_inventory.paint_inventory import PaintInventory
+    from utils.sheet_settings.sheet_settings import SheetSettings
+    from utils.sheets_inventory.sheets_inventory import SheetsInventory
+    from utils.workspace.workspace_settings import WorkspaceSettings
+
+    with open(data_folder / "sheet_settings.json", "w", encoding="utf-8") as file:
+        json.dump(SHEET_SETTINGS, file)
+    parent = types.SimpleNamespace(sheet_settings=SheetSettings())
+    parent.components_inventory = ComponentsInventory()
+    parent.paint_inventory = PaintInventory(parent)
+    parent.workspace_settings = WorkspaceSettings()
+    parent.laser_cut_inventory = LaserCutInventory(parent)
+    parent.sheets_inventory = SheetsInventory(parent)
+    return parent
@@ -0,0 +1,105 @@
+import copy
+import hashlib
+import os
+import threading
+
+import ujson as json
+from flask import Flask, Response, jsonify, request, send_file
+from werkzeug.serving import make_server
+
+
+def parse_pointer(path: str) -> list[str]:
+    return [token.replace("~1", "/").replace("~0", "~") for token in path.split("/")[1:]]
+
+
+def apply_json_patch(data: object, patch: list[dict[str, object]]) -> object:
+    """Applies the add, remove and replace operations make_json_patch uses, returns the patched copy of data."""
+    data = copy.deepcopy(data)
+    for operation in patch:
+        tokens = parse_pointer(operation["path"])
+        if not tokens:
+            data = copy.deepcopy(operation["value"])
+            continue
+        parent = data
+        for token in tokens[:-1]:
+            parent = parent[int(token) if isinstance(parent, list) else token]
+        key = int(tokens[-1]) if isinstance(parent, list) else tokens[-1]
+        if operation["op"] == "remove":
+            del parent[key]
+        else:
+            parent[key] = copy.deepcopy(operation["value"])
+    return data
+
+
+class StandInServer:
+    """Local stand-in for the inventory server's /file/, /upload and /upload_patch endpoints, serving the files in folder.
+
+    With send_etags it answers like the real server (ETag, Last-Modified and 304 through send_file),
+    without it every request gets a plain 200 without validators.
+    Files in failing_files get failure_status (500 unless changed), every request's path and headers are kept in requests.
+    Patches are applied when their base version is the file's SHA-256 and answered 409 otherwise,
+    patch_status other than 200 answers every patch with that instead (404 for a server without patch uploads).
+    """
+
+    def __init__(self, folder: str):
+        self.folder = folder
+        self.send_etags: bool = True
+        self.failing_files: set[str] = set()
+        self.failure_status: int = 500
+        self.patch_status: int = 200
+        self.requests: list[tuple[str, dict[str, str]]] = []
+        self.app = Flask(__name__)
+        self.app.add_url_rule("/file/<path:file_name>", view_func=self.get_file)
+        self.app.add_url_rule("/upload", view_func=self.upload, methods=["POST"])
+        self.app.add_url_rule("/upload_patch", view_func=self.upload_patch, methods=["POST"])
+        self.server = make_server("127.0.0.1", 0, self.app, threaded=True)
+        self.thread = threading.Thread(target=self.server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server.server_port}"
+
+    def start(self):
+        self.thread.start()
+
+    def stop(self):
+        self.server.shutdown()
+        self.thread.join()
+
+    def write_file(self, file_name: str, content: bytes):
+        with open(os.path.join(self.folder, file_name), "wb") as file:
+            file.write(content)
+
+    def read_file(self, file_name: str) -> bytes:
+        with open(os.path.join(self.folder, file_name), "rb") as file:
+            return file.read()
+
+    def get_file(self, file_name: str) -> Response:
+        self.requests.append((request.path, dict(request.headers)))
+        if file_name in self.failing_files:
+            return Response("Server Error", status=self.failure_status)
+        file_path = os.path.join(self.folder, file_name)
+        if not os.path.exists(file_path):
+            return Response("Not Found", status=404)
+        if self.send_etags:
+            return send_file(file_path, conditional=True, etag=True)
+        with open(file_path, "rb") as file:
+            return Response(file.read(), mimetype="application/json")
+
+    def upload(self) -> Response:
+        self.requests.append((request.path, dict(request.headers)))
+        file = request.files["file"]
+        self.write_file(os.path.basename(file.filename), file.read())
+        return Response("Upload successful", status=200)
+
+    def upload_patch(self) -> Response:
+        self.requests.append((request.path, dict(request.headers)))
+        if self.patch_status != 200:
+            return Response("Patch not applied", status=self.patch_status)
+        patch_upload = request.get_json()
+        content = self.read_file(patch_upload["filename"])
+        if hashlib.sha256(content).hexdigest() != patch_upload["base_version"]:
+            return Response("Base version out of date", status=409)
+        content = json.dumps(apply_json_patch(json.loads(content), patch_upload["patch"]), ensure_ascii=False).encode("utf-8")
+        self.write_file(patch_upload["filename"], content)
+        return jsonify({"version": hashlib.sha256(content).hexdigest()})
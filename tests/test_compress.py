@@ -0,0 +1,19 @@
+from utils.compress import backup_files, list_backups, read_manifest, restore_backup
+
+
+def test_backups_in_the_same_second_keep_their_own_manifest(data_folder):
+    inventory_path = "data/components_inventory.json"
+    with open(inventory_path, "w", encoding="utf-8") as file:
+        file.write('{"components": {"PN-100": {"quantity": 4}}}')
+    first_backup_name = backup_files([inventory_path])
+    with open(inventory_path, "w", encoding="utf-8") as file:
+        file.write('{"components": {"PN-100": {"quantity": 9}}}')
+    second_backup_name = backup_files([inventory_path])
+    third_backup_name = backup_files([inventory_path])
+
+    assert len({first_backup_name, second_backup_name, third_backup_name}) == 3
+    assert [backup["name"] for backup in list_backups()] == [third_backup_name, second_backup_name, first_backup_name]
+    assert read_manifest(third_backup_name)["files"] == read_manifest(second_backup_name)["files"]
+    restore_backup(first_backup_name)
+    with open(inventory_path, encoding="utf-8") as file:
+        assert file.read() == '{"components": {"PN-100": {"quantity": 4}}}'
@@ -0,0 +1,144 @@
+import os
+
+import pytest
+
+from tests.stand_in_server import StandInServer
+from utils.download_manifest import DownloadManifest
+from utils.file_downloader import FileDownloader
+from utils.server_client import ServerClient
+from utils.sync_base import SyncBase
+from utils.threads.download_thread import DownloadThread
+
+FILE_NAME = "components_inventory.json"
+
+
+@pytest.fixture
+def server(data_folder, tmp_path, monkeypatch):
+    server_folder = tmp_path / "server"
+    server_folder.mkdir()
+    server = StandInServer(str(server_folder))
+    server.write_file(FILE_NAME, b'{"components": {"Bolt": {"quantity": 1}}}')
+    server.start()
+    # Point the shared client at the stand-in without touching settings.json
+    monkeypatch.setattr(ServerClient(), "server_url", server.url)
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def manifest(data_folder) -> DownloadManifest:
+    return DownloadManifest(str(data_folder / "download_manifest.json"))
+
+
+def download(manifest: DownloadManifest):
+    return FileDownloader(manifest=manifest).download_files([(f"/file/{FILE_NAME}", f"data/{FILE_NAME}")])[0]
+
+
+def age_file(file_path: str) -> int:
+    """Moves the file's mtime into the past so a rewrite shows up, returns the new mtime."""
+    os.utime(file_path, ns=(1_000_000_000, 1_000_000_000))
+    return os.stat(file_path).st_mtime_ns
+
+
+def test_unchanged_file_gets_304_and_is_not_rewritten(server: StandInServer, manifest: DownloadManifest):
+    assert download(manifest).changed
+    modified_time = age_file(f"data/{FILE_NAME}")
+
+    result = download(manifest)
+
+    request_headers = server.requests[-1][1]
+    assert request_headers["If-None-Match"] == manifest.entries[f"data/{FILE_NAME}"]["etag"]
+    assert "If-Modified-Since" in request_headers
+    assert result.succeeded
+    assert result.status_code == 304
+    assert not result.changed
+    assert os.stat(f"data/{FILE_NAME}").st_mtime_ns == modified_time
+
+
+def test_changed_etag_downloads_the_new_version(server: StandInServer, manifest: DownloadManifest):
+    download(manifest)
+    old_entry = dict(manifest.entries[f"data/{FILE_NAME}"])
+    server.write_file(FILE_NAME, b'{"components": {"Bolt": {"quantity": 2}}}')
+
+    result = download(manifest)
+
+    assert server.requests[-1][1]["If-None-Match"] == old_entry["etag"]
+    assert result.status_code == 200
+    assert result.changed
+    with open(f"data/{FILE_NAME}", "rb") as file:
+        assert file.read() == b'{"components": {"Bolt": {"quantity": 2}}}'
+    assert manifest.entries[f"data/{FILE_NAME}"]["etag"] != old_entry["etag"]
+    assert manifest.entries[f"data/{FILE_NAME}"]["sha256"] == result.sha256 != old_entry["sha256"]
+
+
+def test_missing_etag_with_matching_sha256_is_not_rewritten(server: StandInServer, manifest: DownloadManifest):
+    server.send_etags = False
+    download(manifest)
+    assert manifest.entries[f"data/{FILE_NAME}"]["etag"] is None
+    modified_time = age_file(f"data/{FILE_NAME}")
+
+    result = download(manifest)
+
+    assert "If-None-Match" not in server.requests[-1][1]
+    assert result.status_code == 200
+    assert not result.changed
+    assert result.sha256 == manifest.entries[f"data/{FILE_NAME}"]["sha256"]
+    assert os.stat(f"data/{FILE_NAME}").st_mtime_ns == modified_time
+
+
+def test_failed_download_does_not_update_manifest(server: StandInServer, manifest: DownloadManifest):
+    download(manifest)
+    entry = dict(manifest.entries[f"data/{FILE_NAME}"])
+    server.write_file(FILE_NAME, b'{"components": {}}')
+    server.failing_files.add(FILE_NAME)
+
+    result = download(manifest)
+
+    assert not result.succeeded
+    assert result.status_code == 500
+    assert manifest.entries[f"data/{FILE_NAME}"] == entry
+    assert DownloadManifest(manifest.file_path).entries[f"data/{FILE_NAME}"] == entry
+    with open(f"data/{FILE_NAME}", "rb") as file:
+        assert file.read() == b'{"components": {"Bolt": {"quantity": 1}}}'
+    assert not os.path.exists(f"data/{FILE_NAME}.download")
+
+
+def test_locally_edited_file_is_downloaded_without_validators(server: StandInServer, manifest: DownloadManifest):
+    download(manifest)
+    with open(f"data/{FILE_NAME}", "wb") as file:
+        file.write(b'{"components": {}}')
+
+    result = download(manifest)
+
+    assert "If-None-Match" not in server.requests[-1][1]
+    assert result.changed
+    with open(f"data/{FILE_NAME}", "rb") as file:
+        assert file.read() == b'{"components": {"Bolt": {"quantity": 1}}}'
+
+
+def test_partly_failed_batch_still_reports_changed_files(server: StandInServer, manifest: DownloadManifest, monkeypatch):
+    server.write_file("sheets_inventory.json", b'{"sheets": {}}')
+    monkeypatch.setattr(DownloadThread, "manifest", manifest)
+    monkeypatch.setattr(SyncBase(), "bases", {})
+    download_thread = DownloadThread([FILE_NAME, "sheets_inventory.json"])
+    download(manifest)
+    sheets_entry = dict(manifest.entries.get("data/sheets_inventory.json", {}))
+    server.write_file(FILE_NAME, b'{"components": {"Bolt": {"quantity": 2}}}')
+    server.failing_files.add("sheets_inventory.json")
+    responses = []
+    download_thread.signal.connect(lambda response, files: responses.append(response))
+
+    download_thread.run()
+
+    assert responses == [
+        {
+            "status": "failed",
+            "successful_files": [FILE_NAME],
+            "changed_files": [FILE_NAME],
+            "failed_files": ["sheets_inventory.json"],
+        }
+    ]
+    assert manifest.entries.get("data/sheets_inventory.json", {}) == sheets_entry
+    assert not os.path.exists("data/sheets_inventory.json")
+    assert SyncBase().get_base(FILE_NAME)[1] == {"components": {"Bolt": {"quantity": 2}}}
+    assert SyncBase().get_base("sheets_inventory.json") is None
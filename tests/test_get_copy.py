@@ -0,0 +1,149 @@
+import pytest
+
+from utils.components_inventory.component import Component
+from utils.inventory.inventory import Inventory
+from utils.laser_cut_inventory.laser_cut_part import LaserCutPart
+from utils.sheets_inventory.sheet import Sheet
+
+ORDERS = [{"order_pending_quantity": 5, "order_pending_date": "2026-10-01", "expected_arrival_time": "2026-10-20", "notes": ""}]
+
+
+def get_index_state(inventory: Inventory) -> tuple:
+    """Everything the inventory indexes or totals, as plain values that later edits cannot change."""
+    item_indexes = [{key: list(items) for key, items in item_index.items.items()} for item_index in inventory.item_indexes]
+    category_items = {category: list(items.values()) for category, items in inventory.categories.category_items.items.items()}
+    stock_cost_totals = [(stock_cost_totals.total, dict(stock_cost_totals.category_totals), dict(stock_cost_totals.item_costs)) for stock_cost_totals in inventory.stock_cost_totals]
+    return item_indexes, category_items, stock_cost_totals
+
+
+@pytest.fixture
+def component(inventories) -> Component:
+    components_inventory = inventories.components_inventory
+    components_inventory.add_category("Hardware")
+    components_inventory.add_category("Electrical")
+    component = Component(
+        "PN-100",
+        {"part_name": "Bolt", "quantity": 10, "price": 2.5, "categories": ["Hardware"], "category_quantities": {"Hardware": 4}, "orders": ORDERS},
+        components_inventory,
+    )
+    components_inventory.add_component(component)
+    return component
+
+
+@pytest.fixture
+def laser_cut_part(inventories) -> LaserCutPart:
+    laser_cut_inventory = inventories.laser_cut_inventory
+    laser_cut_inventory.add_category("Brackets")
+    laser_cut_inventory.add_category("Panels")
+    laser_cut_part = LaserCutPart(
+        "Bracket",
+        {"quantity": 3, "price": 12.0, "categories": ["Brackets"], "category_quantities": {"Brackets": 2}, "bending_files": ["bracket.pdf"], "welding_files": [], "cnc_milling_files": []},
+        laser_cut_inventory,
+    )
+    laser_cut_inventory.add_laser_cut_part(laser_cut_part)
+    return laser_cut_part
+
+
+@pytest.fixture
+def sheet(inventories) -> Sheet:
+    sheets_inventory = inventories.sheets_inventory
+    sheets_inventory.add_category("Steel")
+    sheets_inventory.add_category("Offcuts")
+    sheet = Sheet("", {"quantity": 7, "thickness": "16 Gauge", "material": "Mild Steel", "categories": ["Steel"], "orders": ORDERS}, sheets_inventory)
+    sheets_inventory.add_sheet(sheet)
+    return sheet
+
+
+def test_component_copy_shares_inventory(component: Component):
+    component_copy = component.get_copy()
+
+    assert component_copy is not component
+    assert component_copy.inventory is component.inventory
+    assert component_copy.components_inventory is component.components_inventory
+    assert component_copy.categories == component.categories
+    assert all(copy_category is category for copy_category, category in zip(component_copy.categories, component.categories))
+
+
+def test_component_copy_owns_its_containers(component: Component):
+    component_copy = component.get_copy()
+
+    assert component_copy.categories is not component.categories
+    assert component_copy.category_quantities is not component.category_quantities
+    assert component_copy.orders is not component.orders
+    assert all(copy_order is not order for copy_order, order in zip(component_copy.orders, component.orders))
+
+
+def test_editing_component_copy_leaves_inventory_unchanged(component: Component):
+    components_inventory = component.components_inventory
+    index_state = get_index_state(components_inventory)
+    component_copy = component.get_copy()
+
+    component_copy.quantity = 500
+    component_copy.price = 99.0
+    component_copy.part_name = "Nut"
+    component_copy.name = "PN-200"
+    component_copy.add_to_category(components_inventory.get_category("Electrical"))
+    component_copy.remove_from_category(components_inventory.get_category("Hardware"))
+    component_copy.orders.clear()
+    component_copy.category_quantities.clear()
+
+    assert get_index_state(components_inventory) == index_state
+    assert components_inventory.get_component_by_name("PN-100") is component
+    assert components_inventory.get_component_by_name("PN-200") is None
+    assert component.quantity == 10
+    assert component.categories == [components_inventory.get_category("Hardware")]
+    assert len(component.orders) == 1
+    assert component.category_quantities == {components_inventory.get_category("Hardware"): 4}
+
+
+def test_laser_cut_part_copy_shares_inventory(laser_cut_part: LaserCutPart):
+    laser_cut_part_copy = laser_cut_part.get_copy()
+
+    assert laser_cut_part_copy.inventory is laser_cut_part.inventory
+    assert laser_cut_part_copy.laser_cut_inventory is laser_cut_part.laser_cut_inventory
+    assert laser_cut_part_copy.paint_inventory is laser_cut_part.paint_inventory
+    assert laser_cut_part_copy.workspace_settings is laser_cut_part.workspace_settings
+    assert laser_cut_part_copy.categories is not laser_cut_part.categories
+    assert laser_cut_part_copy.category_quantities is not laser_cut_part.category_quantities
+    assert laser_cut_part_copy.bending_files is not laser_cut_part.bending_files
+
+
+def test_editing_laser_cut_part_copy_leaves_inventory_unchanged(laser_cut_part: LaserCutPart):
+    laser_cut_inventory = laser_cut_part.laser_cut_inventory
+    index_state = get_index_state(laser_cut_inventory)
+    laser_cut_part_copy = laser_cut_part.get_copy()
+
+    laser_cut_part_copy.quantity = 40
+    laser_cut_part_copy.price = 1.0
+    laser_cut_part_copy.name = "Panel"
+    laser_cut_part_copy.add_to_category(laser_cut_inventory.get_category("Panels"))
+    laser_cut_part_copy.bending_files.append("panel.pdf")
+
+    assert get_index_state(laser_cut_inventory) == index_state
+    assert laser_cut_inventory.get_laser_cut_part_by_name("Bracket") is laser_cut_part
+    assert laser_cut_inventory.get_laser_cut_part_by_name("Panel") is None
+    assert laser_cut_part.bending_files == ["bracket.pdf"]
+
+
+def test_sheet_copy_shares_inventory(sheet: Sheet):
+    sheet_copy = sheet.get_copy()
+
+    assert sheet_copy.inventory is sheet.inventory
+    assert sheet_copy.sheets_inventory is sheet.sheets_inventory
+    assert sheet_copy.categories is not sheet.categories
+    assert sheet_copy.orders is not sheet.orders
+
+
+def test_editing_sheet_copy_leaves_inventory_unchanged(sheet: Sheet):
+    sheets_inventory = sheet.sheets_inventory
+    index_state = get_index_state(sheets_inventory)
+    sheet_copy = sheet.get_copy()
+
+    sheet_copy.quantity = 1
+    sheet_copy.thickness = "10 Gauge"
+    sheet_copy.add_to_category(sheets_inventory.get_category("Offcuts"))
+    sheet_copy.orders.clear()
+
+    assert get_index_state(sheets_inventory) == index_state
+    assert sheets_inventory.get_sheet_by_name(sheet.get_name()) is sheet
+    assert len(sheet.orders) == 1
@@ -0,0 +1,31 @@
+from datetime import datetime
+
+from openpyxl import Workbook
+
+from utils.history_file import HistoryFile
+
+
+def test_import_xlsx_writes_date_cells_as_text(data_folder):
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.title = "Categories"
+    sheet.append([datetime(2024, 5, 1, 9, 30), "Removed 2 from Brackets"])
+    sheet.append(["May 02 Thursday 2024", 42])
+    workbook.save(data_folder / "inventory history.xlsx")
+
+    history_file = HistoryFile()
+
+    assert history_file.get_entries("Categories") == [("2024-05-01 09:30:00", "Removed 2 from Brackets"), ("May 02 Thursday 2024", "42")]
+
+
+def test_index_is_built_on_first_use_and_follows_appends(data_folder):
+    HistoryFile().add_new_to_single_item("May 01 Wednesday 2024", "Bolt: 5 to 3")
+
+    history_file = HistoryFile()
+    assert history_file.indexed_size == 0
+    HistoryFile().add_new_to_category("May 02 Thursday 2024", "Brackets: added 4")
+
+    assert history_file.get_entry_count("Single Items") == 1
+    assert history_file.get_entries("Categories") == [("May 02 Thursday 2024", "Brackets: added 4")]
+    history_file.add_new_to_category("May 03 Friday 2024", "Brackets: removed 1")
+    assert history_file.get_entry_count("Categories") == 2
@@ -0,0 +1,40 @@
+import os
+
+import pytest
+import ujson as json
+
+from utils.json_file import JsonFile
+
+
+def read_file(data_folder) -> dict:
+    with open(data_folder / "workspace_settings.json", encoding="utf-8") as file:
+        return json.load(file)
+
+
+def test_transaction_writes_once_when_it_exits(data_folder, monkeypatch):
+    json_file = JsonFile("data/workspace_settings")
+    writes = []
+    original_replace = os.replace
+    monkeypatch.setattr("utils.json_file.os.replace", lambda source, destination: writes.append(destination) or original_replace(source, destination))
+
+    with json_file.transaction():
+        json_file.add_item("flow_tag_statuses", {})
+        for tag in ("Laser", "Bending", "Welding"):
+            json_file.add_item_in_object("flow_tag_statuses", tag)
+        assert read_file(data_folder) == {}
+
+    assert len(writes) == 1
+    assert read_file(data_folder) == {"flow_tag_statuses": {"Laser": {}, "Bending": {}, "Welding": {}}}
+
+
+def test_transaction_rolls_back_when_it_raises(data_folder):
+    json_file = JsonFile("data/workspace_settings")
+    json_file.add_item("all_tags", ["Laser"])
+
+    with pytest.raises(KeyError):
+        with json_file.transaction():
+            json_file.add_item("all_tags", ["Laser", "Bending"])
+            json_file.add_item_in_object("flow_tag_statuses", "Bending")
+
+    assert json_file.get_data() == {"all_tags": ["Laser"]}
+    assert read_file(data_folder) == {"all_tags": ["Laser"]}
@@ -0,0 +1,46 @@
+import ujson as json
+
+from tests.stand_in_server import apply_json_patch
+from utils.json_patch import make_json_patch
+
+
+def test_patch_turns_old_into_new():
+    old = {
+        "components": {"a/b": {"quantity": 1, "price": 2.5}, "~x": {"quantity": 3}, "~1": {"quantity": 4}},
+        "categories": ["Bolts", "Nuts"],
+        "tags": ["a", "b", "c"],
+        "flags": [True, 0, 1.0],
+    }
+    new = {
+        "components": {"a/b": {"quantity": 2, "price": 2.5}, "~1": {"quantity": 4, "notes": "new"}, "c/~d": {"quantity": 5}},
+        "categories": ["Bolts", "Washers"],
+        "tags": ["a"],
+        "flags": [1, False, 1],
+    }
+
+    patch = make_json_patch(old, new)
+
+    assert {"op": "replace", "path": "/components/a~1b/quantity", "value": 2} in patch
+    assert {"op": "remove", "path": "/components/~0x"} in patch
+    assert {"op": "add", "path": "/components/~01/notes", "value": "new"} in patch
+    assert {"op": "add", "path": "/components/c~1~0d", "value": {"quantity": 5}} in patch
+    assert json.dumps(apply_json_patch(old, patch), sort_keys=True) == json.dumps(new, sort_keys=True)
+
+
+def test_values_of_different_types_are_replaced():
+    old = {"quantity": 1, "enabled": True, "price": 1.0, "nested": {"count": 0}}
+    new = {"quantity": 1.0, "enabled": 1, "price": 1.0, "nested": {"count": False}}
+
+    patch = make_json_patch(old, new)
+
+    assert patch == [
+        {"op": "replace", "path": "/quantity", "value": 1.0},
+        {"op": "replace", "path": "/enabled", "value": 1},
+        {"op": "replace", "path": "/nested/count", "value": False},
+    ]
+    assert make_json_patch(new, new) == []
+
+
+def test_root_of_a_different_type_is_replaced_whole():
+    assert make_json_patch({"a": 1}, [1]) == [{"op": "replace", "path": "", "value": [1]}]
+    assert apply_json_patch({"a": 1}, make_json_patch({"a": 1}, [1])) == [1]
@@ -0,0 +1,72 @@
+import pytest
+import ujson as json
+
+from utils.storage import json_stream
+from utils.storage.json_stream import JsonObjectReader
+
+JOBS = {
+    "Job \"A\"": {"name": 'Quote "A" {draft}', "path": "C:\\jobs\\A\\", "tags": ["[x]", "}{", "\\"], "order_number": 12.5},
+    "Job\\B": {"assemblies": [{"name": "Frame", "sub_assemblies": [{"name": "Leg", "parts": [[1, 2], [3, {"x": []}]]}]}], "empty": {}},
+    "Job C": [],
+    "Job D": "plain \u00e9 \U0001f600 \\\" end",
+    "Job E": -1.25e-3,
+    "Job F": None,
+    "Job G": True,
+}
+
+
+@pytest.fixture(params=[True, False], ids=["escaped", "unescaped"])
+def jobs_file(tmp_path, request) -> str:
+    """With ensure_ascii every non-ASCII character is a \\u escape that can be cut in half by a chunk."""
+    file_path = tmp_path / "workspace.json"
+    with open(file_path, "w", encoding="utf-8") as file:
+        json.dump(JOBS, file, ensure_ascii=request.param, indent=4)
+    return str(file_path)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, 1 << 16])
+def test_items_match_the_whole_document(jobs_file: str, chunk_size: int, monkeypatch):
+    monkeypatch.setattr(JsonObjectReader, "CHUNK_SIZE", chunk_size)
+
+    assert dict(json_stream.iter_items(jobs_file)) == JOBS
+    assert list(key for key, _ in json_stream.iter_items(jobs_file)) == list(JOBS)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 1 << 16])
+def test_skipped_values_leave_the_reader_on_the_next_member(jobs_file: str, chunk_size: int, monkeypatch):
+    monkeypatch.setattr(JsonObjectReader, "CHUNK_SIZE", chunk_size)
+    decoded = {}
+
+    with JsonObjectReader(jobs_file) as reader:
+        for index, key in enumerate(reader.iter_members()):
+            if index % 2:
+                decoded[key] = reader.decode_value()
+
+    assert decoded == {key: value for index, (key, value) in enumerate(JOBS.items()) if index % 2}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 1 << 16])
+def test_nested_members_can_be_walked(tmp_path, chunk_size: int, monkeypatch):
+    monkeypatch.setattr(JsonObjectReader, "CHUNK_SIZE", chunk_size)
+    file_path = tmp_path / "nested.json"
+    file_path.write_text('{"a": {"b\\"}": {"c": 1}, "d": [2, "]"]}, "e": {}}', encoding="utf-8")
+    members = []
+
+    with JsonObjectReader(str(file_path)) as reader:
+        for key in reader.iter_members():
+            if key == "a":
+                members.extend((key, inner_key, reader.decode_value()) for inner_key in reader.iter_members())
+            else:
+                members.append((key, None, reader.decode_value()))
+
+    assert members == [("a", 'b"}', {"c": 1}), ("a", "d", [2, "]"]), ("e", None, {})]
+
+
+@pytest.mark.parametrize("content", ['{"a": 1', '{"a": "unterminated}', '{"a": {"b": [1, 2}', '{"a" 1}'])
+def test_truncated_or_broken_files_raise(tmp_path, content: str, monkeypatch):
+    monkeypatch.setattr(JsonObjectReader, "CHUNK_SIZE", 2)
+    file_path = tmp_path / "broken.json"
+    file_path.write_text(content, encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        dict(json_stream.iter_items(str(file_path)))
@@ -0,0 +1,50 @@
+import ujson as json
+
+from utils.laser_cut_inventory.laser_cut_inventory import LaserCutInventory, LaserCutPartRecord
+from utils.laser_cut_inventory.laser_cut_part import LaserCutPart
+
+
+def write_laser_cut_inventory(data_folder, part_count: int):
+    laser_cut_parts = {
+        f"Part {index}": {"categories": [f"Category {index % 3}"], "material": "Mild Steel", "machine_time": 2.0, "weight": 1.0, "price": 1.0, "quantity": 2}
+        for index in range(part_count)
+    }
+    with open(data_folder / "laser_cut_inventory.json", "w", encoding="utf-8") as file:
+        json.dump({"categories": ["Category 0", "Category 1", "Category 2"], "laser_cut_parts": laser_cut_parts, "recut_parts": {}}, file)
+
+
+def test_get_laser_cut_parts_by_category_only_loads_that_category(data_folder, inventories):
+    write_laser_cut_inventory(data_folder, 30)
+    laser_cut_inventory = LaserCutInventory(inventories)
+
+    laser_cut_parts = laser_cut_inventory.get_laser_cut_parts_by_category("Category 1")
+
+    assert [laser_cut_part.name for laser_cut_part in laser_cut_parts] == [f"Part {index}" for index in range(1, 30, 3)]
+    for index, entry in enumerate(laser_cut_inventory.laser_cut_part_entries):
+        assert isinstance(entry, LaserCutPart) == (index % 3 == 1)
+        assert entry.name == f"Part {index}"
+
+
+def test_loading_by_name_after_a_removal_finds_the_right_record(data_folder, inventories):
+    write_laser_cut_inventory(data_folder, 10)
+    laser_cut_inventory = LaserCutInventory(inventories)
+    laser_cut_inventory.get_laser_cut_part_by_name("Part 5")  # Positions are known from here on
+
+    laser_cut_inventory.remove_laser_cut_part(laser_cut_inventory.get_laser_cut_part_by_name("Part 2"))
+
+    assert laser_cut_inventory.get_laser_cut_part_by_name("Part 8").name == "Part 8"
+    assert [entry.name for entry in laser_cut_inventory.laser_cut_part_entries] == [f"Part {index}" for index in range(10) if index != 2]
+
+
+def test_update_prices_keeps_records_unloaded(data_folder, inventories):
+    write_laser_cut_inventory(data_folder, 6)
+    laser_cut_inventory = LaserCutInventory(inventories)
+    laser_cut_inventory.get_laser_cut_part_by_name("Part 0")
+
+    laser_cut_inventory.update_prices(lambda laser_cut_part: laser_cut_part.machine_time * 10 + laser_cut_part.weight)
+
+    assert all(entry.price == 21.0 for entry in laser_cut_inventory.laser_cut_part_entries)
+    assert sum(isinstance(entry, LaserCutPartRecord) for entry in laser_cut_inventory.laser_cut_part_entries) == 5
+    assert laser_cut_inventory.stock_costs.total == 6 * 21.0 * 2
+    laser_cut_inventory.save_now()
+    assert LaserCutInventory(inventories).get_laser_cut_part_by_name("Part 3").price == 21.0
@@ -0,0 +1,44 @@
+from utils.sheet_settings.collection import Collection
+from utils.sheet_settings.material import Material
+
+
+def count_rebuilds(collection: Collection, monkeypatch) -> list[None]:
+    rebuilds = []
+    rebuild = collection.items_by_name.rebuild
+    monkeypatch.setattr(collection.items_by_name, "rebuild", lambda: rebuilds.append(None) or rebuild())
+    return rebuilds
+
+
+def test_misses_on_an_up_to_date_index_do_not_rebuild(monkeypatch):
+    materials = Collection[Material]()
+    for name in ("Mild Steel", "304 SS", "Aluminium"):
+        materials.add_item(Material(name))
+    rebuilds = count_rebuilds(materials, monkeypatch)
+
+    assert materials.get("304 SS").name == "304 SS"
+    for _ in range(3):
+        assert materials.get("Galvanized") is None
+    assert len(rebuilds) == 1
+
+    materials.add_item(Material("Galvanized"))
+    assert materials.get("Galvanized").name == "Galvanized"
+    assert len(rebuilds) == 1
+
+
+def test_renames_and_removals_are_picked_up(monkeypatch):
+    materials = Collection[Material]()
+    first_steel, second_steel = Material("Mild Steel"), Material("Mild Steel")
+    materials.add_item(first_steel)
+    materials.add_item(second_steel)
+    materials.add_item(Material("Aluminium"))
+
+    materials.rename_item(materials.get("Aluminium"), "Aluminum")
+    assert materials.get("Aluminum").name == "Aluminum"
+    assert materials.get("Aluminium") is None
+
+    materials.remove_item(first_steel)
+    assert materials.get("Mild Steel") is second_steel
+
+    second_steel.name = "A36"  # Renamed without telling the collection
+    assert materials.get("Mild Steel") is None
+    assert materials.get("A36") is second_steel
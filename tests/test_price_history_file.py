@@ -0,0 +1,35 @@
+import threading
+
+from utils.price_history_file import PriceHistoryFile
+
+
+def test_reads_and_writes_from_several_threads(data_folder):
+    price_history_file = PriceHistoryFile("May 01 Wednesday 2024.xlsx")
+    errors: list[Exception] = []
+
+    def add_changes(thread_index: int):
+        try:
+            for index in range(250):
+                price_history_file.add_new("May 01 Wednesday 2024 09:30:00 AM", f"Part {index}", f"{thread_index}-{index}", 1.0, 2.0)
+                price_history_file.get_part_history(f"{thread_index}-{index}")
+        except Exception as error:
+            errors.append(error)
+
+    def read_changes():
+        try:
+            for _ in range(250):
+                price_history_file.get_changes(0, 50)
+                price_history_file.get_change_count()
+        except Exception as error:
+            errors.append(error)
+
+    threads = [threading.Thread(target=add_changes, args=(thread_index,)) for thread_index in range(4)] + [threading.Thread(target=read_changes) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert price_history_file.get_change_count() == 1000
+    assert price_history_file.get_part_history("3-249") == [("May 01 Wednesday 2024 09:30:00 AM", "Part 249", "3-249", 1.0, 2.0)]
+    price_history_file.close()
@@ -0,0 +1,35 @@
+import pytest
+
+from tests.stand_in_server import StandInServer
+from utils.server_client import ServerClient
+
+FILE_NAME = "version.json"
+
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    server = StandInServer(str(tmp_path))
+    server.write_file(FILE_NAME, b'{"version": "1.0"}')
+    server.failing_files.add(FILE_NAME)
+    server.failure_status = 503
+    server.start()
+    monkeypatch.setattr(ServerClient(), "server_url", server.url)
+    yield server
+    server.stop()
+
+
+def test_server_requests_are_retried(server):
+    response = ServerClient().get(f"/file/{FILE_NAME}")
+
+    assert response.status_code == 503
+    assert len(server.requests) == 1 + ServerClient.RETRY.status
+
+
+def test_absolute_urls_to_other_hosts_are_sent_once(server):
+    # Same stand-in under another host name, so it is not the inventory server as far as the client knows
+    external_url = server.url.replace("127.0.0.1", "localhost")
+
+    response = ServerClient().get(f"{external_url}/file/{FILE_NAME}")
+
+    assert response.status_code == 503
+    assert len(server.requests) == 1
@@ -0,0 +1,35 @@
+import ujson as json
+
+from utils import settings as settings_module
+from utils.settings import Settings
+
+
+def create_settings(tmp_path, monkeypatch) -> Settings:
+    """A Settings of its own in tmp_path, Settings() would hand back the process-wide one."""
+    monkeypatch.chdir(tmp_path)
+    settings = object.__new__(Settings)
+    settings.initialized = False
+    Settings.__init__(settings)
+    return settings
+
+
+def test_save_data_writes_a_snapshot_of_the_settings(tmp_path, monkeypatch):
+    settings = create_settings(tmp_path, monkeypatch)
+    settings.data["geometry"] = {"x": 200, "y": 200, "width": 1200, "height": 600}
+    settings.dirty = True
+    written_data = []
+    dump = settings_module.json.dump
+
+    def changing_dump(data, file, **kwargs):
+        written_data.append(data)
+        settings.data["geometry"]["width"] = 800  # The UI thread resizing the window mid write
+        dump(data, file, **kwargs)
+
+    monkeypatch.setattr(settings_module.json, "dump", changing_dump)
+    settings.flush()
+
+    assert written_data[0] is not settings.data
+    assert not settings.dirty
+    with open(tmp_path / "settings.json", encoding="utf-8") as file:
+        assert json.load(file)["geometry"]["width"] == 1200
+    assert settings.get_value("geometry")["width"] == 800
@@ -0,0 +1,70 @@
+import pytest
+import ujson as json
+
+from utils.components_inventory.components_inventory import ComponentsInventory
+from utils.laser_cut_inventory.laser_cut_inventory import LaserCutInventory
+from utils.sheets_inventory.sheets_inventory import SheetsInventory
+
+CATEGORIES = ["Category 0", "Category 1", "Category 2"]
+
+
+def write_inventory(data_folder, file_name: str, items_name: str, items: dict[str, dict], **data):
+    with open(data_folder / file_name, "w", encoding="utf-8") as file:
+        json.dump({"categories": CATEGORIES, items_name: items} | data, file)
+
+
+def assert_totals_match_loop(stock_costs, items: list, categories, get_stock_cost):
+    item_costs = [get_stock_cost(item) for item in items]
+    assert stock_costs.total == pytest.approx(sum(item_costs))
+    for category in categories:
+        assert stock_costs.get_category_total(category) == pytest.approx(sum(cost for item, cost in zip(items, item_costs) if category in item.categories))
+
+
+def test_components_stock_costs_match_per_item_costs(data_folder, inventories):
+    components = {
+        f"PN-{index}": {
+            "categories": [CATEGORIES[index % 3], CATEGORIES[(index + 1) % 3]] if index % 4 == 0 else [CATEGORIES[index % 3]],
+            "quantity": index - 5,  # Negative quantities count as no stock
+            "price": 0.1 * index,
+            "use_exchange_rate": index % 2 == 0,
+        }
+        for index in range(40)
+    }
+    write_inventory(data_folder, "components_inventory.json", "components", components)
+    components_inventory = ComponentsInventory()
+
+    stock_columns = components_inventory.get_stock_columns()
+
+    assert list(stock_columns.stock_costs) == pytest.approx([component.get_total_cost_in_stock() for component in components_inventory.components])
+    assert_totals_match_loop(components_inventory.stock_costs, components_inventory.components, components_inventory.get_categories(), lambda component: component.get_total_cost_in_stock())
+
+
+def test_laser_cut_stock_costs_match_per_part_costs(data_folder, inventories):
+    laser_cut_parts = {f"Part {index}": {"categories": [CATEGORIES[index % 3]], "price": 1.25 * index, "quantity": index % 7} for index in range(30)}
+    recut_parts = {f"Recut {index}": {"categories": ["Recut"], "price": 2.0, "quantity": index} for index in range(5)}
+    write_inventory(data_folder, "laser_cut_inventory.json", "laser_cut_parts", laser_cut_parts, recut_parts=recut_parts)
+    laser_cut_inventory = LaserCutInventory(inventories)
+    entries = laser_cut_inventory.laser_cut_part_entries
+
+    assert list(laser_cut_inventory.get_stock_columns().stock_costs) == pytest.approx([entry.price * entry.quantity for entry in entries])
+    assert_totals_match_loop(laser_cut_inventory.stock_costs, entries, laser_cut_inventory.get_categories(), lambda entry: entry.price * entry.quantity)
+    assert laser_cut_inventory.recut_stock_costs.total == pytest.approx(sum(2.0 * index for index in range(5)))
+
+
+def test_sheets_stock_costs_match_per_sheet_costs(data_folder, inventories):
+    sheets = {
+        f"Sheet {index}": {
+            "categories": [CATEGORIES[index % 3]],
+            "material": "Mild Steel",
+            "thickness": ["16 Gauge", "10 Gauge"][index % 2],
+            "length": 96.0 + index,
+            "width": 48.0,
+            "quantity": index,
+        }
+        for index in range(20)
+    }
+    write_inventory(data_folder, "sheets_inventory.json", "sheets", sheets)
+    sheets_inventory = SheetsInventory(inventories)
+
+    assert list(sheets_inventory.get_stock_columns().stock_costs) == pytest.approx([sheets_inventory.get_sheet_cost(sheet) * sheet.quantity for sheet in sheets_inventory.sheets])
+    assert_totals_match_loop(sheets_inventory.get_stock_costs(), sheets_inventory.sheets, sheets_inventory.get_categories(), lambda sheet: sheets_inventory.get_sheet_cost(sheet) * sheet.quantity)
@@ -0,0 +1,43 @@
+from utils.inventory.category import Category
+from utils.inventory.stock_cost_totals import StockCostTotals
+
+
+class Item:
+    def __init__(self, categories: list[Category], stock_cost: float):
+        self.categories = categories
+        self.stock_cost = stock_cost
+
+
+def test_group_totals_keep_only_the_most_recently_read_groups():
+    categories = [Category(f"Category {index}") for index in range(StockCostTotals.MAX_GROUP_TOTALS + 2)]
+    items = [Item([category], 10.0) for category in categories]
+    stock_cost_totals = StockCostTotals(lambda item: item.stock_cost)
+    stock_cost_totals.rebuild(items)
+
+    for category in categories:
+        assert stock_cost_totals.get_group_total([category, categories[0]]) == (10.0 if category is categories[0] else 20.0)
+        stock_cost_totals.get_group_total([categories[0]])  # Read every time, so it is never the least recent
+
+    assert len(stock_cost_totals.group_totals) == StockCostTotals.MAX_GROUP_TOTALS
+    assert frozenset([categories[0]]) in stock_cost_totals.group_totals
+    assert frozenset([categories[1], categories[0]]) not in stock_cost_totals.group_totals
+
+
+def test_group_totals_follow_changes_and_are_recomputed_after_eviction():
+    categories = [Category(f"Category {index}") for index in range(StockCostTotals.MAX_GROUP_TOTALS + 1)]
+    item = Item([categories[0]], 5.0)
+    stock_cost_totals = StockCostTotals(lambda item: item.stock_cost)
+    stock_cost_totals.add(item)
+    assert stock_cost_totals.get_group_total(categories[:2]) == 5.0
+
+    item.stock_cost = 7.5
+    stock_cost_totals.update(item)
+    assert stock_cost_totals.get_group_total(categories[:2]) == 7.5
+
+    for category in categories[1:]:
+        stock_cost_totals.get_group_total([category])
+    item.categories = [categories[1]]
+    stock_cost_totals.update(item)
+    assert frozenset(categories[:2]) not in stock_cost_totals.group_totals
+    assert stock_cost_totals.get_group_total(categories[:2]) == 7.5
+    assert stock_cost_totals.get_group_total([categories[0]]) == 0.0
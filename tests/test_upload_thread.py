@@ -0,0 +1,80 @@
+import pytest
+import ujson as json
+
+from tests.stand_in_server import StandInServer
+from utils.server_client import ServerClient
+from utils.sync_base import SyncBase
+from utils.threads.upload_thread import UploadThread
+
+FILE_NAME = "components_inventory.json"
+COMPONENTS = {"components": {f"PN-{index}": {"quantity": index, "price": 1.5, "notes": "Stocked in the back room"} for index in range(100)}}
+
+
+@pytest.fixture
+def server(data_folder, tmp_path, monkeypatch):
+    server_folder = tmp_path / "server"
+    server_folder.mkdir()
+    server = StandInServer(str(server_folder))
+    content = json.dumps(COMPONENTS).encode("utf-8")
+    server.write_file(FILE_NAME, content)
+    server.start()
+    monkeypatch.setattr(ServerClient(), "server_url", server.url)
+    monkeypatch.setattr(ServerClient(), "request_compression_supported", False)
+    monkeypatch.setattr(UploadThread, "patch_uploads_supported", True)
+    # The client last downloaded what the server has now
+    monkeypatch.setattr(SyncBase(), "bases", {})
+    SyncBase().set_base_content(FILE_NAME, content)
+    yield server
+    server.stop()
+
+
+def edit_components(quantity: int) -> bytes:
+    components = json.loads(json.dumps(COMPONENTS))
+    components["components"]["PN-1"]["quantity"] = quantity
+    content = json.dumps(components).encode("utf-8")
+    with open(f"data/{FILE_NAME}", "wb") as file:
+        file.write(content)
+    return content
+
+
+def upload() -> list[dict]:
+    responses = []
+    upload_thread = UploadThread([FILE_NAME])
+    upload_thread.signal.connect(lambda response, files: responses.append(response))
+    upload_thread.run()
+    return responses
+
+
+def test_changes_are_uploaded_as_a_patch(server: StandInServer):
+    content = edit_components(7)
+
+    assert upload() == [{"status": "success", "successful_files": [FILE_NAME]}]
+    assert [path for path, _ in server.requests] == ["/upload_patch"]
+    assert server.read_file(FILE_NAME) == content
+    assert SyncBase().get_base_version(FILE_NAME) == SyncBase.get_version(content)
+
+
+def test_conflicting_patch_falls_back_to_a_full_upload(server: StandInServer):
+    # Someone else uploaded since the client's last download
+    server.write_file(FILE_NAME, json.dumps({"components": {}}).encode("utf-8"))
+    content = edit_components(7)
+
+    assert upload() == [{"status": "success", "successful_files": [FILE_NAME]}]
+    assert [path for path, _ in server.requests] == ["/upload_patch", "/upload"]
+    assert server.read_file(FILE_NAME) == content
+    assert SyncBase().get_base_version(FILE_NAME) == SyncBase.get_version(content)
+    assert UploadThread.patch_uploads_supported
+
+
+@pytest.mark.parametrize("patch_status", [404, 405])
+def test_server_without_patch_uploads_gets_full_uploads(server: StandInServer, patch_status: int):
+    server.patch_status = patch_status
+    edit_components(7)
+
+    assert upload() == [{"status": "success", "successful_files": [FILE_NAME]}]
+    assert not UploadThread.patch_uploads_supported
+    content = edit_components(8)
+    upload()
+
+    assert [path for path, _ in server.requests] == ["/upload_patch", "/upload", "/upload"]
+    assert server.read_file(FILE_NAME) == content
@@ -34,19 +34,17 @@ class AddLaserCutPartDialog(QDialog):
         self.pushButton_cancel.clicked.connect(self.reject)
 
     def selection_changed(self):
-        for laser_cut_part in self.laser_cut_inventory.laser_cut_parts:
-            if laser_cut_part.name == self.listWidget_laser_cut_parts.currentItem().text():
-                self.comboBox_name.lineEdit().blockSignals(True)
-                self.comboBox_name.setCurrentText(laser_cut_part.name)
-                self.comboBox_name.lineEdit().blockSignals(False)
-                self.label_laser_cut_part_status.setStyleSheet("color: #4EE753;")
-                self.label_laser_cut_part_status.setText(" * Laser Cut Part exists in inventory.")
-                self.selected_laser_cut_part = laser_cut_part
-                return
-            else:
-                self.label_laser_cut_part_status.setStyleSheet("color: #E74E4E;")
-                self.label_laser_cut_part_status.setText(" * Laser Cut Part does NOT exists in inventory.")
-                self.selected_laser_cut_part = None
+        if laser_cut_part := self.laser_cut_inventory.get_laser_cut_part_by_name(self.listWidget_laser_cut_parts.currentItem().text()):
+            self.comboBox_name.lineEdit().blockSignals(True)
+            self.comboBox_name.setCurrentText(laser_cut_part.name)
+            self.comboBox_name.lineEdit().blockSignals(False)
+            self.label_laser_cut_part_status.setStyleSheet("color: #4EE753;")
+            self.label_laser_cut_part_status.setText(" * Laser Cut Part exists in inventory.")
+            self.selected_laser_cut_part = laser_cut_part
+        else:
+            self.label_laser_cut_part_status.setStyleSheet("color: #E74E4E;")
+            self.label_laser_cut_part_status.setText(" * Laser Cut Part does NOT exists in inventory.")
+            self.selected_laser_cut_part = None
 
     def get_laser_cut_part_row(self, laser_cut_part_name: str) -> int:
         return next(
@@ -55,19 +53,17 @@ class AddLaserCutPartDialog(QDialog):
         )
 
     def name_changed(self) -> None:
-        for laser_cut_part in self.laser_cut_inventory.laser_cut_parts:
-            if laser_cut_part.name == self.comboBox_name.currentText():
-                self.listWidget_laser_cut_parts.blockSignals(True)
-                self.listWidget_laser_cut_parts.setCurrentRow(self.get_laser_cut_part_row(laser_cut_part.name))
-                self.listWidget_laser_cut_parts.blockSignals(False)
-                self.label_laser_cut_part_status.setStyleSheet("color: #4EE753;")
-                self.label_laser_cut_part_status.setText(" * Laser Cut Part exists in inventory.")
-                self.selected_laser_cut_part = laser_cut_part
-                return
-            else:
-                self.label_laser_cut_part_status.setStyleSheet("color: #E74E4E;")
-                self.label_laser_cut_part_status.setText(" * Laser Cut Part does NOT exists in inventory.")
-                self.selected_laser_cut_part = None
+        if laser_cut_part := self.laser_cut_inventory.get_laser_cut_part_by_name(self.comboBox_name.currentText()):
+            self.listWidget_laser_cut_parts.blockSignals(True)
+            self.listWidget_laser_cut_parts.setCurrentRow(self.get_laser_cut_part_row(laser_cut_part.name))
+            self.listWidget_laser_cut_parts.blockSignals(False)
+            self.label_laser_cut_part_status.setStyleSheet("color: #4EE753;")
+            self.label_laser_cut_part_status.setText(" * Laser Cut Part exists in inventory.")
+            self.selected_laser_cut_part = laser_cut_part
+        else:
+            self.label_laser_cut_part_status.setStyleSheet("color: #E74E4E;")
+            self.label_laser_cut_part_status.setText(" * Laser Cut Part does NOT exists in inventory.")
+            self.selected_laser_cut_part = None
 
     def get_name(self) -> str:
         return self.comboBox_name.currentText().encode("ascii", "ignore").decode()
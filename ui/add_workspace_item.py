@@ -47,11 +47,9 @@ class AddWorkspaceItem(QDialog):
         self.lineEdit_name.setText(self.listWidget_all_items.currentItem().text())
         self.thickness = ""
         self.material = ""
-        for laser_cut_part in self.laser_cut_inventory.laser_cut_parts:
-            if laser_cut_part.name == self.lineEdit_name.text():
-                self.thickness = laser_cut_part.gauge
-                self.material = laser_cut_part.material
-                break
+        if laser_cut_part := self.laser_cut_inventory.get_laser_cut_part_by_name(self.lineEdit_name.text()):
+            self.thickness = laser_cut_part.gauge
+            self.material = laser_cut_part.material
 
     def name_changed(self) -> None:
         all_part_names = natsorted(self.get_all_part_names())
@@ -31,7 +31,6 @@ from ui.update_component_order_pending_dialog import \
 from utils.components_inventory.component import Component
 from utils.components_inventory.components_inventory import ComponentsInventory
 from utils.dialog_buttons import DialogButtons
-from utils.history_file import HistoryFile
 from utils.inventory.category import Category
 from utils.inventory.order import Order
 from utils.po import get_all_po
@@ -825,7 +824,7 @@ class ComponentsTab(QWidget):
         self.label_total_unit_cost.setText(f"Total Unit Cost: ${total_unit_cost:,.2f}")
 
     def update_category_total_stock_costs(self) -> None:
-        total_stock_costs = {category.name: self.components_inventory.get_total_category_cost_in_stock(category) for category in self.components_inventory.get_categories()}
+        total_stock_costs = {category.name: stock_cost for category, stock_cost in self.components_inventory.get_category_stock_costs().items()}
         total_stock_costs["Polar Total Stock Cost"] = self.components_inventory.get_total_stock_cost_for_similar_categories("Polar")
         total_stock_costs["BL Total Stock Cost"] = self.components_inventory.get_total_stock_cost_for_similar_categories("BL")
 
@@ -880,7 +879,7 @@ class ComponentsTab(QWidget):
         if dialog.exec():
             multiplier: int = dialog.get_multiplier()
             option = dialog.get_option()
-            history_file = HistoryFile()
+            history_file = self.parent.history_file
             if option == "Category":
                 self.category_tables[self.category].blockSignals(True)
                 for component, tables_item in self.table_components_widgets.items():
@@ -527,7 +527,7 @@ QPushButton:checked:pressed#assembly_button_drop_menu {
     def delete_selected_components(self):
         if selected_components := self.get_selected_components():
             for component in selected_components:
-                self.assembly.components.remove(component)
+                self.assembly.remove_component(component)
         self.changes_made()
         self.load_components_table()
 
@@ -800,7 +800,7 @@ QPushButton:checked:pressed#assembly_button_drop_menu {
     def delete_selected_laser_cut_parts(self):
         if selected_laser_cut_parts := self.get_selected_laser_cut_parts():
             for laser_cut_part in selected_laser_cut_parts:
-                self.assembly.laser_cut_parts.remove(laser_cut_part)
+                self.assembly.remove_laser_cut_part(laser_cut_part)
         self.changes_made()
         self.load_laser_cut_parts_table()
 
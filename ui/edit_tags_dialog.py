@@ -61,9 +61,10 @@ class EditTagsDialog(QDialog):
             self.load_done = True
         workspace_tags.load_data()
         if not workspace_tags.get_data()["flow_tag_statuses"]:
-            workspace_tags.add_item("flow_tag_statuses", {})
-            for tag in workspace_tags.get_value("all_tags"):
-                workspace_tags.add_item_in_object("flow_tag_statuses", tag)
+            with workspace_tags.transaction():
+                workspace_tags.add_item("flow_tag_statuses", {})
+                for tag in workspace_tags.get_value("all_tags"):
+                    workspace_tags.add_item_in_object("flow_tag_statuses", tag)
         self.listWidget_selected_flow_tag.addItems(workspace_tags.get_value("all_tags"))
         self.listWidget_selected_flow_tag.currentItemChanged.connect(self.load_statuses)
         self.pushButton_add_status.clicked.connect(self.add_new_status)
@@ -297,23 +298,23 @@ class EditTagsDialog(QDialog):
                 tag_box.setCurrentText(current_text)
                 tag_box.editTextChanged.connect(self.save_flow_tags)
                 used_tags.append(current_text)
-        workspace_tags.add_item("flow_tags", grouped_flow_tags)
-        workspace_tags.add_item("all_tags", list(all_flow_tags))
-        data = workspace_tags.get_data()
-        data.setdefault("attributes", {})
-
-        # Initialize flow_tag_statuses and is_timer_enabled for new tags
-        for tag in all_flow_tags:
-            data.setdefault("flow_tag_statuses", {}).setdefault(tag, {})
-            data.setdefault("attributes", {}).setdefault(tag, {}).setdefault("show_all_items", False)
-            data.setdefault("attributes", {}).setdefault(tag, {}).setdefault("is_timer_enabled", False)
-            data.setdefault("attributes", {}).setdefault(tag, {}).setdefault("next_flow_tag_message", f"Next Flow Tag: {tag}")
-
-        # Remove flow_tag_statuses and is_timer_enabled for tags not in all_flow_tags
-        data["flow_tag_statuses"] = {tag: data["flow_tag_statuses"][tag] for tag in all_flow_tags if tag in data["flow_tag_statuses"]}
-        data["attributes"] = {tag: data["attributes"][tag] for tag in all_flow_tags if tag in data["attributes"]}
-
-        workspace_tags.save_data(data)
+        # Written once when the block exits, get_data() is the same dict the add_item() calls change
+        with workspace_tags.transaction():
+            workspace_tags.add_item("flow_tags", grouped_flow_tags)
+            workspace_tags.add_item("all_tags", list(all_flow_tags))
+            data = workspace_tags.get_data()
+            data.setdefault("attributes", {})
+
+            # Initialize flow_tag_statuses and is_timer_enabled for new tags
+            for tag in all_flow_tags:
+                data.setdefault("flow_tag_statuses", {}).setdefault(tag, {})
+                data.setdefault("attributes", {}).setdefault(tag, {}).setdefault("show_all_items", False)
+                data.setdefault("attributes", {}).setdefault(tag, {}).setdefault("is_timer_enabled", False)
+                data.setdefault("attributes", {}).setdefault(tag, {}).setdefault("next_flow_tag_message", f"Next Flow Tag: {tag}")
+
+            # Remove flow_tag_statuses and is_timer_enabled for tags not in all_flow_tags
+            data["flow_tag_statuses"] = {tag: data["flow_tag_statuses"][tag] for tag in all_flow_tags if tag in data["flow_tag_statuses"]}
+            data["attributes"] = {tag: data["attributes"][tag] for tag in all_flow_tags if tag in data["attributes"]}
         self.listWidget_selected_flow_tag.disconnect()
         self.listWidget_selected_flow_tag.clear()
         self.listWidget_selected_flow_tag.addItems(workspace_tags.get_value("all_tags"))
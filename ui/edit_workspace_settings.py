@@ -371,7 +371,7 @@ class EditWorkspaceSettings(QDialog):
         self.flow_tag_tables.update({flow_tag_group: table_widget})
 
     def rename_group(self, flow_tag_group: FlowTags, input_box: QLineEdit):
-        flow_tag_group.name = input_box.text()
+        self.workspace_settings.rename_group(flow_tag_group, input_box.text())
 
     def delete_group(self, flow_tag_group: FlowTags):
         self.clear_layout(self.flow_tag_tables[flow_tag_group])
@@ -444,7 +444,7 @@ class EditWorkspaceSettings(QDialog):
                 msg.setText(f"{new_name} cannot be used as a tag.")
                 msg.exec()
                 return
-            current_tag.name = new_name
+            self.workspace_settings.rename_tag(current_tag, new_name)
         self.load_tags()
 
     def get_selected_tag(self) -> Tag:
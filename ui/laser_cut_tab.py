@@ -865,10 +865,12 @@ class LaserCutTab(QWidget):
         self.update_laser_cut_prices()
 
     def update_all_laser_cut_parts_costs(self):
-        for laser_cut_part in self.laser_cut_inventory.laser_cut_parts:
+        def get_price(laser_cut_part: LaserCutPart) -> float:
             price_per_pound: float = self.sheet_settings.get_price_per_pound(laser_cut_part.material)
             cost_for_laser: float = self.sheet_settings.get_cost_for_laser(laser_cut_part.material)
-            laser_cut_part.price = float((laser_cut_part.machine_time * (cost_for_laser / 60)) + (laser_cut_part.weight * price_per_pound))
+            return float((laser_cut_part.machine_time * (cost_for_laser / 60)) + (laser_cut_part.weight * price_per_pound))
+
+        self.laser_cut_inventory.update_prices(get_price)
         self.laser_cut_inventory.save()
         self.sync_changes()
 
@@ -880,7 +882,7 @@ class LaserCutTab(QWidget):
         self.category_tables[self.category].blockSignals(False)
 
     def update_category_total_stock_costs(self) -> None:
-        summary: dict[str, float] = {category.name: self.laser_cut_inventory.get_category_parts_total_stock_cost(category) for category in self.laser_cut_inventory.get_categories()} | {"Recut": self.laser_cut_inventory.get_recut_parts_total_stock_cost()}
+        summary: dict[str, float] = {category.name: stock_cost for category, stock_cost in self.laser_cut_inventory.get_category_stock_costs().items()} | {"Recut": self.laser_cut_inventory.get_recut_parts_total_stock_cost()}
         summary = dict(natsorted(summary.items()))
 
         self.clear_layout(self.gridLayout_laser_cut_parts_summary)
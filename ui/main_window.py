@@ -23,7 +23,8 @@ from PyQt6.QtWidgets import (QApplication, QComboBox, QCompleter, QFileDialog,
                              QFileIconProvider, QFontDialog, QGridLayout,
                              QInputDialog, QLabel, QListWidget,
                              QListWidgetItem, QMainWindow, QMenu, QMessageBox,
-                             QPushButton, QScrollArea, QTableWidgetItem,
+                             QPushButton, QScrollArea, QTableWidget,
+                             QTableWidgetItem,
                              QTabWidget, QToolBox, QTreeView, QTreeWidget,
                              QVBoxLayout, QWidget)
 
@@ -49,6 +50,7 @@ from ui.sheet_settings_tab import SheetSettingsTab
 from ui.sheets_in_inventory_tab import SheetsInInventoryTab
 from ui.workspace_tab import WorkspaceTab
 from utils.components_inventory.components_inventory import ComponentsInventory
+from utils.compress import backup_files, list_backups, restore_backup
 from utils.dialog_buttons import DialogButtons
 from utils.dialog_icons import Icons
 from utils.history_file import HistoryFile
@@ -65,6 +67,7 @@ from utils.price_history_file import PriceHistoryFile
 from utils.quote.generate_printout import GeneratePrintout
 from utils.quote.quote import Quote
 from utils.quote.nest import Nest
+from utils.save_scheduler import SaveScheduler
 from utils.settings import Settings
 from utils.sheet_settings.sheet_settings import SheetSettings
 from utils.sheets_inventory.sheet import Sheet
@@ -184,6 +187,8 @@ sys.excepthook = excepthook
 
 
 class MainWindow(QMainWindow):
+    HISTORY_PAGE_SIZE: int = 500
+
     def __init__(self):
         super(MainWindow, self).__init__()
         uic.loadUi("ui/main_window.ui", self)
@@ -202,6 +207,10 @@ class MainWindow(QMainWindow):
         self.laser_cut_inventory = LaserCutInventory(self)
         self.job_manager = JobManager(self)
 
+        self.save_scheduler = SaveScheduler(self, self.upload_file)
+        for inventory in (self.components_inventory, self.sheets_inventory, self.paint_inventory, self.laser_cut_inventory):
+            inventory.save_scheduler = self.save_scheduler
+
         self.quote_generator_tab_widget = QuoteGeneratorTab(self)
         self.quote_generator_tab_widget.add_quote(Quote("Quote0", None, self.components_inventory, self.laser_cut_inventory, self.sheet_settings))
         self.quote_generator_tab_widget.save_quote.connect(self.save_quote)
@@ -245,9 +254,22 @@ class MainWindow(QMainWindow):
         history_file_date = datetime.strptime(self.settings_file.get_value("price_history_file_name"), "%B %d %A %Y")
         days_from_last_price_history_assessment: int = int((datetime.now() - history_file_date).total_seconds() / 60 / 60 / 24)
         if days_from_last_price_history_assessment > self.settings_file.get_value("days_until_new_price_history_assessment"):
+            finished_price_history_file = PriceHistoryFile(file_name=f"{self.settings_file.get_value('price_history_file_name')}.xlsx")
+            finished_price_history_file.export_xlsx()
+            finished_price_history_file.close()
             self.settings_file.set_value("price_history_file_name", str(datetime.now().strftime("%B %d %A %Y")))
+            self.price_history_file = PriceHistoryFile(file_name=f"{self.settings_file.get_value('price_history_file_name')}.xlsx")
+            self.price_history_file.export_xlsx()
             msg = QMessageBox(QMessageBox.Icon.Information, "Price Assessment", f"It has been {self.settings_file.get_value('days_until_new_price_history_assessment')} days until the last price assessment. A new price history file has been created in the 'Price History Files' directory.")
             msg.exec()
+        else:
+            self.price_history_file = PriceHistoryFile(file_name=f"{self.settings_file.get_value('price_history_file_name')}.xlsx")
+
+        # Shared with the tabs that log quantity changes, so the log is only indexed once
+        self.history_file = HistoryFile()
+        self.categoryHistoryTable.verticalScrollBar().valueChanged.connect(partial(self.history_table_scrolled, self.categoryHistoryTable, "Categories"))
+        self.singleItemHistoryTable.verticalScrollBar().valueChanged.connect(partial(self.history_table_scrolled, self.singleItemHistoryTable, "Single Items"))
+        self.priceHistoryTable.verticalScrollBar().valueChanged.connect(self.price_history_table_scrolled)
 
         # VARIABLES
         self.category: Category = None
@@ -438,6 +460,8 @@ class MainWindow(QMainWindow):
         # FILE
 
         self.actionOpen_Item_History.triggered.connect(self.open_item_history)
+        self.actionBackup.triggered.connect(self.backup_database)
+        self.actionLoad_Backup.triggered.connect(self.load_backup)
 
         self.actionExit.triggered.connect(self.close)
         # self.actionExit.setIcon(QIcon("icons/tab_close.png"))
@@ -997,60 +1021,47 @@ class MainWindow(QMainWindow):
 
     # * \/ Load UI \/
     def load_history_view(self) -> None:
-        # CATEOGRY HISTORY
-        self.categoryHistoryTable.clear()
-        self.categoryHistoryTable.setRowCount(0)
-        self.categoryHistoryTable.setHorizontalHeaderLabels(("Date;Description;").split(";"))
-        self.categoryHistoryTable.setColumnWidth(0, 270)
-        self.categoryHistoryTable.setColumnWidth(1, 600)
-        history_file = HistoryFile()
-        for i, date, description in zip(
-            range(len(history_file.get_data_from_category()["Date"])),
-            history_file.get_data_from_category()["Date"],
-            history_file.get_data_from_category()["Description"],
-        ):
-            self.categoryHistoryTable.insertRow(self.categoryHistoryTable.rowCount())
-            self.categoryHistoryTable.setItem(i, 0, QTableWidgetItem(date))
-            self.categoryHistoryTable.setItem(i, 1, QTableWidgetItem(description))
-        # SINGLE ITEM HISTORY
-        self.singleItemHistoryTable.clear()
-        self.singleItemHistoryTable.setRowCount(0)
-        self.singleItemHistoryTable.setHorizontalHeaderLabels(("Date;Description;").split(";"))
-        self.singleItemHistoryTable.setColumnWidth(0, 270)
-        self.singleItemHistoryTable.setColumnWidth(1, 600)
-        for i, date, description in zip(
-            range(len(history_file.get_data_from_single_item()["Date"])),
-            history_file.get_data_from_single_item()["Date"],
-            history_file.get_data_from_single_item()["Description"],
-        ):
-            self.singleItemHistoryTable.insertRow(self.singleItemHistoryTable.rowCount())
-            self.singleItemHistoryTable.setItem(i, 0, QTableWidgetItem(date))
-            self.singleItemHistoryTable.setItem(i, 1, QTableWidgetItem(description))
+        for history_table in (self.categoryHistoryTable, self.singleItemHistoryTable):
+            history_table.clear()
+            history_table.setRowCount(0)
+            history_table.setHorizontalHeaderLabels(("Date;Description;").split(";"))
+            history_table.setColumnWidth(0, 270)
+            history_table.setColumnWidth(1, 600)
+        self.load_history_page(self.categoryHistoryTable, "Categories")
+        self.load_history_page(self.singleItemHistoryTable, "Single Items")
+
+    def load_history_page(self, history_table: QTableWidget, sheet: str) -> None:
+        # Only HISTORY_PAGE_SIZE rows are added at a time, the next page is loaded once the table is scrolled to the bottom
+        row_count = history_table.rowCount()
+        entries = self.history_file.get_entries(sheet, row_count, self.HISTORY_PAGE_SIZE)
+        history_table.setRowCount(row_count + len(entries))
+        for i, (date, description) in enumerate(entries, start=row_count):
+            history_table.setItem(i, 0, QTableWidgetItem(date))
+            history_table.setItem(i, 1, QTableWidgetItem(description))
+
+    def history_table_scrolled(self, history_table: QTableWidget, sheet: str, value: int) -> None:
+        if value == history_table.verticalScrollBar().maximum():
+            self.load_history_page(history_table, sheet)
 
     def load_price_history_view(self) -> None:
-        # CATEOGRY HISTORY
         self.priceHistoryTable.clear()
         self.priceHistoryTable.setRowCount(0)
         self.priceHistoryTable.setHorizontalHeaderLabels(("Date;Part Name;Part #;Old Price;New Price").split(";"))
         self.priceHistoryTable.setColumnWidth(0, 270)
         self.priceHistoryTable.setColumnWidth(1, 600)
-        price_history_file = PriceHistoryFile(file_name=f"{self.settings_file.get_value(setting_name='price_history_file_name')}.xlsx")
-        for i, date, part_name, part_number, old_price, new_price in zip(
-            range(len(price_history_file.get_data_from_category()["Date"])),
-            price_history_file.get_data_from_category()["Date"],
-            price_history_file.get_data_from_category()["Part Name"],
-            price_history_file.get_data_from_category()["Part Number"],
-            price_history_file.get_data_from_category()["Old Price"],
-            price_history_file.get_data_from_category()["New Price"],
-        ):
-            if i == 0:
-                continue
-            self.priceHistoryTable.insertRow(self.priceHistoryTable.rowCount())
-            self.priceHistoryTable.setItem(i - 1, 0, QTableWidgetItem(str(date)))
-            self.priceHistoryTable.setItem(i - 1, 1, QTableWidgetItem(str(part_name)))
-            self.priceHistoryTable.setItem(i - 1, 2, QTableWidgetItem(str(part_number)))
-            self.priceHistoryTable.setItem(i - 1, 3, QTableWidgetItem(str(old_price)))
-            self.priceHistoryTable.setItem(i - 1, 4, QTableWidgetItem(str(new_price)))
+        self.load_price_history_page()
+
+    def load_price_history_page(self) -> None:
+        row_count = self.priceHistoryTable.rowCount()
+        price_changes = self.price_history_file.get_changes(row_count, self.HISTORY_PAGE_SIZE)
+        self.priceHistoryTable.setRowCount(row_count + len(price_changes))
+        for i, price_change in enumerate(price_changes, start=row_count):
+            for column, value in enumerate(price_change):
+                self.priceHistoryTable.setItem(i, column, QTableWidgetItem(str(value)))
+
+    def price_history_table_scrolled(self, value: int) -> None:
+        if value == self.priceHistoryTable.verticalScrollBar().maximum():
+            self.load_price_history_page()
 
     def load_tree_view(self, inventory_file: JsonFile):
         self.clear_layout(self.search_layout)
@@ -1390,8 +1401,31 @@ class MainWindow(QMainWindow):
     def open_quote(self, folder: str):
         webbrowser.open(f"http://{get_server_ip_address()}:{get_server_port()}/load_quote/{folder}", new=0)
 
+    def backup_database(self, on_close: bool = False) -> None:
+        self.save_scheduler.flush_saves()
+        for stored_file in self.get_stored_files():
+            stored_file.compact()
+        backup_name = backup_files([stored_file.storage.get_file_path() for stored_file in self.get_stored_files()], on_close)
+        if not on_close:
+            self.status_button.setText(f"Backed up to {backup_name}", "lime")
+
+    def load_backup(self) -> None:
+        if not (backups := list_backups()):
+            msg = QMessageBox(QMessageBox.Icon.Information, "Load Backup", "There are no backups to load.")
+            msg.exec()
+            return
+        backup_name, ok = QInputDialog.getItem(self, "Load Backup", "Select a backup to restore", [backup["name"] for backup in backups], 0, False)
+        if not (backup_name and ok):
+            return
+        self.save_scheduler.flush_saves()
+        restore_backup(backup_name)
+        for stored_file in self.get_stored_files():
+            stored_file.load_data()
+        self.tool_box_menu_changed()
+        self.status_button.setText(f"Restored {backup_name}", "lime")
+
     def open_item_history(self) -> None:
-        os.startfile(f"{os.path.dirname(os.path.realpath(sys.argv[0]))}/data/inventory history.xlsx")
+        os.startfile(self.history_file.export_xlsx())
 
     def open_folder(self, path: str) -> None:
         try:
@@ -1419,7 +1453,7 @@ class MainWindow(QMainWindow):
     def sync_changes(self) -> None:
         self.status_button.setText(f"Synching {self.tabWidget.tabText(self.tabWidget.currentIndex())}", "lime")
         if self.tabWidget.tabText(self.tabWidget.currentIndex()) == "Components":
-            self.upload_file(
+            self.save_scheduler.schedule_upload(
                 [
                     "components_inventory.json",
                 ],
@@ -1428,7 +1462,7 @@ class MainWindow(QMainWindow):
             "Laser Cut Inventory",
             "Quote Generator",
         ]:
-            self.upload_file(
+            self.save_scheduler.schedule_upload(
                 [
                     "laser_cut_inventory.json",
                 ],
@@ -1437,26 +1471,26 @@ class MainWindow(QMainWindow):
             "Sheets in Inventory",
             "Quote Generator",
         ]:
-            self.upload_file(
+            self.save_scheduler.schedule_upload(
                 [
                     "sheets_inventory.json",
                 ],
             )
         if self.tabWidget.tabText(self.tabWidget.currentIndex()) == "Sheet Settings":
-            self.upload_file(
+            self.save_scheduler.schedule_upload(
                 [
                     "sheet_settings.json",
                 ],
             )
         if self.tabWidget.tabText(self.tabWidget.currentIndex()) == "Workspace":
             if self.category.name == "Staging":
-                self.upload_file(
+                self.save_scheduler.schedule_upload(
                     [
                         "admin_workspace.json",
                     ],
                 )
             else:
-                self.upload_file(
+                self.save_scheduler.schedule_upload(
                     [
                         "user_workspace.json",
                         "history_workspace.json",
@@ -1544,6 +1578,7 @@ class MainWindow(QMainWindow):
     def download_required_images_thread(self, required_images: list[str]) -> None:
         download_thread = DownloadImagesThread(required_images)
         download_thread.signal.connect(self.download_required_images_response)
+        download_thread.progress_signal.connect(self.download_progress)
         self.threads.append(download_thread)
         download_thread.start()
 
@@ -1559,6 +1594,9 @@ class MainWindow(QMainWindow):
         else:
             self.status_button.setText(f"Error: {response}", "red")
 
+    def download_progress(self, file_path: str, downloaded_count: int, total_count: int) -> None:
+        self.status_button.setText(f"Downloaded {downloaded_count}/{total_count} - {os.path.basename(file_path)}", "yellow")
+
     def upload_nest_images(self, data: Quote | list[Nest]) -> None:
         images_to_upload = []
         if isinstance(data, Quote):
@@ -1624,8 +1662,12 @@ class MainWindow(QMainWindow):
         self.threads.append(thread)
         thread.start()
 
+    def get_stored_files(self) -> list[ComponentsInventory | LaserCutInventory | SheetsInventory | PaintInventory | SheetSettings | WorkspaceSettings]:
+        return [self.components_inventory, self.laser_cut_inventory, self.sheets_inventory, self.paint_inventory, self.sheet_settings, self.workspace_settings]
+
     def upload_file(self, files_to_upload: list[str]) -> None:
-        upload_thread = UploadThread(files_to_upload)
+        self.save_scheduler.flush_saves()
+        upload_thread = UploadThread(files_to_upload, [stored_file.storage for stored_file in self.get_stored_files() if f"{stored_file.filename}.json" in files_to_upload])
         self.threads.append(upload_thread)
         upload_thread.signal.connect(self.upload_thread_response)
         upload_thread.start()
@@ -1654,17 +1696,19 @@ class MainWindow(QMainWindow):
             if self.username != "Jared":  # Because I can
                 self.showMaximized()
         else:
-            if self.downloading_changes and response["status"] == "success":
-                if "sheet_settings.json" in response["successful_files"]:
+            # Files the server answered 304 for (or sent unchanged) are already loaded,
+            # the changed ones are reloaded even when others in the batch failed
+            if self.downloading_changes and response["changed_files"]:
+                if "sheet_settings.json" in response["changed_files"]:
                     self.sheet_settings.load_data()
-                if "workspace_settings.json" in response["successful_files"]:
+                if "workspace_settings.json" in response["changed_files"]:
                     self.workspace_settings.load_data()
                     self.job_planner_widget.workspace_settings_changed()
-                if "components_inventory.json" in response["successful_files"]:
+                if "components_inventory.json" in response["changed_files"]:
                     self.components_inventory.load_data()
-                if "sheets_inventory.json" in response["successful_files"]:
+                if "sheets_inventory.json" in response["changed_files"]:
                     self.sheets_inventory.load_data()
-                if "laser_cut_inventory.json" in response["successful_files"]:
+                if "laser_cut_inventory.json" in response["changed_files"]:
                     self.laser_cut_inventory.load_data()
 
                 if self.tabWidget.tabText(self.tabWidget.currentIndex()) == "Laser Cut Inventory":
@@ -1903,11 +1947,15 @@ class MainWindow(QMainWindow):
         job_loader_thread = JobLoaderThread(self.job_manager, folder_name)
         self.threads.append(job_loader_thread)
         job_loader_thread.signal.connect(self.reload_job_response)
+        job_loader_thread.progress_signal.connect(self.download_progress)
         job_loader_thread.start()
         job_loader_thread.wait()
 
-    def reload_job_response(self, job: Job | None):
-        if job:
+    def reload_job_response(self, job: Job | None, failed_files: list[str]):
+        if job and failed_files:
+            self.status_button.setText(f"{job.name} reloaded, but {len(failed_files)} files failed to download: {', '.join(failed_files)}", "yellow")
+            self.job_planner_widget.reload_job(job)
+        elif job:
             self.status_button.setText(f"{job.name} reloaded successfully!", "lime")
             self.job_planner_widget.reload_job(job)
         else:
@@ -1918,11 +1966,15 @@ class MainWindow(QMainWindow):
         job_loader_thread = JobLoaderThread(self.job_manager, folder_name)
         self.threads.append(job_loader_thread)
         job_loader_thread.signal.connect(self.load_job_response)
+        job_loader_thread.progress_signal.connect(self.download_progress)
         job_loader_thread.start()
         job_loader_thread.wait()
 
-    def load_job_response(self, job: Job | None):
-        if job:
+    def load_job_response(self, job: Job | None, failed_files: list[str]):
+        if job and failed_files:
+            self.status_button.setText(f"{job.name} loaded, but {len(failed_files)} files failed to download: {', '.join(failed_files)}", "yellow")
+            self.job_planner_widget.load_job(job)
+        elif job:
             self.status_button.setText(f"{job.name} loaded successfully!", "lime")
             self.job_planner_widget.load_job(job)
         else:
@@ -2194,8 +2246,15 @@ class MainWindow(QMainWindow):
             event.ignore()
 
     def closeEvent(self, event) -> None:
+        self.save_scheduler.flush()
+        self.backup_database(on_close=True)
+        for thread in self.threads:
+            if isinstance(thread, UploadThread):
+                thread.wait(10000)
+        self.price_history_file.close()
         self.save_geometry()
         self.save_menu_tab_order()
+        self.settings_file.flush()
         super().closeEvent(event)
 
     # * /\ OVERIDDEN UI EVENTS /\
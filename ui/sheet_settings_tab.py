@@ -361,7 +361,7 @@ class SheetSettingsTab(QWidget):
         selected_material = self.sheet_settings.materials.get(self.materials_list.selectedItems()[0].text())
         text, ok = QInputDialog.getText(self, "Rename material", "Enter a new name:", text=selected_material.name)
         if text and ok:
-            selected_material.name = text
+            self.sheet_settings.rename_material(selected_material.name, text)
             self.sheet_settings.save_data()
             self.sync_changes()
             self.load_tabs()
@@ -390,7 +390,7 @@ class SheetSettingsTab(QWidget):
         selected_thickness = self.sheet_settings.thicknesses.get(self.thicknesses_list.selectedItems()[0].text())
         text, ok = QInputDialog.getText(self, "Rename material", "Enter a new name:", text=selected_thickness.name)
         if text and ok:
-            selected_thickness.name = text
+            self.sheet_settings.rename_thickness(selected_thickness.name, text)
             self.sheet_settings.save_data()
             self.sync_changes()
             self.load_tabs()
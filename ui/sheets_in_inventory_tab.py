@@ -574,8 +574,7 @@ class SheetsInInventoryTab(QWidget):
         self.clear_layout(self.gridLayout_sheet_prices)
         grand_total: float = 0.0
         i: int = 0
-        for i, category in enumerate(self.sheets_inventory.get_categories()):
-            category_total = self.sheets_inventory.get_category_stock_cost(category)
+        for i, (category, category_total) in enumerate(self.sheets_inventory.get_category_stock_costs().items()):
             lbl = QLabel(f"{category.name}:", self)
             self.gridLayout_sheet_prices.addWidget(lbl, i, 0)
             lbl = QLabel(f"${category_total:,.2f}", self)
@@ -3468,6 +3468,7 @@ class WorkspaceTab(QWidget):
         workspace_download_files = WorkspaceDownloadFile([file_to_download], open_when_done)
         self.threads.append(workspace_download_files)
         workspace_download_files.signal.connect(self.download_workspace_file_response)
+        workspace_download_files.progress_signal.connect(lambda file_path, downloaded_count, total_count: self.status_button.setText(f"Downloaded {downloaded_count}/{total_count} - {os.path.basename(file_path)}", "yellow"))
         workspace_download_files.start()
 
     # USER
@@ -11,8 +11,27 @@ if TYPE_CHECKING:
 
 
 class Component(InventoryItem):
+    __slots__ = (
+        "components_inventory",
+        "category_quantities",
+        "part_number",
+        "priority",
+        "shelf_number",
+        "notes",
+        "image_path",
+        "latest_change_quantity",
+        "latest_change_price",
+        "red_quantity_limit",
+        "yellow_quantity_limit",
+        "orders",
+        "_part_name",
+        "_quantity",
+        "_price",
+        "_use_exchange_rate",
+    )
+
     def __init__(self, name: str, data: dict, components_inventory):
-        super().__init__(name)
+        super().__init__(name, components_inventory)
 
         self.components_inventory: ComponentsInventory = components_inventory
         self.quantity: float = 0.0
@@ -33,6 +52,43 @@ class Component(InventoryItem):
 
         self.load_data(data)
 
+    @property
+    def part_name(self) -> str:
+        return self._part_name
+
+    @part_name.setter
+    def part_name(self, part_name: str):
+        self._part_name = part_name
+        self.key_changed()
+
+    # The stock cost is computed from these
+    @property
+    def quantity(self) -> float:
+        return self._quantity
+
+    @quantity.setter
+    def quantity(self, quantity: float):
+        self._quantity = quantity
+        self.stock_cost_changed()
+
+    @property
+    def price(self) -> float:
+        return self._price
+
+    @price.setter
+    def price(self, price: float):
+        self._price = price
+        self.stock_cost_changed()
+
+    @property
+    def use_exchange_rate(self) -> bool:
+        return self._use_exchange_rate
+
+    @use_exchange_rate.setter
+    def use_exchange_rate(self, use_exchange_rate: bool):
+        self._use_exchange_rate = use_exchange_rate
+        self.stock_cost_changed()
+
     def get_exchange_rate(self) -> float:
         return 1.3
 
@@ -105,12 +161,16 @@ class Component(InventoryItem):
         for category in self.components_inventory.get_categories():
             if category.name in categories:
                 self.categories.append(category)
+        self.categories_changed()
 
         if not self.part_number:
             self.part_number = self.part_name
 
     def get_copy(self) -> "Component":
-        return copy.deepcopy(self)
+        component_copy: Component = super().get_copy()
+        component_copy.category_quantities = self.category_quantities.copy()
+        component_copy.orders = [copy.copy(order) for order in self.orders]
+        return component_copy
 
     def to_dict(self) -> dict[str, dict]:
         return {
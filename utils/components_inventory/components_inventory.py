@@ -1,15 +1,25 @@
+import numpy as np
 import ujson as json
-from natsort import natsorted
 
 from utils.components_inventory.component import Component
 from utils.inventory.category import Category
 from utils.inventory.inventory import Inventory
+from utils.inventory.stock_columns import StockColumns, get_column
+from utils.natural_sort import insert_natural_sorted, natural_sorted
 
 
 class ComponentsInventory(Inventory):
+    SORT_VALUES = {
+        "quantity": lambda component: component.quantity,
+        "name": lambda component: component.part_name,
+    }
+
     def __init__(self):
         super().__init__("components_inventory")
         self.components: list[Component] = []
+        self.components_by_name = self.add_item_index(lambda component: component.name)
+        self.components_by_part_name = self.add_item_index(lambda component: component.part_name)
+        self.stock_costs = self.add_stock_cost_totals(lambda component: component.get_total_cost_in_stock())
         self.load_data()
 
     def index(self, component: Component | str):
@@ -25,50 +35,56 @@ class ComponentsInventory(Inventory):
         return [component.name for component in self.components]
 
     def get_total_stock_cost(self) -> float:
-        total = 0.0
-        for component in self.components:
-            total += component.get_total_cost_in_stock()
-        return total
+        return self.stock_costs.total
+
+    def get_stock_columns(self) -> StockColumns:
+        quantities = get_column(self.components, lambda component: component.quantity)
+        unit_costs = get_column(self.components, lambda component: component.price * (component.get_exchange_rate() if component.use_exchange_rate else 1))
+        return StockColumns(self.components, quantities, np.maximum(unit_costs * quantities, 0.0))
 
     def get_components_by_category(self, category: str | Category) -> list[Component]:
         if isinstance(category, str):
             category = self.get_category(category)
-        return [component for component in self.components if category in component.categories]
+        return self.get_items_in_category(category)
 
     def get_total_stock_cost_for_similar_categories(self, text: str) -> float:
-        total = 0.0
-        used_components: set[Component] = set()
-        for category in self.get_categories():
-            if text in category.name:
-                for component in self.components:
-                    if category in component.categories and component not in used_components:
-                        total += component.get_total_cost_in_stock()
-                        used_components.add(component)
-        return total
+        return self.stock_costs.get_group_total(category for category in self.get_categories() if text in category.name)
 
     def get_total_category_cost_in_stock(self, category: Category | str) -> float:
-        total = 0.0
         if isinstance(category, str):
             category = self.get_category(category)
-        for component in self.components:
-            if category in component.categories:
-                total += component.get_total_cost_in_stock()
-        return total
+        return self.stock_costs.get_category_total(category)
 
     def get_total_category_unit_cost(self, category: Category | str) -> float:
         total = 0.0
         if isinstance(category, str):
             category = self.get_category(category)
-        for component in self.components:
-            if category in component.categories:
-                total += component.get_total_unit_cost(category)
+        for component in self.get_components_by_category(category):
+            total += component.get_total_unit_cost(category)
         return total
 
+    def get_category_stock_costs(self) -> dict[Category, float]:
+        return {category: self.stock_costs.get_category_total(category) for category in self.get_categories()}
+
     def add_component(self, component: Component):
-        self.components.append(component)
+        if self.sort_order is None:
+            self.components.append(component)
+        else:
+            sort_name, reverse = self.sort_order
+            insert_natural_sorted(self.components, component, self.SORT_VALUES[sort_name], reverse)
+        self.components_by_name.add(component)
+        self.components_by_part_name.add(component)
+        self.categories.category_items.add(component)
+        if self.sort_order is not None:
+            self.categories.category_items.reorder(self.components)
+        self.stock_costs.add(component)
 
     def remove_component(self, component: Component):
         self.components.remove(component)
+        self.components_by_name.remove(component)
+        self.components_by_part_name.remove(component)
+        self.categories.category_items.remove(component)
+        self.stock_costs.remove(component)
 
     def duplicate_category(self, category_to_duplicate: Category, new_category_name: str) -> Category:
         new_category = Category(new_category_name)
@@ -78,41 +94,43 @@ class ComponentsInventory(Inventory):
         return new_category
 
     def delete_category(self, category: str | Category) -> Category:
+        components = self.get_components_by_category(category)
         deleted_category = super().delete_category(category)
-        for component in self.get_components_by_category(deleted_category):
+        for component in components:
             component.remove_from_category(deleted_category)
         return deleted_category
 
     def get_component_by_name(self, component_name: str) -> Component:
-        return next(
-            (component for component in self.components if component.name == component_name),
-            None,
-        )
+        return self.components_by_name.get(component_name)
 
     def get_component_by_part_name(self, component_name: str) -> Component:
-        return next(
-            (component for component in self.components if component.part_name == component_name),
-            None,
-        )
+        return self.components_by_part_name.get(component_name)
 
     def sort_by_quantity(self, ascending: bool) -> list[Component]:
-        self.components = natsorted(self.components, key=lambda component: component.quantity, reverse=ascending)
+        self.sort_components("quantity", ascending)
 
     def sort_by_name(self, ascending: bool) -> list[Component]:
-        self.components = natsorted(self.components, key=lambda component: component.part_name, reverse=ascending)
+        self.sort_components("name", ascending)
 
-    def save(self):
-        with open(f"{self.FOLDER_LOCATION}/{self.filename}.json", "w", encoding="utf-8") as file:
-            json.dump(self.to_dict(), file, ensure_ascii=False, indent=4)
+    def sort_components(self, sort_name: str, reverse: bool):
+        if self.sort_order == (sort_name, reverse):
+            return
+        self.components = natural_sorted(self.components, self.SORT_VALUES[sort_name], reverse)
+        self.categories.category_items.reorder(self.components)
+        self.sort_order = (sort_name, reverse)
 
     def load_data(self):
         try:
-            with open(f"{self.FOLDER_LOCATION}/{self.filename}.json", "r", encoding="utf-8") as file:
-                data: dict[str, dict[str, object]] = json.load(file)
+            data: dict[str, dict[str, object]] = self._read_data()
             self.categories.from_dict(data["categories"])
             self.components.clear()
-            for component_name, component_data in data["components"].items():
-                self.add_component(Component(component_name, component_data, self))
+            self.components.extend(Component(component_name, component_data, self) for component_name, component_data in data["components"].items())
+            self.sort_order = None
+            self.components_by_name.rebuild(self.components)
+            self.components_by_part_name.rebuild(self.components)
+            self.categories.category_items.rebuild(self.components)
+            self.stock_costs.rebuild(self.components, self.get_stock_columns().stock_costs)
+            self._update_storage_cache()
         except KeyError:  # Inventory was just created
             return
         except json.JSONDecodeError:  # Inventory file got cleared
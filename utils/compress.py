@@ -1,21 +1,167 @@
+import hashlib
 import os
+import re
 import zipfile
+import zlib
 from datetime import datetime
 
+import ujson as json
+
 from utils.settings import Settings
 
 settings_file = Settings()
 
+BACKUP_FOLDER = "backups"
+# Chunks end after a line or after a record ("},") whose hash hits the mask, so an edit only changes the chunks around it
+CHUNK_BOUNDARY = re.compile(rb"(?<=\n)|(?<=\},)")
+CHUNK_MASK = 0x3F
+MIN_CHUNK_SIZE = 1 << 14
+MAX_CHUNK_SIZE = 1 << 20
+
+
+def get_chunk_path(chunk_hash: str) -> str:
+    return f"{BACKUP_FOLDER}/chunks/{chunk_hash[:2]}/{chunk_hash}"
+
+
+def get_manifest_path(backup_name: str) -> str:
+    return f"{BACKUP_FOLDER}/manifests/{backup_name}.json"
+
+
+def get_file_signature(path_to_file: str) -> list[int]:
+    stat = os.stat(path_to_file)
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def split_into_chunks(data: bytes) -> list[bytes]:
+    chunks: list[bytes] = []
+    chunk_start = 0
+    previous_boundary = 0
+    for boundary in CHUNK_BOUNDARY.finditer(data):
+        position = boundary.start()
+        if position == previous_boundary:
+            continue
+        record = data[previous_boundary:position]
+        previous_boundary = position
+        if position - chunk_start < MIN_CHUNK_SIZE:
+            continue
+        if zlib.crc32(record) & CHUNK_MASK == 0 or position - chunk_start >= MAX_CHUNK_SIZE:
+            chunks.append(data[chunk_start:position])
+            chunk_start = position
+    if chunk_start < len(data):
+        chunks.append(data[chunk_start:])
+    return chunks
+
+
+def store_chunk(chunk: bytes) -> str:
+    chunk_hash = hashlib.sha256(chunk).hexdigest()
+    chunk_path = get_chunk_path(chunk_hash)
+    if not os.path.exists(chunk_path):
+        os.makedirs(os.path.dirname(chunk_path), exist_ok=True)
+        with open(f"{chunk_path}.tmp", "wb") as chunk_file:
+            chunk_file.write(zlib.compress(chunk))
+        os.replace(f"{chunk_path}.tmp", chunk_path)
+    return chunk_hash
+
+
+def read_chunk(chunk_hash: str) -> bytes:
+    with open(get_chunk_path(chunk_hash), "rb") as chunk_file:
+        return zlib.decompress(chunk_file.read())
+
+
+def read_manifest(backup_name: str) -> dict[str, object]:
+    with open(get_manifest_path(backup_name), "r", encoding="utf-8") as manifest_file:
+        return json.load(manifest_file)
 
-def compress_database(path_to_file: str, on_close: bool = False) -> None:
-    file_name: str = path_to_file.split("/")[-1]
+
+def list_backups() -> list[dict[str, object]]:
+    """Every backup manifest, newest first."""
+    backups: list[dict[str, object]] = []
+    manifest_folder = f"{BACKUP_FOLDER}/manifests"
+    if not os.path.isdir(manifest_folder):
+        return backups
+    for manifest_file_name in os.listdir(manifest_folder):
+        if manifest_file_name.endswith(".json"):
+            try:
+                backups.append(read_manifest(manifest_file_name[:-5]))
+            except (OSError, ValueError):
+                continue
+    return sorted(backups, key=lambda backup: backup["date"], reverse=True)
+
+
+def get_latest_backup() -> dict[str, object] | None:
+    manifest_folder = f"{BACKUP_FOLDER}/manifests"
+    if not os.path.isdir(manifest_folder):
+        return None
+    manifest_paths = [entry.path for entry in os.scandir(manifest_folder) if entry.name.endswith(".json")]
+    if not manifest_paths:
+        return None
+    try:
+        return read_manifest(os.path.basename(max(manifest_paths, key=os.path.getmtime))[:-5])
+    except (OSError, ValueError):
+        return None
+
+
+def reserve_backup_name(name: str) -> str:
+    """Claims a manifest file nobody else has, backups taken within the same second get a counter after their name."""
+    os.makedirs(f"{BACKUP_FOLDER}/manifests", exist_ok=True)
+    backup_name = name
+    count = 1
+    while True:
+        try:
+            with open(get_manifest_path(backup_name), "x", encoding="utf-8"):
+                return backup_name
+        except FileExistsError:
+            count += 1
+            backup_name = f"{name} ({count})"
+
+
+def backup_files(paths_to_files: list[str], on_close: bool = False) -> str:
+    """Stores the files as content addressed chunks and writes a manifest for them, only chunks that are not stored yet are written.
+
+    Files that did not change since the latest backup are not even read.
+    """
+    backup_date = datetime.now()
+    latest_files: dict[str, dict[str, object]] = {}
+    if latest_backup := get_latest_backup():
+        latest_files = latest_backup["files"]
+
+    files: dict[str, dict[str, object]] = {}
+    for path_to_file in paths_to_files:
+        signature = get_file_signature(path_to_file)
+        latest_file = latest_files.get(path_to_file)
+        if latest_file and latest_file["signature"] == signature and all(os.path.exists(get_chunk_path(chunk_hash)) for chunk_hash in latest_file["chunks"]):
+            files[path_to_file] = latest_file
+            continue
+        with open(path_to_file, "rb") as file:
+            data = file.read()
+        files[path_to_file] = {"signature": signature, "size": len(data), "chunks": [store_chunk(chunk) for chunk in split_into_chunks(data)]}
+
+    # Reserved only now, the empty manifest would otherwise be the latest backup above
+    backup_name = f"{settings_file.get_value('inventory_file_name')} - {backup_date.strftime('%B %d %A %Y %I_%M_%S %p')}"
     if on_close:
-        path_to_zip_file: str = f"backups/{settings_file.get_value('inventory_file_name')} - {datetime.now().strftime('%B %d %A %Y %I_%M_%S %p')} - (Auto Generated).zip"
-    else:
-        path_to_zip_file: str = f"backups/{settings_file.get_value('inventory_file_name')} - {datetime.now().strftime('%B %d %A %Y %I_%M_%S %p')}.zip"
-    file = zipfile.ZipFile(path_to_zip_file, mode="w")
-    file.write(path_to_file, file_name, compress_type=zipfile.ZIP_DEFLATED)
-    file.close()
+        backup_name += " - (Auto Generated)"
+    backup_name = reserve_backup_name(backup_name)
+    with open(f"{get_manifest_path(backup_name)}.tmp", "w", encoding="utf-8") as manifest_file:
+        json.dump({"name": backup_name, "date": backup_date.isoformat(), "files": files}, manifest_file, ensure_ascii=False)
+    os.replace(f"{get_manifest_path(backup_name)}.tmp", get_manifest_path(backup_name))
+    return backup_name
+
+
+def restore_backup(backup_name: str, target_folder: str = None) -> list[str]:
+    """Writes the files of a backup back to where they were backed up from (or into target_folder) and returns their paths."""
+    restored_files: list[str] = []
+    for path_to_file, file_data in read_manifest(backup_name)["files"].items():
+        target_path = path_to_file if target_folder is None else f"{target_folder}/{os.path.basename(path_to_file)}"
+        with open(f"{target_path}.tmp", "wb") as file:
+            for chunk_hash in file_data["chunks"]:
+                file.write(read_chunk(chunk_hash))
+        os.replace(f"{target_path}.tmp", target_path)
+        restored_files.append(target_path)
+    return restored_files
+
+
+def compress_database(path_to_file: str, on_close: bool = False) -> str:
+    return backup_files([path_to_file], on_close)
 
 
 def compress_folder(foldername, target_dir) -> None:
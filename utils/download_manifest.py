@@ -0,0 +1,94 @@
+import hashlib
+import os
+import threading
+
+import ujson as json
+
+
+class DownloadManifest:
+    """Remembers the ETag, Last-Modified and SHA-256 of every file downloaded from the server.
+
+    get_headers() turns that into If-None-Match / If-Modified-Since so the server can answer 304 for files we already have,
+    but only while the local copy is still the one we downloaded, a file changed on disk is always downloaded again.
+    Shared by every thread, ownership of the entries is per file.
+    """
+
+    def __init__(self, file_path: str = "data/download_manifest.json"):
+        self.file_path = file_path
+        self.lock = threading.Lock()
+        self.entries: dict[str, dict[str, str | list[int]]] = {}
+        self.load_data()
+
+    def load_data(self):
+        try:
+            with open(self.file_path, "r", encoding="utf-8") as manifest_file:
+                self.entries = json.load(manifest_file)
+        except (FileNotFoundError, ValueError):
+            self.entries = {}
+
+    def save(self):
+        with self.lock:
+            if directory := os.path.dirname(self.file_path):
+                os.makedirs(directory, exist_ok=True)
+            with open(f"{self.file_path}.tmp", "w", encoding="utf-8") as manifest_file:
+                json.dump(self.entries, manifest_file, indent=4)
+            os.replace(f"{self.file_path}.tmp", self.file_path)
+
+    @staticmethod
+    def get_file_signature(file_path: str) -> list[int] | None:
+        try:
+            stat = os.stat(file_path)
+        except FileNotFoundError:
+            return None
+        return [stat.st_mtime_ns, stat.st_size]
+
+    @staticmethod
+    def get_file_hash(file_path: str) -> str:
+        file_hash = hashlib.sha256()
+        with open(file_path, "rb") as file:
+            for chunk in iter(lambda: file.read(1024 * 1024), b""):
+                file_hash.update(chunk)
+        return file_hash.hexdigest()
+
+    def get_local_hash(self, file_path: str) -> str | None:
+        """SHA-256 of the file on disk if it is still the one that was downloaded, otherwise None."""
+        with self.lock:
+            entry = self.entries.get(file_path)
+        if entry is None:
+            return None
+        signature = self.get_file_signature(file_path)
+        if signature is None:
+            return None
+        if signature == entry.get("signature"):
+            return entry["sha256"]
+        if self.get_file_hash(file_path) != entry["sha256"]:
+            return None
+        # Touched but not changed, no need to hash it again next time
+        with self.lock:
+            entry["signature"] = signature
+        return entry["sha256"]
+
+    def get_headers(self, file_path: str) -> dict[str, str]:
+        if self.get_local_hash(file_path) is None:
+            return {}
+        with self.lock:
+            entry = self.entries[file_path]
+            headers: dict[str, str] = {}
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+            return headers
+
+    def update(self, file_path: str, sha256: str, etag: str | None, last_modified: str | None):
+        with self.lock:
+            self.entries[file_path] = {
+                "sha256": sha256,
+                "etag": etag,
+                "last_modified": last_modified,
+                "signature": self.get_file_signature(file_path),
+            }
+
+    def remove(self, file_path: str):
+        with self.lock:
+            self.entries.pop(file_path, None)
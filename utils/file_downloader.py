@@ -0,0 +1,96 @@
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable
+
+from utils.download_manifest import DownloadManifest
+from utils.server_client import ServerClient
+
+
+class DownloadResult:
+    def __init__(self, file_path: str, error: str = None, status_code: int = None, changed: bool = True, sha256: str = None):
+        self.file_path = file_path
+        self.error = error
+        self.status_code = status_code
+        # SHA-256 of the file on disk, None if the download failed
+        self.sha256 = sha256
+        # False when the server answered 304 or sent exactly what was already on disk
+        self.changed = changed
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+
+class FileDownloader:
+    """Downloads many files from the server at once, at most max_workers at a time.
+
+    Each file is streamed to a temporary file next to its destination and swapped in once it is complete,
+    a failed or interrupted download never leaves half a file behind.
+    With a manifest, files are only downloaded again if the server has a different version, and left untouched if not.
+    """
+
+    CHUNK_SIZE: int = 64 * 1024
+
+    def __init__(self, max_workers: int = ServerClient.MAX_CONNECTIONS, manifest: DownloadManifest = None):
+        self.max_workers = max_workers
+        self.manifest = manifest
+        self.server_client = ServerClient()
+
+    def download_file(self, url_path: str, file_path: str) -> DownloadResult:
+        local_hash: str = None
+        headers: dict[str, str] = {}
+        if self.manifest is not None:
+            local_hash = self.manifest.get_local_hash(file_path)
+            headers = self.manifest.get_headers(file_path)
+        try:
+            with self.server_client.get(url_path, headers=headers, stream=True) as response:
+                if response.status_code == 304 and headers:
+                    return DownloadResult(file_path, status_code=304, changed=False, sha256=local_hash)
+                if response.status_code != 200:
+                    return DownloadResult(file_path, f"{response.status_code} {file_path} not found", response.status_code)
+                if directory := os.path.dirname(file_path):
+                    os.makedirs(directory, exist_ok=True)
+                file_hash = hashlib.sha256()
+                with open(f"{file_path}.download", "wb") as file:
+                    for chunk in response.iter_content(self.CHUNK_SIZE):
+                        file.write(chunk)
+                        file_hash.update(chunk)
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+            sha256 = file_hash.hexdigest()
+            changed = sha256 != local_hash
+            if changed:
+                os.replace(f"{file_path}.download", file_path)
+            else:
+                os.remove(f"{file_path}.download")
+            if self.manifest is not None:
+                self.manifest.update(file_path, sha256, etag, last_modified)
+            return DownloadResult(file_path, status_code=200, changed=changed, sha256=sha256)
+        except Exception as error:
+            if os.path.exists(f"{file_path}.download"):
+                os.remove(f"{file_path}.download")
+            return DownloadResult(file_path, str(error))
+
+    def download_files(
+        self,
+        downloads: list[tuple[str, str]],
+        file_downloaded: Callable[[DownloadResult, int, int], None] = None,
+    ) -> list[DownloadResult]:
+        """Downloads every (url path, file path), file_downloaded(result, completed count, total) is called as each one finishes.
+
+        Results are returned in the order of downloads.
+        """
+        results: dict[int, DownloadResult] = {}
+        if not downloads:
+            return []
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(downloads))) as executor:
+            futures = {executor.submit(self.download_file, url_path, file_path): index for index, (url_path, file_path) in enumerate(downloads)}
+            for future in as_completed(futures):
+                result = future.result()
+                results[futures[future]] = result
+                if file_downloaded is not None:
+                    file_downloaded(result, len(results), len(downloads))
+        if self.manifest is not None:
+            self.manifest.save()
+        return [results[index] for index in range(len(downloads))]
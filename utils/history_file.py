@@ -1,53 +1,132 @@
+import os
+
+import ujson as json
 from openpyxl import Workbook, load_workbook
 
 
 class HistoryFile:
+    """Append-only log of quantity changes, one JSON line per entry.
+
+    The log is the source of truth, "inventory history.xlsx" is only written by export_xlsx() when someone wants to open it.
+    """
+
+    SHEETS: tuple[str, ...] = ("Categories", "Single Items")
+
     def __init__(self) -> None:
         self.file_name = "inventory history.xlsx"
-        self.category_new_row_pos: int = 0
-        self.single_item_new_row: int = 0
+        self.log_file_name = "inventory history.jsonl"
+        self.FOLDER_LOCATION: str = f"{os.getcwd()}/data"
+        # Byte offset of every entry in the log, per sheet, so pages can be read without scanning the whole log.
+        # Built by load_file() on first use and only extended with what was appended since.
+        self.entry_offsets: dict[str, list[int]] = {sheet: [] for sheet in self.SHEETS}
+        self.indexed_size: int = 0
+        if not os.path.exists(self.get_log_path()):
+            self.import_xlsx()
+
+    def get_log_path(self) -> str:
+        return f"{self.FOLDER_LOCATION}/{self.log_file_name}"
+
+    def get_xlsx_path(self) -> str:
+        return f"{self.FOLDER_LOCATION}/{self.file_name}"
+
+    def import_xlsx(self) -> None:
+        """One-shot import of the workbook the history used to be kept in."""
+        lines: list[str] = []
         try:
-            self.workbook = load_workbook(f"data/{self.file_name}")
+            workbook = load_workbook(self.get_xlsx_path(), read_only=True)
         except Exception:
-            self.workbook = Workbook()
-            self.workbook.create_sheet("Categories", 0)
-            self.workbook.create_sheet("Single Items", 1)
-            self.workbook.remove_sheet(self.workbook["Sheet"])
-        self.categories_sheet = self.workbook["Categories"]
-        self.single_items_sheet = self.workbook["Single Items"]
-        self.category_data = {"Date": [], "Description": []}
-        self.single_item_data = {"Date": [], "Description": []}
-        self.load_file()
+            workbook = None
+        if workbook is not None:
+            for sheet in self.SHEETS:
+                if sheet not in workbook.sheetnames:
+                    continue
+                for date, description, *_ in workbook[sheet].iter_rows(min_col=1, max_col=2, values_only=True):
+                    lines.append(self.get_entry_line(sheet, self.get_cell_text(date), self.get_cell_text(description)))
+            workbook.close()
+        with open(f"{self.get_log_path()}.tmp", "w", encoding="utf-8") as log_file:
+            log_file.writelines(lines)
+        os.replace(f"{self.get_log_path()}.tmp", self.get_log_path())
+
+    def get_cell_text(self, value: object) -> str | None:
+        # Excel turns anything that looks like a date into a datetime, which json cannot write
+        if value is None or isinstance(value, str):
+            return value
+        return str(value)
+
+    def get_entry_line(self, sheet: str, date: str, description: str) -> str:
+        return json.dumps({"sheet": sheet, "date": date, "description": description}, ensure_ascii=False) + "\n"
 
     def load_file(self) -> None:
-        self.category_new_row_pos = len(self.categories_sheet["A"])
+        """Indexes whatever was appended to the log since the last call."""
+        with open(self.get_log_path(), "rb") as log_file:
+            log_file.seek(self.indexed_size)
+            offset = self.indexed_size
+            for line in iter(log_file.readline, b""):
+                if not line.endswith(b"\n"):  # Torn write, the next append starts a fresh line
+                    break
+                try:
+                    sheet = json.loads(line)["sheet"]
+                except (ValueError, KeyError):
+                    sheet = None
+                if sheet in self.entry_offsets:
+                    self.entry_offsets[sheet].append(offset)
+                offset += len(line)
+            self.indexed_size = offset
 
-        for cell in self.categories_sheet["A"]:
-            self.category_data["Date"].append(cell.value)
-        for cell in self.categories_sheet["B"]:
-            self.category_data["Description"].append(cell.value)
+    def get_entry_count(self, sheet: str) -> int:
+        self.load_file()
+        return len(self.entry_offsets[sheet])
 
-        self.single_item_new_row = len(self.single_items_sheet["A"])
+    def get_entries(self, sheet: str, start: int = 0, count: int = None) -> list[tuple[str, str]]:
+        self.load_file()
+        offsets = self.entry_offsets[sheet][start : None if count is None else start + count]
+        entries: list[tuple[str, str]] = []
+        with open(self.get_log_path(), "rb") as log_file:
+            for offset in offsets:
+                log_file.seek(offset)
+                entry = json.loads(log_file.readline())
+                entries.append((entry["date"], entry["description"]))
+        return entries
 
-        for cell in self.single_items_sheet["A"]:
-            self.single_item_data["Date"].append(cell.value)
-        for cell in self.single_items_sheet["B"]:
-            self.single_item_data["Description"].append(cell.value)
+    def get_data(self, sheet: str) -> dict[str, list[str]]:
+        entries = self.get_entries(sheet)
+        return {"Date": [date for date, _ in entries], "Description": [description for _, description in entries]}
 
     def get_data_from_category(self) -> dict:
-        return self.category_data
+        return self.get_data("Categories")
 
     def get_data_from_single_item(self) -> dict:
-        return self.single_item_data
+        return self.get_data("Single Items")
+
+    def add_entry(self, sheet: str, date: str, description: str) -> None:
+        self.load_file()  # Pick up entries other instances appended
+        with open(self.get_log_path(), "ab") as log_file:
+            if log_file.tell() != self.indexed_size:  # Start after a torn write instead of gluing onto it
+                log_file.write(b"\n")
+            offset = log_file.tell()
+            log_file.write(self.get_entry_line(sheet, date, description).encode("utf-8"))
+            self.indexed_size = log_file.tell()
+        self.entry_offsets[sheet].append(offset)
 
     def add_new_to_category(self, date: str, description: str) -> None:
-        self.categories_sheet.cell(row=self.category_new_row_pos + 1, column=1, value=date)
-        self.categories_sheet.cell(row=self.category_new_row_pos + 1, column=2, value=description)
-        self.workbook.save(f"data/{self.file_name}")
-        self.load_file()
+        self.add_entry("Categories", date, description)
 
     def add_new_to_single_item(self, date: str, description: str) -> None:
-        self.single_items_sheet.cell(row=self.single_item_new_row + 1, column=1, value=date)
-        self.single_items_sheet.cell(row=self.single_item_new_row + 1, column=2, value=description)
-        self.workbook.save(f"data/{self.file_name}")
+        self.add_entry("Single Items", date, description)
+
+    def export_xlsx(self, file_path: str = None) -> str:
+        """Writes the log out as the workbook it used to be kept in and returns where it was written."""
+        file_path = file_path or self.get_xlsx_path()
         self.load_file()
+        workbook = Workbook(write_only=True)
+        sheets = {sheet: workbook.create_sheet(sheet) for sheet in self.SHEETS}
+        with open(self.get_log_path(), "rb") as log_file:
+            for line in log_file:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if entry.get("sheet") in sheets:
+                    sheets[entry["sheet"]].append([entry.get("date"), entry.get("description")])
+        workbook.save(file_path)
+        return file_path
@@ -1,9 +1,11 @@
 from utils.inventory.category import Category
+from utils.inventory.category_index import CategoryIndex
 
 
 class Categories:
     def __init__(self):
         self.categories: list[Category] = []
+        self.category_items: CategoryIndex = CategoryIndex()
 
     def get_category(self, category_name: str) -> Category:
         return next(
@@ -16,10 +18,12 @@ class Categories:
 
     def delete_category(self, category: Category) -> Category:
         self.categories.remove(category)
+        self.category_items.remove_category(category)
         return category
 
     def clear(self):
         self.categories.clear()
+        self.category_items.clear()
 
     def to_dict(self) -> list[str]:
         data = {category.name for category in self.categories}
@@ -27,5 +31,6 @@ class Categories:
 
     def from_dict(self, data: list[str]):
         self.categories.clear()
+        self.category_items.clear()
         for category_name in data:
             self.categories.append(Category(category_name))
@@ -0,0 +1,85 @@
+from typing import Iterable
+
+from utils.inventory.category import Category
+
+
+class CategoryIndex:
+    """Maps every category to the items in it and every item to the categories it was indexed under.
+
+    Items are kept in the order they were added, Inventory subclasses call reorder() after sorting their items.
+    Every item gets an id when it is added so replace() can swap an item without moving it to the end of its categories.
+    """
+
+    def __init__(self):
+        self.items: dict[Category, dict[int, object]] = {}
+        self.item_ids: dict[object, int] = {}
+        self.item_categories: dict[int, list[Category]] = {}
+        self.next_item_id: int = 0
+
+    def clear(self):
+        self.items.clear()
+        self.item_ids.clear()
+        self.item_categories.clear()
+
+    def rebuild(self, items: Iterable[object]):
+        self.clear()
+        for item in items:
+            self.add(item)
+
+    def reorder(self, items: Iterable[object]):
+        """Puts the items of every category in the order of items, they all have to be indexed already."""
+        ordered_items: dict[Category, dict[int, object]] = {category: {} for category in self.items}
+        for item in items:
+            if (item_id := self.item_ids.get(item)) is None:
+                continue
+            for category in self.item_categories[item_id]:
+                if category in ordered_items:
+                    ordered_items[category][item_id] = item
+        self.items = ordered_items
+
+    def add(self, item: object):
+        if item in self.item_ids:
+            return
+        item_id = self.next_item_id
+        self.next_item_id += 1
+        self.item_ids[item] = item_id
+        self.item_categories[item_id] = list(item.categories)
+        for category in item.categories:
+            self.items.setdefault(category, {})[item_id] = item
+
+    def remove(self, item: object):
+        if (item_id := self.item_ids.pop(item, None)) is None:
+            return
+        for category in self.item_categories.pop(item_id):
+            if category_items := self.items.get(category):
+                category_items.pop(item_id, None)
+
+    def replace(self, old_item: object, new_item: object):
+        if (item_id := self.item_ids.pop(old_item, None)) is None:
+            return
+        self.item_ids[new_item] = item_id
+        for category in self.item_categories[item_id]:
+            if category in self.items:
+                self.items[category][item_id] = new_item
+        self.update(new_item)
+
+    def update(self, item: object):
+        if (item_id := self.item_ids.get(item)) is None:  # Not part of this inventory, like a part that belongs to a job
+            return
+        old_categories = self.item_categories[item_id]
+        for category in old_categories:
+            if category not in item.categories and (category_items := self.items.get(category)):
+                category_items.pop(item_id, None)
+        for category in item.categories:
+            if category not in old_categories:
+                self.items.setdefault(category, {})[item_id] = item
+        self.item_categories[item_id] = list(item.categories)
+
+    def remove_category(self, category: Category):
+        self.items.pop(category, None)
+
+    def get_items(self, category: Category) -> list[object]:
+        return list(self.items.get(category, {}).values())
+
+    def __contains__(self, item: object) -> bool:
+        return item in self.item_ids
@@ -1,7 +1,15 @@
 import os
+from typing import TYPE_CHECKING
 
 from utils.inventory.categories import Categories
 from utils.inventory.category import Category
+from utils.inventory.item_index import ItemIndex
+from utils.inventory.stock_cost_totals import StockCostTotals
+from utils.storage.storage import get_storage_backend
+from utils.storage.storage_backend import StorageBackend
+
+if TYPE_CHECKING:
+    from utils.save_scheduler import SaveScheduler
 
 
 class Inventory:
@@ -9,15 +17,21 @@ class Inventory:
         self.categories: Categories = Categories()
         self.filename: str = filename.replace(".json", "")
         self.FOLDER_LOCATION: str = f"{os.getcwd()}/data"
+        self.storage: StorageBackend = get_storage_backend(self.filename, self.FOLDER_LOCATION)
+        self.save_scheduler: SaveScheduler = None
+        self.item_indexes: list[ItemIndex] = []
+        self.stock_cost_totals: list[StockCostTotals] = []
+        # (sort name, reverse) the items are known to be sorted by, None once an edit may have moved an item out of place.
+        # Subclasses insert new items in place while it is set, so sorting again is only needed after such an edit.
+        self.sort_order: tuple[str, bool] | None = None
         self.__create_file()
 
     def __create_file(self):
-        if not os.path.exists(f"{self.FOLDER_LOCATION}/{self.filename}.json"):
+        if not self.storage.exists():
             self._reset_file()
 
     def _reset_file(self):
-        with open(f"{self.FOLDER_LOCATION}/{self.filename}.json", "w", encoding="utf-8") as file:
-            file.write("{}")
+        self.storage.reset()
 
     def get_categories(self) -> list[Category]:
         return self.categories.categories
@@ -36,3 +50,57 @@ class Inventory:
             return self.categories.delete_category(self.get_category(category))
         elif isinstance(category, Category):
             return self.categories.delete_category(category)
+
+    def add_item_index(self, get_key) -> ItemIndex:
+        item_index = ItemIndex(get_key)
+        self.item_indexes.append(item_index)
+        return item_index
+
+    def item_key_changed(self, item):
+        self.item_sort_value_changed(item)
+        for item_index in self.item_indexes:
+            item_index.update(item)
+
+    def add_stock_cost_totals(self, get_stock_cost) -> StockCostTotals:
+        stock_cost_totals = StockCostTotals(get_stock_cost)
+        self.stock_cost_totals.append(stock_cost_totals)
+        return stock_cost_totals
+
+    def item_categories_changed(self, item):
+        self.item_sort_value_changed(item)
+        self.categories.category_items.update(item)
+        for stock_cost_totals in self.stock_cost_totals:
+            stock_cost_totals.update(item)
+
+    def item_stock_cost_changed(self, item):
+        self.item_sort_value_changed(item)
+        for stock_cost_totals in self.stock_cost_totals:
+            stock_cost_totals.update(item)
+
+    def item_sort_value_changed(self, item):
+        # Items that are not part of this inventory (new ones, job and quote parts) do not affect the order
+        if item in self.categories.category_items or any(item in stock_cost_totals for stock_cost_totals in self.stock_cost_totals):
+            self.sort_order = None
+
+    def get_items_in_category(self, category: Category) -> list:
+        return self.categories.category_items.get_items(category)
+
+    def _read_data(self) -> dict[str, dict[str, object]]:
+        if self.save_scheduler is not None:  # Pending edits have to hit the disk before we read it back
+            self.save_scheduler.flush_saves([self])
+        return self.storage.load()
+
+    def _update_storage_cache(self):
+        self.storage.update_cache(self.to_dict())
+
+    def save(self):
+        if self.save_scheduler is None:
+            self.save_now()
+        else:
+            self.save_scheduler.mark_dirty(self)
+
+    def save_now(self):
+        self.storage.save(self.to_dict())
+
+    def compact(self):
+        self.storage.compact()
@@ -1,11 +1,53 @@
+import copy
+from typing import TYPE_CHECKING
+
 from utils.inventory.category import Category
 
+if TYPE_CHECKING:
+    from utils.inventory.inventory import Inventory
+
 
 class InventoryItem:
-    def __init__(self, name: str):
+    __slots__ = ("inventory", "_name", "categories")
+
+    def __init__(self, name: str, inventory: "Inventory" = None):
+        self.inventory = inventory
         self.name: str = name
         self.categories: list[Category] = []
 
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @name.setter
+    def name(self, name: str):
+        self._name = name
+        self.key_changed()
+
+    def key_changed(self):
+        """Has to be called whenever an attribute the inventory indexes by changes."""
+        if self.inventory is not None:
+            self.inventory.item_key_changed(self)
+
+    def categories_changed(self):
+        """Has to be called whenever categories is changed in place."""
+        if self.inventory is not None:
+            self.inventory.item_categories_changed(self)
+
+    def stock_cost_changed(self):
+        """Has to be called whenever an attribute the stock cost is computed from changes."""
+        if self.inventory is not None:
+            self.inventory.item_stock_cost_changed(self)
+
+    def get_copy(self):
+        """Copies the values of the item, the inventory, settings and categories it points to are shared with the copy.
+
+        Subclasses copy the containers they own on top of this.
+        """
+        item_copy = copy.copy(self)
+        item_copy.categories = self.categories.copy()
+        return item_copy
+
     def print_categories(self) -> str:
         return "".join(f"{i + 1}. {category.name}\n" for i, category in enumerate(self.categories))
 
@@ -14,6 +56,8 @@ class InventoryItem:
 
     def add_to_category(self, category: Category):
         self.categories.append(category)
+        self.categories_changed()
 
     def remove_from_category(self, category: Category):
         self.categories.remove(category)
+        self.categories_changed()
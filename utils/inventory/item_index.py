@@ -0,0 +1,61 @@
+from typing import Callable, Iterable
+
+
+class ItemIndex:
+    """Maps a key (name, part name, ...) to the items that have it.
+
+    The owning inventory adds and removes items, items tell it when their key changes through InventoryItem.key_changed().
+    If several items share a key, get() returns the one that was indexed first, like the linear scans it replaces.
+    """
+
+    def __init__(self, get_key: Callable[[object], str]):
+        self.get_key = get_key
+        self.items: dict[str, list[object]] = {}
+        self.item_keys: dict[object, str] = {}
+
+    def clear(self):
+        self.items.clear()
+        self.item_keys.clear()
+
+    def rebuild(self, items: Iterable[object]):
+        self.clear()
+        for item in items:
+            self.add(item)
+
+    def add(self, item: object):
+        if item in self.item_keys:
+            return
+        key = self.get_key(item)
+        self.item_keys[item] = key
+        self.items.setdefault(key, []).append(item)
+
+    def remove(self, item: object):
+        if (key := self.item_keys.pop(item, None)) is None:
+            return
+        items = self.items[key]
+        items.remove(item)
+        if not items:
+            del self.items[key]
+
+    def replace(self, old_item: object, new_item: object):
+        if (key := self.item_keys.pop(old_item, None)) is None:
+            return
+        items = self.items[key]
+        items[items.index(old_item)] = new_item
+        self.item_keys[new_item] = key
+        self.update(new_item)
+
+    def update(self, item: object):
+        if item not in self.item_keys:  # Not part of this inventory, like a part that belongs to a job
+            return
+        if self.item_keys[item] != self.get_key(item):
+            self.remove(item)
+            self.add(item)
+
+    def get(self, key: str) -> object | None:
+        if items := self.items.get(key):
+            return items[0]
+        return None
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.items
@@ -0,0 +1,18 @@
+import numpy as np
+
+
+class StockColumns:
+    """Columnar snapshot of an inventory's quantities and stock costs, computed for every item at once.
+
+    Each attribute is a NumPy array with one row per item, in the order of items.
+    It is not kept up to date, the inventories only build one to rebuild their StockCostTotals when they load or reprice everything.
+    """
+
+    def __init__(self, items: list[object], quantities: np.ndarray, stock_costs: np.ndarray):
+        self.items = items
+        self.quantities = quantities
+        self.stock_costs = stock_costs
+
+
+def get_column(items: list[object], get_value, dtype=np.float64) -> np.ndarray:
+    return np.fromiter((get_value(item) for item in items), dtype=dtype, count=len(items))
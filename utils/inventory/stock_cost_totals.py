@@ -0,0 +1,101 @@
+from typing import Callable, Iterable
+
+from utils.inventory.category import Category
+
+
+class StockCostTotals:
+    """Stock cost of every category and of the whole inventory, updated by delta.
+
+    Items report price, quantity and category changes through InventoryItem.stock_cost_changed() and categories_changed(),
+    so reading a total never has to walk the items.
+    """
+
+    # Group totals kept up to date, every change walks them so only the most recently read ones are kept
+    MAX_GROUP_TOTALS: int = 8
+
+    def __init__(self, get_stock_cost: Callable[[object], float]):
+        self.get_stock_cost = get_stock_cost
+        self.item_costs: dict[object, tuple[float, tuple[Category, ...]]] = {}
+        self.category_totals: dict[Category, float] = {}
+        self.category_counts: dict[Category, int] = {}
+        self.group_totals: dict[frozenset[Category], float] = {}
+        self.total: float = 0.0
+
+    def clear(self):
+        self.item_costs.clear()
+        self.category_totals.clear()
+        self.category_counts.clear()
+        self.group_totals.clear()
+        self.total = 0.0
+
+    def rebuild(self, items: Iterable[object], stock_costs: Iterable[float] = None):
+        """stock_costs can be passed in when they were already computed for all items at once, see StockColumns."""
+        self.clear()
+        if stock_costs is None:
+            for item in items:
+                self.add(item)
+            return
+        for item, stock_cost in zip(items, stock_costs):
+            if item not in self.item_costs:
+                self.apply(item, float(stock_cost), tuple(item.categories), 1)
+
+    def add(self, item: object):
+        if item in self.item_costs:
+            return
+        self.apply(item, self.get_stock_cost(item), tuple(item.categories), 1)
+
+    def remove(self, item: object):
+        if item not in self.item_costs:
+            return
+        stock_cost, categories = self.item_costs[item]
+        self.apply(item, stock_cost, categories, -1)
+
+    def replace(self, old_item: object, new_item: object):
+        if old_item not in self.item_costs:
+            return
+        self.item_costs[new_item] = self.item_costs.pop(old_item)
+        self.update(new_item)
+
+    def update(self, item: object):
+        if item not in self.item_costs:  # Not part of this inventory, like a part that belongs to a job
+            return
+        stock_cost, categories = self.item_costs[item]
+        new_stock_cost, new_categories = self.get_stock_cost(item), tuple(item.categories)
+        if new_stock_cost == stock_cost and new_categories == categories:
+            return
+        self.apply(item, stock_cost, categories, -1)
+        self.apply(item, new_stock_cost, new_categories, 1)
+
+    def apply(self, item: object, stock_cost: float, categories: tuple[Category, ...], sign: int):
+        if sign > 0:
+            self.item_costs[item] = (stock_cost, categories)
+        else:
+            del self.item_costs[item]
+        self.total = self.total + sign * stock_cost if self.item_costs else 0.0
+        for category in categories:
+            count = self.category_counts.get(category, 0) + sign
+            if count:
+                self.category_counts[category] = count
+                self.category_totals[category] = self.category_totals.get(category, 0.0) + sign * stock_cost
+            else:  # Start from zero again instead of carrying rounding errors around
+                self.category_counts.pop(category, None)
+                self.category_totals.pop(category, None)
+        for group in self.group_totals:
+            if not group.isdisjoint(categories):
+                self.group_totals[group] += sign * stock_cost
+
+    def get_category_total(self, category: Category) -> float:
+        return self.category_totals.get(category, 0.0)
+
+    def get_group_total(self, categories: Iterable[Category]) -> float:
+        """Stock cost of the items in any of the categories, items in several of them are only counted once."""
+        group = frozenset(categories)
+        if (group_total := self.group_totals.pop(group, None)) is None:
+            group_total = sum(stock_cost for stock_cost, item_categories in self.item_costs.values() if not group.isdisjoint(item_categories))
+            if len(self.group_totals) >= self.MAX_GROUP_TOTALS:
+                del self.group_totals[next(iter(self.group_totals))]  # Least recently read, dicts keep insertion order
+        self.group_totals[group] = group_total
+        return group_total
+
+    def __contains__(self, item: object) -> bool:
+        return item in self.item_costs
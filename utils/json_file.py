@@ -10,6 +10,8 @@ class JsonFile:
         self.data = None
         self.file_name: str = file_name.replace(".json", "")
         self.FOLDER_LOCATION: str = f"{os.getcwd()}/"
+        self.transaction_depth: int = 0
+        self.has_pending_changes: bool = False
         self.__create_file()
         self.load_data()
 
@@ -25,13 +27,47 @@ class JsonFile:
         except Exception as error:
             print(f"{self.file_name}.JsonFile.load_data: {error}")
 
+    def __write_file(self, data: dict) -> None:
+        # Write next to the file and swap it in, a crash mid write can no longer leave a half written file
+        file_path = f"{self.FOLDER_LOCATION}/{self.file_name}.json"
+        with open(f"{file_path}.tmp", "w", encoding="utf-8") as json_file:
+            json.dump(data, json_file, ensure_ascii=False, indent=4)
+        os.replace(f"{file_path}.tmp", file_path)
+
     def __save_data(self) -> None:
-        with open(f"{self.FOLDER_LOCATION}/{self.file_name}.json", "w", encoding="utf-8") as json_file:
-            json.dump(self.data, json_file, ensure_ascii=False, indent=4)
+        if self.transaction_depth:
+            self.has_pending_changes = True
+            return
+        self.__write_file(self.data)
 
     def save_data(self, data: dict) -> None:
-        with open(f"{self.FOLDER_LOCATION}/{self.file_name}.json", "w", encoding="utf-8") as json_file:
-            json.dump(data, json_file, ensure_ascii=False, indent=4)
+        self.__write_file(data)
+
+    @contextlib.contextmanager
+    def transaction(self):
+        """Defers saving until the outermost block exits, if it raises the in memory data is rolled back and nothing is written."""
+        if self.transaction_depth:
+            self.transaction_depth += 1
+            try:
+                yield self
+            finally:
+                self.transaction_depth -= 1
+            return
+
+        original_data = json.loads(json.dumps(self.data))
+        self.transaction_depth = 1
+        self.has_pending_changes = False
+        try:
+            yield self
+        except BaseException:
+            self.data = original_data
+            self.has_pending_changes = False
+            raise
+        finally:
+            self.transaction_depth = 0
+        if self.has_pending_changes:
+            self.has_pending_changes = False
+            self.__write_file(self.data)
 
     def add_item(self, item_name: str, value) -> None:
         self.data.update({item_name: value})
@@ -0,0 +1,31 @@
+def escape_pointer_token(token: str) -> str:
+    return str(token).replace("~", "~0").replace("/", "~1")
+
+
+def make_json_patch(old: object, new: object, path: str = "") -> list[dict[str, object]]:
+    """RFC 6902 operations that turn old into new.
+
+    Dicts are compared key by key and lists of the same length item by item,
+    anything else that differs (including lists that grew or shrank) is replaced as a whole.
+    Values of different types always differ, 1 == 1.0 == True in Python but not once they are serialized.
+    """
+    if type(old) is not type(new):
+        return [{"op": "replace", "path": path, "value": new}]
+    if isinstance(old, dict):
+        patch: list[dict[str, object]] = []
+        for key, old_value in old.items():
+            key_path = f"{path}/{escape_pointer_token(key)}"
+            if key not in new:
+                patch.append({"op": "remove", "path": key_path})
+            else:
+                patch.extend(make_json_patch(old_value, new[key], key_path))
+        patch.extend({"op": "add", "path": f"{path}/{escape_pointer_token(key)}", "value": value} for key, value in new.items() if key not in old)
+        return patch
+    if isinstance(old, list) and len(old) == len(new):
+        patch = []
+        for index, (old_value, new_value) in enumerate(zip(old, new)):
+            patch.extend(make_json_patch(old_value, new_value, f"{path}/{index}"))
+        return patch
+    if old != new:
+        return [{"op": "replace", "path": path, "value": new}]
+    return []
@@ -1,34 +1,128 @@
+from typing import Callable
+
 import ujson as json
-from natsort import natsorted
 
 from utils.inventory.category import Category
 from utils.inventory.inventory import Inventory
+from utils.inventory.item_index import ItemIndex
+from utils.inventory.stock_columns import StockColumns, get_column
 from utils.laser_cut_inventory.laser_cut_part import LaserCutPart
+from utils.natural_sort import insert_natural_sorted, natural_sorted
 from utils.paint_inventory.paint_inventory import PaintInventory
 from utils.workspace.workspace_settings import WorkspaceSettings
 
 
+class LaserCutPartRecord:
+    """A laser cut part as it was read from disk, it only becomes a LaserCutPart once a row needs to be rendered or edited."""
+
+    def __init__(self, name: str, data: dict[str, object], categories: list[Category]):
+        self.name = name
+        self.data = data
+        self.categories = categories
+        self.category_names = [category.name for category in categories]
+        self.material: str = data.get("material", "")
+        self.gauge: str = data.get("gauge", "")
+        self.price: float = data.get("price", 0.0)
+        self.machine_time: float = data.get("machine_time", 0.0)
+        self.weight: float = data.get("weight", 0.0)
+        self.quantity: float = data.get("quantity", 0)
+        self.red_quantity_limit: int = data.get("red_quantity_limit", 10)
+        self.yellow_quantity_limit: int = data.get("yellow_quantity_limit", 20)
+
+    def get_data(self) -> dict[str, object]:
+        category_names = [category.name for category in self.categories]
+        if category_names == self.category_names:
+            return self.data
+        # A category was renamed since the record was read
+        renamed_categories = dict(zip(self.category_names, category_names))
+        data = self.data.copy()
+        data["categories"] = category_names
+        data["category_quantities"] = {renamed_categories.get(category_name, category_name): unit_quantity for category_name, unit_quantity in self.data.get("category_quantities", {}).items()}
+        return data
+
+    def set_price(self, price: float):
+        # The storage cache may hold the data that was read, so it is copied rather than changed in place
+        self.data = self.data | {"price": price}
+        self.price = price
+
+
 class LaserCutInventory(Inventory):
+    SORT_VALUES = {
+        "quantity": lambda entry: entry.quantity,
+    }
+
     def __init__(self, parent):
         super().__init__("laser_cut_inventory")
         self.parent = parent
         self.paint_inventory: PaintInventory = self.parent.paint_inventory
         self.workspace_settings: WorkspaceSettings = self.parent.workspace_settings
 
-        self.laser_cut_parts: list[LaserCutPart] = []
-        self.recut_parts: list[LaserCutPart] = []
+        self.laser_cut_part_entries: list[LaserCutPart | LaserCutPartRecord] = []
+        self.recut_part_entries: list[LaserCutPart | LaserCutPartRecord] = []
+        self.laser_cut_parts_by_name = self.add_item_index(lambda entry: entry.name)
+        self.recut_parts_by_name = self.add_item_index(lambda entry: entry.name)
+        self.stock_costs = self.add_stock_cost_totals(lambda entry: entry.price * entry.quantity)
+        self.recut_stock_costs = self.add_stock_cost_totals(lambda entry: entry.price * entry.quantity)
+        # id(entries) -> id(record) -> position of every record still in that list, dropped whenever entries are added, removed or sorted
+        self.record_positions: dict[int, dict[int, int]] = {}
         self.load_data()
 
+    @property
+    def laser_cut_parts(self) -> list[LaserCutPart]:
+        return self.load_entries(self.laser_cut_part_entries)
+
+    @property
+    def recut_parts(self) -> list[LaserCutPart]:
+        return self.load_entries(self.recut_part_entries)
+
+    def load_entry(self, entries: list[LaserCutPart | LaserCutPartRecord], index: int) -> LaserCutPart:
+        entry = entries[index]
+        if isinstance(entry, LaserCutPartRecord):
+            record = entry
+            entry = LaserCutPart(record.name, record.get_data(), self)
+            entries[index] = entry
+            self.record_positions.get(id(entries), {}).pop(id(record), None)
+            self.laser_cut_parts_by_name.replace(record, entry)
+            self.recut_parts_by_name.replace(record, entry)
+            self.categories.category_items.replace(record, entry)
+            self.stock_costs.replace(record, entry)
+            self.recut_stock_costs.replace(record, entry)
+        return entry
+
+    def load_entries(self, entries: list[LaserCutPart | LaserCutPartRecord], indexes: list[int] = None) -> list[LaserCutPart]:
+        if indexes is None:
+            indexes = range(len(entries))
+        return [self.load_entry(entries, index) for index in indexes]
+
+    def get_entry_position(self, entries: list[LaserCutPart | LaserCutPartRecord], entry: LaserCutPart | LaserCutPartRecord) -> int:
+        if not isinstance(entry, LaserCutPartRecord):
+            return entries.index(entry)
+        if (positions := self.record_positions.get(id(entries))) is None:
+            positions = {id(record): index for index, record in enumerate(entries) if isinstance(record, LaserCutPartRecord)}
+            self.record_positions[id(entries)] = positions
+        return positions[id(entry)]
+
     def get_all_part_names(self) -> list[str]:
-        return [laser_cut_part.name for laser_cut_part in self.laser_cut_parts]
+        return [entry.name for entry in self.laser_cut_part_entries]
+
+    def get_stock_columns(self, recut: bool = False) -> StockColumns:
+        """Records are read as they are, so this does not load any part."""
+        entries = self.recut_part_entries if recut else self.laser_cut_part_entries
+        quantities = get_column(entries, lambda entry: entry.quantity)
+        return StockColumns(entries, quantities, get_column(entries, lambda entry: entry.price) * quantities)
 
     def get_laser_cut_parts_by_category(self, category: str | Category) -> list[LaserCutPart]:
         if isinstance(category, str):
             category = self.get_category(category)
         if category.name == "Recut":
             return self.recut_parts
-        else:
-            return [laser_cut_part for laser_cut_part in self.laser_cut_parts if category in laser_cut_part.categories]
+        category_entries = self.get_items_in_category(category)
+        if any(isinstance(entry, LaserCutPartRecord) for entry in category_entries):
+            for entry in category_entries:
+                if isinstance(entry, LaserCutPartRecord):
+                    self.load_entry(self.laser_cut_part_entries, self.get_entry_position(self.laser_cut_part_entries, entry))
+            category_entries = self.get_items_in_category(category)
+        return category_entries
 
     def get_group_categories(self, laser_cut_parts: list[LaserCutPart]) -> dict[str, list[LaserCutPart]]:
         group: dict[str, list[LaserCutPart]] = {}
@@ -37,31 +131,62 @@ class LaserCutInventory(Inventory):
             group.setdefault(group_name, [])
             group[group_name].append(laser_cut_part)
 
-        return {key: group[key] for key in natsorted(group.keys())}
+        return {key: group[key] for key in natural_sorted(group, lambda group_name: group_name)}
 
     def get_category_parts_total_stock_cost(self, category: Category):
-        total_stock_cost = 0.0
-        for laser_cut_part in self.get_laser_cut_parts_by_category(category):
-            total_stock_cost += laser_cut_part.price * laser_cut_part.quantity
-        return total_stock_cost
+        if category.name == "Recut":
+            return self.get_recut_parts_total_stock_cost()
+        return self.stock_costs.get_category_total(category)
+
+    def get_category_stock_costs(self) -> dict[Category, float]:
+        return {category: self.get_category_parts_total_stock_cost(category) for category in self.get_categories()}
 
     def get_recut_parts_total_stock_cost(self) -> float:
-        total_stock_cost = 0.0
-        for recut_part in self.recut_parts:
-            total_stock_cost += recut_part.price * recut_part.quantity
-        return total_stock_cost
+        return self.recut_stock_costs.total
+
+    def update_prices(self, get_price: Callable[[LaserCutPart | LaserCutPartRecord], float]):
+        """Sets the price of every laser cut part, get_price only gets to read material, machine_time and weight so records stay unloaded."""
+        for entry in self.laser_cut_part_entries:
+            price = get_price(entry)
+            if isinstance(entry, LaserCutPartRecord):
+                entry.set_price(price)
+                self.item_stock_cost_changed(entry)
+            else:
+                entry.price = price
+
+    def add_entry(self, entries: list[LaserCutPart | LaserCutPartRecord], laser_cut_part: LaserCutPart):
+        self.record_positions.pop(id(entries), None)
+        if self.sort_order is None:
+            entries.append(laser_cut_part)
+        else:
+            sort_name, reverse = self.sort_order
+            insert_natural_sorted(entries, laser_cut_part, self.SORT_VALUES[sort_name], reverse)
 
     def add_laser_cut_part(self, laser_cut_part: LaserCutPart):
-        self.laser_cut_parts.append(laser_cut_part)
+        self.add_entry(self.laser_cut_part_entries, laser_cut_part)
+        self.laser_cut_parts_by_name.add(laser_cut_part)
+        self.categories.category_items.add(laser_cut_part)
+        if self.sort_order is not None:
+            self.categories.category_items.reorder(self.laser_cut_part_entries)
+        self.stock_costs.add(laser_cut_part)
 
     def remove_laser_cut_part(self, laser_cut_part: LaserCutPart):
-        self.laser_cut_parts.remove(laser_cut_part)
+        self.laser_cut_part_entries.remove(laser_cut_part)
+        self.record_positions.pop(id(self.laser_cut_part_entries), None)
+        self.laser_cut_parts_by_name.remove(laser_cut_part)
+        self.categories.category_items.remove(laser_cut_part)
+        self.stock_costs.remove(laser_cut_part)
 
     def add_recut_part(self, laser_cut_part: LaserCutPart):
-        self.recut_parts.append(laser_cut_part)
+        self.add_entry(self.recut_part_entries, laser_cut_part)
+        self.recut_parts_by_name.add(laser_cut_part)
+        self.recut_stock_costs.add(laser_cut_part)
 
     def remove_recut_part(self, laser_cut_part: LaserCutPart):
-        self.recut_parts.remove(laser_cut_part)
+        self.recut_part_entries.remove(laser_cut_part)
+        self.record_positions.pop(id(self.recut_part_entries), None)
+        self.recut_parts_by_name.remove(laser_cut_part)
+        self.recut_stock_costs.remove(laser_cut_part)
 
     def duplicate_category(self, category_to_duplicate: Category, new_category_name: str) -> Category:
         new_category = Category(new_category_name)
@@ -71,44 +196,54 @@ class LaserCutInventory(Inventory):
         return new_category
 
     def delete_category(self, category: str | Category) -> Category:
+        laser_cut_parts = self.get_laser_cut_parts_by_category(category)
         deleted_category = super().delete_category(category)
-        for laser_cut_part in self.get_laser_cut_parts_by_category(deleted_category):
+        for laser_cut_part in laser_cut_parts:
             laser_cut_part.remove_from_category(deleted_category)
         return deleted_category
 
+    def get_entry_by_name(self, entries: list[LaserCutPart | LaserCutPartRecord], item_index: ItemIndex, name: str) -> LaserCutPart:
+        entry = item_index.get(name)
+        if isinstance(entry, LaserCutPartRecord):
+            return self.load_entry(entries, self.get_entry_position(entries, entry))
+        return entry
+
     def get_laser_cut_part_by_name(self, laser_cut_part_name: str) -> LaserCutPart:
-        return next(
-            (laser_cut_part for laser_cut_part in self.laser_cut_parts if laser_cut_part.name == laser_cut_part_name),
-            None,
-        )
+        return self.get_entry_by_name(self.laser_cut_part_entries, self.laser_cut_parts_by_name, laser_cut_part_name)
 
     def get_recut_part_by_name(self, recut_part_name: str) -> LaserCutPart:
-        return next(
-            (recut_part for recut_part in self.recut_parts if recut_part.name == recut_part_name),
-            None,
-        )
+        return self.get_entry_by_name(self.recut_part_entries, self.recut_parts_by_name, recut_part_name)
 
     def sort_by_quantity(self) -> list[LaserCutPart]:
-        self.laser_cut_parts = natsorted(self.laser_cut_parts, key=lambda laser_cut_part: laser_cut_part.quantity)
-        self.recut_parts = natsorted(self.recut_parts, key=lambda recut_part: recut_part.quantity)
+        self.sort_entries("quantity")
+
+    def sort_entries(self, sort_name: str, reverse: bool = False):
+        if self.sort_order == (sort_name, reverse):
+            return
+        self.laser_cut_part_entries = natural_sorted(self.laser_cut_part_entries, self.SORT_VALUES[sort_name], reverse)
+        self.recut_part_entries = natural_sorted(self.recut_part_entries, self.SORT_VALUES[sort_name], reverse)
+        self.record_positions.clear()
+        self.categories.category_items.reorder(self.laser_cut_part_entries)
+        self.sort_order = (sort_name, reverse)
 
-    def save(self):
-        with open(f"{self.FOLDER_LOCATION}/{self.filename}.json", "w", encoding="utf-8") as file:
-            json.dump(self.to_dict(), file, ensure_ascii=False, indent=4)
+    def get_record(self, name: str, data: dict[str, object]) -> LaserCutPartRecord:
+        category_names = set(data.get("categories", []))
+        return LaserCutPartRecord(name, data, [category for category in self.get_categories() if category.name in category_names])
 
     def load_data(self):
         try:
-            with open(f"{self.FOLDER_LOCATION}/{self.filename}.json", "r", encoding="utf-8") as file:
-                data: dict[str, dict[str, object]] = json.load(file)
+            data: dict[str, dict[str, object]] = self._read_data()
             self.categories.from_dict(data["categories"])
-            self.laser_cut_parts.clear()
-            self.recut_parts.clear()
-            for laser_cut_part_name, laser_cut_part_data in data["laser_cut_parts"].items():
-                laser_cut_part = LaserCutPart(laser_cut_part_name, laser_cut_part_data, self)
-                self.add_laser_cut_part(laser_cut_part)
-            for recut_part_name, recut_part_data in data["recut_parts"].items():
-                recut_part = LaserCutPart(recut_part_name, recut_part_data, self)
-                self.add_recut_part(recut_part)
+            self.laser_cut_part_entries = [self.get_record(laser_cut_part_name, laser_cut_part_data) for laser_cut_part_name, laser_cut_part_data in data["laser_cut_parts"].items()]
+            self.recut_part_entries = [self.get_record(recut_part_name, recut_part_data) for recut_part_name, recut_part_data in data["recut_parts"].items()]
+            self.sort_order = None
+            self.record_positions.clear()
+            self.laser_cut_parts_by_name.rebuild(self.laser_cut_part_entries)
+            self.recut_parts_by_name.rebuild(self.recut_part_entries)
+            self.categories.category_items.rebuild(self.laser_cut_part_entries)  # Recut parts are listed under the Recut category instead
+            self.stock_costs.rebuild(self.laser_cut_part_entries, self.get_stock_columns().stock_costs)
+            self.recut_stock_costs.rebuild(self.recut_part_entries, self.get_stock_columns(recut=True).stock_costs)
+            self._update_storage_cache()
 
         except KeyError:  # Inventory was just created
             return
@@ -121,8 +256,9 @@ class LaserCutInventory(Inventory):
             "laser_cut_parts": {},
             "recut_parts": {},
         }
-        for laser_cut_part in self.laser_cut_parts:
-            data["laser_cut_parts"].update({laser_cut_part.name: laser_cut_part.to_dict()})
-        for recut_part in self.recut_parts:
-            data["recut_parts"].update({recut_part.name: recut_part.to_dict()})
+        # Records nobody touched are written back exactly as they were read
+        for entry in self.laser_cut_part_entries:
+            data["laser_cut_parts"].update({entry.name: entry.get_data() if isinstance(entry, LaserCutPartRecord) else entry.to_dict()})
+        for entry in self.recut_part_entries:
+            data["recut_parts"].update({entry.name: entry.get_data() if isinstance(entry, LaserCutPartRecord) else entry.to_dict()})
         return data
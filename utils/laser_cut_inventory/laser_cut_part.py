@@ -15,8 +15,67 @@ if TYPE_CHECKING:
 
 
 class LaserCutPart(InventoryItem):
+    # Parts are copied into every quote, nest and job, a __dict__ per copy adds up
+    __slots__ = (
+        "laser_cut_inventory",
+        "paint_inventory",
+        "workspace_settings",
+        "red_quantity_limit",
+        "yellow_quantity_limit",
+        "category_quantities",
+        "machine_time",
+        "weight",
+        "part_number",
+        "image_index",
+        "surface_area",
+        "cutting_length",
+        "file_name",
+        "piercing_time",
+        "piercing_points",
+        "gauge",
+        "material",
+        "recut",
+        "custom",
+        "recut_count",
+        "shelf_number",
+        "sheet_dim",
+        "part_dim",
+        "geofile_name",
+        "modified_date",
+        "notes",
+        "cost_of_goods",
+        "bend_cost",
+        "labor_cost",
+        "uses_primer",
+        "primer_name",
+        "primer_item",
+        "primer_overspray",
+        "cost_for_primer",
+        "uses_paint",
+        "paint_name",
+        "paint_item",
+        "paint_overspray",
+        "cost_for_paint",
+        "uses_powder",
+        "powder_name",
+        "powder_item",
+        "powder_transfer_efficiency",
+        "cost_for_powder_coating",
+        "flow_tag",
+        "bending_files",
+        "welding_files",
+        "cnc_milling_files",
+        "unit_price",
+        "nest",
+        "quoted_price",
+        "quantity_in_nest",
+        "matched_to_sheet_cost_price",
+        "_quantity",
+        "_price",
+    )
+
     def __init__(self, name: str, data: dict, laser_cut_inventory):
-        super().__init__(name)
+        super().__init__(name, laser_cut_inventory)
 
         self.laser_cut_inventory: LaserCutInventory = laser_cut_inventory
         self.paint_inventory: PaintInventory = self.laser_cut_inventory.paint_inventory
@@ -90,6 +149,25 @@ class LaserCutPart(InventoryItem):
 
         self.load_data(data)
 
+    # The stock cost is computed from these
+    @property
+    def quantity(self) -> int:
+        return self._quantity
+
+    @quantity.setter
+    def quantity(self, quantity: int):
+        self._quantity = quantity
+        self.stock_cost_changed()
+
+    @property
+    def price(self) -> float:
+        return self._price
+
+    @price.setter
+    def price(self, price: float):
+        self._price = price
+        self.stock_cost_changed()
+
     def move_to_category(self, from_category: Category, to_category: Category):
         super().remove_from_category(from_category)
         self.add_to_category(to_category)
@@ -184,9 +262,18 @@ class LaserCutPart(InventoryItem):
         for category in self.laser_cut_inventory.get_categories():
             if category.name in categories:
                 self.categories.append(category)
+        self.categories_changed()
 
     def get_copy(self) -> "LaserCutPart":
-        return copy.deepcopy(self)
+        laser_cut_part_copy: LaserCutPart = super().get_copy()
+        laser_cut_part_copy.category_quantities = self.category_quantities.copy()
+        laser_cut_part_copy.bending_files = self.bending_files.copy()
+        laser_cut_part_copy.welding_files = self.welding_files.copy()
+        laser_cut_part_copy.cnc_milling_files = self.cnc_milling_files.copy()
+        if self.flow_tag is not None:  # The tags themselves belong to the workspace settings
+            laser_cut_part_copy.flow_tag = copy.copy(self.flow_tag)
+            laser_cut_part_copy.flow_tag.tags = self.flow_tag.tags.copy()
+        return laser_cut_part_copy
 
     def to_dict(self) -> dict[str, dict]:
         return {
@@ -0,0 +1,49 @@
+from typing import Generic, Iterable, TypeVar
+
+T = TypeVar("T")
+
+
+class NameIndex(Generic[T]):
+    """Finds settings objects (materials, tags, flow tag groups, ...) by name without walking the list they live in.
+
+    The owner calls add(), remove() or clear() along with every change to its items and mark_stale() after renaming one,
+    the index is only rebuilt from the items once it was marked stale, so a miss on an up to date index is just a miss.
+    A hit is still checked against the item's current name in case it was renamed without telling the owner.
+    If several items share a name, get() returns the first one, like the linear scans it replaces.
+    """
+
+    def __init__(self, items: Iterable[T]):
+        self.items = items
+        self.items_by_name: dict[str, T] = {}
+        self.is_stale: bool = True
+
+    def clear(self):
+        self.items_by_name.clear()
+        self.is_stale = True
+
+    def mark_stale(self):
+        self.is_stale = True
+
+    def rebuild(self):
+        self.items_by_name.clear()
+        for item in self.items:
+            self.items_by_name.setdefault(item.name, item)
+        self.is_stale = False
+
+    def add(self, item: T):
+        self.items_by_name.setdefault(item.name, item)
+
+    def remove(self, item: T):
+        # Entries under names the item had before are harmless, get() never returns an item whose name does not match
+        if self.items_by_name.get(item.name) is item:
+            del self.items_by_name[item.name]
+            self.is_stale = True  # Another item may share the name
+
+    def get(self, name: str) -> T | None:
+        if self.is_stale:
+            self.rebuild()
+        item = self.items_by_name.get(name)
+        if item is not None and item.name != name:  # Renamed behind the owner's back
+            self.rebuild()
+            item = self.items_by_name.get(name)
+        return item
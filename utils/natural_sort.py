@@ -0,0 +1,37 @@
+from functools import lru_cache
+from typing import Callable, Hashable, Iterable, TypeVar
+
+from natsort import natsort_keygen
+
+T = TypeVar("T")
+
+natsort_key = natsort_keygen()
+
+
+@lru_cache(maxsize=65536)
+def get_natural_sort_key(value: Hashable) -> tuple:
+    """The key natsorted() sorts value by, computed once per distinct name or quantity."""
+    return natsort_key(value)
+
+
+def natural_sorted(items: Iterable[T], get_value: Callable[[T], Hashable], reverse: bool = False) -> list[T]:
+    """Same order as natsorted(items, key=get_value, reverse=reverse)."""
+    return sorted(items, key=lambda item: get_natural_sort_key(get_value(item)), reverse=reverse)
+
+
+def insert_natural_sorted(items: list[T], item: T, get_value: Callable[[T], Hashable], reverse: bool = False) -> int:
+    """Inserts item into items that are already natural_sorted() the same way, after any items with an equal value.
+
+    Returns the index it was inserted at.
+    """
+    item_key = get_natural_sort_key(get_value(item))
+    low, high = 0, len(items)
+    while low < high:
+        middle = (low + high) // 2
+        middle_key = get_natural_sort_key(get_value(items[middle]))
+        if middle_key < item_key if reverse else item_key < middle_key:
+            high = middle
+        else:
+            low = middle + 1
+    items.insert(low, item)
+    return low
@@ -6,7 +6,7 @@ from utils.inventory.inventory_item import InventoryItem
 
 class Paint(InventoryItem):
     def __init__(self, name: str, data: dict[str, str | float], paint_inventory) -> None:
-        super().__init__(name)
+        super().__init__(name, paint_inventory)
         self.paint_inventory = paint_inventory
         self.component: Component = None
         self.color: str = "#ffffff"
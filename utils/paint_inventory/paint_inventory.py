@@ -23,19 +23,22 @@ class PaintInventory(Inventory):
         self.primers: list[Primer] = []
         self.paints: list[Paint] = []
         self.powders: list[Powder] = []
+        self.primers_by_name = self.add_item_index(lambda primer: primer.name)
+        self.paints_by_name = self.add_item_index(lambda paint: paint.name)
+        self.powders_by_name = self.add_item_index(lambda powder: powder.name)
 
         self.load_data()
 
     def add_primer(self, primer: Primer):
         self.primers.append(primer)
+        self.primers_by_name.add(primer)
 
     def remove_primer(self, primer: Primer):
         self.primers.remove(primer)
+        self.primers_by_name.remove(primer)
 
     def get_primer(self, name: str) -> Primer:
-        for primer in self.primers:
-            if primer.name == name:
-                return primer
+        return self.primers_by_name.get(name)
 
     def get_all_primers(self) -> list[str]:
         return [primer.name for primer in self.primers]
@@ -51,14 +54,14 @@ class PaintInventory(Inventory):
 
     def add_paint(self, paint: Paint):
         self.paints.append(paint)
+        self.paints_by_name.add(paint)
 
     def remove_paint(self, paint: Paint):
         self.paints.remove(paint)
+        self.paints_by_name.remove(paint)
 
     def get_paint(self, name: str) -> Paint:
-        for paint in self.paints:
-            if paint.name == name:
-                return paint
+        return self.paints_by_name.get(name)
 
     def get_all_paints(self) -> list[str]:
         return [paint.name for paint in self.paints]
@@ -74,14 +77,14 @@ class PaintInventory(Inventory):
 
     def add_powder(self, powder: Powder):
         self.powders.append(powder)
+        self.powders_by_name.add(powder)
 
     def remove_powder(self, powder: Powder):
         self.powders.remove(powder)
+        self.powders_by_name.remove(powder)
 
     def get_powder(self, name: str) -> Powder:
-        for powder in self.powders:
-            if powder.name == name:
-                return powder
+        return self.powders_by_name.get(name)
 
     def get_all_powders(self) -> list[str]:
         return [powder.name for powder in self.powders]
@@ -95,24 +98,23 @@ class PaintInventory(Inventory):
                     return estimated_lbs_needed * powder.component.price
         return 0.0
 
-    def save(self):
-        with open(f"{self.FOLDER_LOCATION}/{self.filename}.json", "w", encoding="utf-8") as file:
-            json.dump(self.to_dict(), file, ensure_ascii=False, indent=4)
-
     def load_data(self):
         try:
-            with open(f"{self.FOLDER_LOCATION}/{self.filename}.json", "r", encoding="utf-8") as file:
-                data: dict[str, dict[str, object]] = json.load(file)
+            data: dict[str, dict[str, object]] = self._read_data()
             self.categories.from_dict(["Primer", "Paint", "Powder"])
             self.primers.clear()
+            self.primers_by_name.clear()
             self.paints.clear()
+            self.paints_by_name.clear()
             self.powders.clear()
+            self.powders_by_name.clear()
             for primer_name, primer_data in data["primers"].items():
                 self.add_primer(Primer(primer_name, primer_data, self))
             for paint_name, paint_data in data["paints"].items():
                 self.add_paint(Paint(paint_name, paint_data, self))
             for powder_name, powder_data in data["powders"].items():
                 self.add_powder(Powder(powder_name, powder_data, self))
+            self._update_storage_cache()
         except KeyError:  # Inventory was just created
             return
         except json.JSONDecodeError:  # Inventory file got cleared
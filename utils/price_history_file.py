@@ -1,44 +1,85 @@
+import os
+import sqlite3
+import threading
+from datetime import datetime
+
 from openpyxl import Workbook, load_workbook
 
 
 class PriceHistoryFile:
+    """Price changes kept in data/price_history.db, indexed by part number and date.
+
+    Every price assessment period (file_name, e.g. "May 01 Wednesday 2024.xlsx") is a slice of the same table,
+    export_xlsx() writes a period out to the "Price History Files" directory.
+    add_new() only buffers the change, they are written in batches of BATCH_SIZE or when flush() is called.
+    The connection is shared between threads, every use of it (reads included) holds lock.
+    """
+
+    DATABASE_PATH: str = "data/price_history.db"
+    DATE_FORMAT: str = "%B %d %A %Y %I:%M:%S %p"
+    BATCH_SIZE: int = 100
+    COLUMNS: tuple[str, ...] = ("Date", "Part Name", "Part #", "Old Price", "New Price")
+
     def __init__(self, file_name: str) -> None:
         self.file_name = file_name
-        self.row_pos: int = 0
+        self.lock = threading.Lock()
+        self.pending_changes: list[tuple[str, str, str, str, str, float, float]] = []
+        self.connection = sqlite3.connect(self.DATABASE_PATH, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.create_tables()
+        self.import_xlsx()
+
+    def create_tables(self) -> None:
+        with self.connection:
+            self.connection.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS price_changes (
+                    id INTEGER PRIMARY KEY,
+                    assessment TEXT NOT NULL,
+                    timestamp TEXT NOT NULL,
+                    date TEXT,
+                    part_name TEXT,
+                    part_number TEXT,
+                    old_price REAL,
+                    new_price REAL
+                );
+                CREATE INDEX IF NOT EXISTS price_changes_part_number ON price_changes (part_number, timestamp);
+                CREATE INDEX IF NOT EXISTS price_changes_timestamp ON price_changes (timestamp);
+                CREATE INDEX IF NOT EXISTS price_changes_assessment ON price_changes (assessment, id);
+                CREATE TABLE IF NOT EXISTS imported_files (file_name TEXT PRIMARY KEY);
+                """
+            )
+
+    def get_xlsx_path(self, file_name: str = None) -> str:
+        return f"Price History Files/{file_name or self.file_name}"
+
+    def get_timestamp(self, date: str | datetime) -> str:
+        if isinstance(date, datetime):
+            return date.isoformat(timespec="seconds")
         try:
-            self.workbook = load_workbook(f"Price History Files/{self.file_name}")
-            self.price_history_sheet = self.workbook["Price History"]
-        except Exception:
-            self.workbook = Workbook()
-            self.workbook.create_sheet("Price History", 0)
-            self.workbook.remove_sheet(self.workbook["Sheet"])
-            self.price_history_sheet = self.workbook["Price History"]
-            self.add_new("Date", "Part Name", "Part #", "Old Price", "New Price")
-        self.data = {
-            "Date": [],
-            "Part Name": [],
-            "Part Number": [],
-            "Old Price": [],
-            "New Price": [],
-        }
-        self.load_file()
-
-    def load_file(self) -> None:
-        self.row_pos = len(self.price_history_sheet["A"])
-
-        for cell in self.price_history_sheet["A"]:
-            self.data["Date"].append(cell.value)
-        for cell in self.price_history_sheet["B"]:
-            self.data["Part Name"].append(cell.value)
-        for cell in self.price_history_sheet["C"]:
-            self.data["Part Number"].append(cell.value)
-        for cell in self.price_history_sheet["D"]:
-            self.data["Old Price"].append(cell.value)
-        for cell in self.price_history_sheet["E"]:
-            self.data["New Price"].append(cell.value)
+            return datetime.strptime(str(date), self.DATE_FORMAT).isoformat(timespec="seconds")
+        except ValueError:
+            return datetime.now().isoformat(timespec="seconds")
 
-    def get_data_from_category(self) -> dict:
-        return self.data
+    def import_xlsx(self) -> None:
+        """One-shot import of an assessment file written before the database existed."""
+        if self.connection.execute("SELECT 1 FROM imported_files WHERE file_name = ?", (self.file_name,)).fetchone():
+            return
+        rows: list[tuple[str, str, str, str, str, float, float]] = []
+        if os.path.exists(self.get_xlsx_path()):
+            try:
+                workbook = load_workbook(self.get_xlsx_path(), read_only=True)
+                for date, part_name, part_number, old_price, new_price, *_ in workbook["Price History"].iter_rows(min_row=2, max_col=5, values_only=True):
+                    rows.append((self.file_name, self.get_timestamp(date), str(date), part_name, part_number, old_price, new_price))
+                workbook.close()
+            except Exception:
+                rows.clear()
+        with self.connection:
+            self.connection.executemany(
+                "INSERT INTO price_changes (assessment, timestamp, date, part_name, part_number, old_price, new_price) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self.connection.execute("INSERT INTO imported_files (file_name) VALUES (?)", (self.file_name,))
 
     def add_new(
         self,
@@ -50,9 +91,78 @@ class PriceHistoryFile:
     ) -> None:
         if old_price == new_price:
             return
-        self.price_history_sheet.cell(row=self.row_pos + 1, column=1, value=date)
-        self.price_history_sheet.cell(row=self.row_pos + 1, column=2, value=part_name)
-        self.price_history_sheet.cell(row=self.row_pos + 1, column=3, value=part_number)
-        self.price_history_sheet.cell(row=self.row_pos + 1, column=4, value=old_price)
-        self.price_history_sheet.cell(row=self.row_pos + 1, column=5, value=new_price)
-        self.workbook.save(f"Price History Files/{self.file_name}")
+        with self.lock:
+            self.pending_changes.append((self.file_name, self.get_timestamp(date), str(date), part_name, part_number, old_price, new_price))
+            needs_flush = len(self.pending_changes) >= self.BATCH_SIZE
+        if needs_flush:
+            self.flush()
+
+    def flush(self) -> None:
+        with self.lock:
+            self.write_pending_changes()
+
+    def write_pending_changes(self) -> None:
+        """Only call while holding lock."""
+        if not self.pending_changes:
+            return
+        with self.connection:
+            self.connection.executemany(
+                "INSERT INTO price_changes (assessment, timestamp, date, part_name, part_number, old_price, new_price) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                self.pending_changes,
+            )
+        self.pending_changes.clear()
+
+    def query(self, sql: str, parameters: tuple) -> list[tuple]:
+        with self.lock:
+            self.write_pending_changes()
+            return self.connection.execute(sql, parameters).fetchall()
+
+    def get_change_count(self) -> int:
+        return self.query("SELECT COUNT(*) FROM price_changes WHERE assessment = ?", (self.file_name,))[0][0]
+
+    def get_changes(self, start: int = 0, count: int = -1) -> list[tuple[str, str, str, float, float]]:
+        """Rows of this assessment period in the order they were added, as (date, part_name, part_number, old_price, new_price)."""
+        return self.query(
+            "SELECT date, part_name, part_number, old_price, new_price FROM price_changes WHERE assessment = ? ORDER BY id LIMIT ? OFFSET ?",
+            (self.file_name, count, start),
+        )
+
+    def get_part_history(self, part_number: str) -> list[tuple[str, str, str, float, float]]:
+        """Every price change of a part across all assessment periods, oldest first."""
+        return self.query(
+            "SELECT date, part_name, part_number, old_price, new_price FROM price_changes WHERE part_number = ? ORDER BY timestamp, id",
+            (part_number,),
+        )
+
+    def get_changes_between(self, start_date: datetime, end_date: datetime) -> list[tuple[str, str, str, float, float]]:
+        return self.query(
+            "SELECT date, part_name, part_number, old_price, new_price FROM price_changes WHERE timestamp BETWEEN ? AND ? ORDER BY timestamp, id",
+            (self.get_timestamp(start_date), self.get_timestamp(end_date)),
+        )
+
+    def get_data_from_category(self) -> dict:
+        # First row is the header, same as the first row of the exported sheet
+        data: dict[str, list] = {"Date": ["Date"], "Part Name": ["Part Name"], "Part Number": ["Part #"], "Old Price": ["Old Price"], "New Price": ["New Price"]}
+        for date, part_name, part_number, old_price, new_price in self.get_changes():
+            data["Date"].append(date)
+            data["Part Name"].append(part_name)
+            data["Part Number"].append(part_number)
+            data["Old Price"].append(old_price)
+            data["New Price"].append(new_price)
+        return data
+
+    def export_xlsx(self, file_name: str = None) -> str:
+        """Writes this assessment period to "Price History Files" and returns the path."""
+        file_path = self.get_xlsx_path(file_name)
+        workbook = Workbook(write_only=True)
+        price_history_sheet = workbook.create_sheet("Price History")
+        price_history_sheet.append(self.COLUMNS)
+        for row in self.get_changes():
+            price_history_sheet.append(row)
+        workbook.save(file_path)
+        return file_path
+
+    def close(self) -> None:
+        with self.lock:
+            self.write_pending_changes()
+            self.connection.close()
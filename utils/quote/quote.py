@@ -1,9 +1,8 @@
-from natsort import natsorted
-
 from utils.components_inventory.component import Component
 from utils.components_inventory.components_inventory import ComponentsInventory
 from utils.laser_cut_inventory.laser_cut_inventory import LaserCutInventory
 from utils.laser_cut_inventory.laser_cut_part import LaserCutPart
+from utils.natural_sort import natural_sorted
 from utils.quote.nest import Nest
 from utils.sheet_settings.sheet_settings import SheetSettings
 
@@ -101,10 +100,10 @@ class Quote:
         self.nests.remove(nest)
 
     def sort_nests(self):
-        self.nests = natsorted(self.nests, key=lambda nest: nest.name)
+        self.nests = natural_sorted(self.nests, lambda nest: nest.name)
 
     def sort_laser_cut_parts(self):
-        self.grouped_laser_cut_parts = natsorted(self.grouped_laser_cut_parts, key=lambda laser_cut_part: laser_cut_part.name)
+        self.grouped_laser_cut_parts = natural_sorted(self.grouped_laser_cut_parts, lambda laser_cut_part: laser_cut_part.name)
 
     def load_settings(self, data: dict[str, dict[str, str | bool | float]]):
         # * Nest, Sheet, Item Quoting Settings
@@ -0,0 +1,67 @@
+import threading
+from typing import TYPE_CHECKING, Callable
+
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+if TYPE_CHECKING:
+    from utils.inventory.inventory import Inventory
+
+
+class SaveScheduler(QObject):
+    """Coalesces inventory saves and uploads.
+
+    Inventory.save() only marks the inventory dirty and sync_changes() only queues the files, once nothing was saved for QUIET_PERIOD
+    milliseconds flush() writes every dirty inventory once and uploads all queued files in a single upload.
+    """
+
+    QUIET_PERIOD: int = 1000
+    restart_timer = pyqtSignal()
+
+    def __init__(self, parent, upload_files: Callable[[list[str]], None]) -> None:
+        super().__init__(parent)
+        self.upload_files = upload_files
+        self.lock = threading.RLock()
+        self.dirty_inventories: dict["Inventory", None] = {}
+        self.pending_uploads: dict[str, None] = {}
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(self.QUIET_PERIOD)
+        self.timer.timeout.connect(self.flush)
+        # Saves can come from worker threads, the signal hops back to the thread that owns the timer
+        self.restart_timer.connect(self.timer.start)
+
+    def mark_dirty(self, inventory: "Inventory"):
+        with self.lock:
+            self.dirty_inventories[inventory] = None
+        self.restart_timer.emit()
+
+    def schedule_upload(self, files: list[str]):
+        with self.lock:
+            self.pending_uploads.update(dict.fromkeys(files))
+        self.restart_timer.emit()
+
+    def is_dirty(self, inventory: "Inventory") -> bool:
+        with self.lock:
+            return inventory in self.dirty_inventories
+
+    def flush_saves(self, inventories: list["Inventory"] = None):
+        with self.lock:
+            if inventories is None:
+                inventories_to_save = list(self.dirty_inventories)
+                self.dirty_inventories.clear()
+            else:
+                inventories_to_save = [inventory for inventory in inventories if inventory in self.dirty_inventories]
+                for inventory in inventories_to_save:
+                    del self.dirty_inventories[inventory]
+            for inventory in inventories_to_save:
+                inventory.save_now()
+
+    def flush(self):
+        self.timer.stop()
+        self.flush_saves()
+        with self.lock:
+            files_to_upload = list(self.pending_uploads)
+            self.pending_uploads.clear()
+        if files_to_upload:
+            self.upload_files(files_to_upload)
@@ -0,0 +1,197 @@
+import gzip
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from utils.settings import Settings
+
+
+class EndpointMetrics:
+    def __init__(self):
+        self.request_count: int = 0
+        self.failure_count: int = 0
+        self.total_seconds: float = 0.0
+        self.max_seconds: float = 0.0
+
+    def add(self, seconds: float, failed: bool):
+        self.request_count += 1
+        self.failure_count += failed
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+
+    def get_average_seconds(self) -> float:
+        return self.total_seconds / self.request_count if self.request_count else 0.0
+
+    def to_dict(self) -> dict[str, float]:
+        return {
+            "request_count": self.request_count,
+            "failure_count": self.failure_count,
+            "average_seconds": self.get_average_seconds(),
+            "max_seconds": self.max_seconds,
+        }
+
+
+class ServerClient:
+    """Process-wide HTTP client for the server, every ServerClient() returns the same instance.
+
+    All threads share one keep-alive connection pool, so only the first request to the server pays for the TCP handshake.
+    requests.Session is not thread safe, each thread gets its own session mounted on the shared adapter (and pool).
+    Requests take a path like "/get_jobs", the server address is read from Settings once and again only when it is changed.
+    Absolute URLs to other hosts (like the update server) get a pool of their own that never retries, a host that is down
+    should fail once instead of holding the thread for every retry and backoff meant for the inventory server.
+
+    Responses are gzip encoded whenever the server wants to, requests decodes them.
+    Request bodies are only gzipped (request(..., compress=True)) once the server has listed gzip in the Accept-Encoding
+    header of a response (RFC 7694), a 415 answer to a compressed body turns this off and the request is sent again as it is.
+    """
+
+    # Sized for the most requests the threads have in flight at once
+    MAX_CONNECTIONS: int = 8
+    # (connect, read) seconds
+    TIMEOUT: tuple[float, float] = (5.0, 10.0)
+    # Smaller bodies fit in a packet or two either way
+    MIN_COMPRESS_SIZE: int = 1024
+    COMPRESS_LEVEL: int = 6
+    # Connection errors are retried for every method since the request never reached the server,
+    # read errors and gateway errors only for the methods that are safe to send twice
+    RETRY = Retry(
+        total=3,
+        connect=3,
+        read=2,
+        status=2,
+        backoff_factor=0.5,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset({"GET", "HEAD", "OPTIONS"}),
+        raise_on_status=False,
+    )
+    _instance: "ServerClient" = None
+    _instance_lock = threading.Lock()
+
+    def __new__(cls) -> "ServerClient":
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = super().__new__(cls)
+                cls._instance.initialized = False
+            return cls._instance
+
+    def __init__(self) -> None:
+        if self.initialized:
+            return
+        self.initialized = True
+        self.settings = Settings()
+        self.adapter = HTTPAdapter(pool_connections=self.MAX_CONNECTIONS, pool_maxsize=self.MAX_CONNECTIONS, max_retries=self.RETRY)
+        self.external_adapter = HTTPAdapter(max_retries=0)
+        self.local = threading.local()
+        self.metrics_lock = threading.Lock()
+        self.metrics: dict[str, EndpointMetrics] = {}
+        self.server_url: str = None
+        self.request_compression_supported: bool = False
+        self.update_server_url()
+        self.settings.add_listener(self.setting_changed)
+
+    def setting_changed(self, setting_name: str, setting_value: object):
+        if setting_name in {"server_ip", "server_port"}:
+            self.update_server_url()
+
+    def update_server_url(self):
+        self.server_url = f"http://{self.settings.get_value('server_ip')}:{self.settings.get_value('server_port')}"
+        # A different server has to advertise it again
+        self.request_compression_supported = False
+
+    def get_url(self, path: str) -> str:
+        """Full URL of a server path, absolute URLs (like the update server) are returned as they are."""
+        if path.startswith(("http://", "https://")):
+            return path
+        return f"{self.server_url}/{path.lstrip('/')}"
+
+    def is_server_url(self, url: str) -> bool:
+        return url.startswith(f"{self.server_url}/")
+
+    def get_session(self, url: str) -> requests.Session:
+        is_server_url = self.is_server_url(url)
+        session_name = "session" if is_server_url else "external_session"
+        session: requests.Session = getattr(self.local, session_name, None)
+        if session is None:
+            adapter = self.adapter if is_server_url else self.external_adapter
+            session = requests.Session()
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            setattr(self.local, session_name, session)
+        return session
+
+    def get_endpoint(self, url: str) -> str:
+        """Requests are grouped by host and the first part of their path, "http://invi.go:80/file/components_inventory.json" is "invi.go:80/file"."""
+        split_url = urlsplit(url)
+        return f"{split_url.netloc}/{split_url.path.lstrip('/').split('/', 1)[0]}"
+
+    def request(self, method: str, path: str, compress: bool = False, **kwargs) -> requests.Response:
+        url = self.get_url(path)
+        kwargs.setdefault("timeout", self.TIMEOUT)
+        start_time = time.perf_counter()
+        failed = True
+        try:
+            session = self.get_session(url)
+            response = None
+            if compress and self.request_compression_supported and self.is_server_url(url):
+                response = self.send_compressed(session, method, url, **kwargs)
+            if response is None:
+                response = session.request(method, url, **kwargs)
+            self.update_request_compression_support(url, response)
+            failed = not response.ok
+            return response
+        finally:
+            self.add_metric(self.get_endpoint(url), time.perf_counter() - start_time, failed)
+
+    def send_compressed(self, session: requests.Session, method: str, url: str, **kwargs) -> requests.Response | None:
+        """Sends the request with a gzipped body, returns None if it should be sent uncompressed instead."""
+        send_kwargs = {key: kwargs.pop(key) for key in ("timeout", "allow_redirects", "stream", "verify", "cert", "proxies") if key in kwargs}
+        prepared_request = session.prepare_request(requests.Request(method, url, **kwargs))
+        body = prepared_request.body
+        if not body or hasattr(body, "read") or len(body) < self.MIN_COMPRESS_SIZE:
+            return None
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        compressed_body = gzip.compress(body, compresslevel=self.COMPRESS_LEVEL)
+        if len(compressed_body) >= len(body):
+            return None
+        prepared_request.body = compressed_body
+        prepared_request.headers["Content-Encoding"] = "gzip"
+        prepared_request.headers["Content-Length"] = str(len(compressed_body))
+        send_kwargs.update(
+            session.merge_environment_settings(
+                prepared_request.url,
+                send_kwargs.pop("proxies", {}),
+                send_kwargs.pop("stream", None),
+                send_kwargs.pop("verify", None),
+                send_kwargs.pop("cert", None),
+            )
+        )
+        response = session.send(prepared_request, **send_kwargs)
+        if response.status_code == 415:
+            self.request_compression_supported = False
+            response.close()
+            return None
+        return response
+
+    def update_request_compression_support(self, url: str, response: requests.Response):
+        accept_encoding = response.headers.get("Accept-Encoding")
+        if accept_encoding is not None and self.is_server_url(url):
+            self.request_compression_supported = "gzip" in accept_encoding.lower()
+
+    def get(self, path: str, **kwargs) -> requests.Response:
+        return self.request("GET", path, **kwargs)
+
+    def post(self, path: str, **kwargs) -> requests.Response:
+        return self.request("POST", path, **kwargs)
+
+    def add_metric(self, endpoint: str, seconds: float, failed: bool):
+        with self.metrics_lock:
+            self.metrics.setdefault(endpoint, EndpointMetrics()).add(seconds, failed)
+
+    def get_metrics(self) -> dict[str, dict[str, float]]:
+        with self.metrics_lock:
+            return {endpoint: metrics.to_dict() for endpoint, metrics in self.metrics.items()}
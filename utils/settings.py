@@ -1,35 +1,117 @@
+import atexit
+import copy
 import os
+import threading
 from datetime import datetime
+from typing import Callable
 
 import ujson as json
 from PyQt6.QtGui import QFont
 
 
 class Settings:
+    """Process-wide settings, every Settings() returns the same instance.
+
+    set_value() only changes the in-memory data and marks it dirty, the file is written once by flush(),
+    FLUSH_DELAY seconds after the last change or when the process exits.
+    """
+
+    FLUSH_DELAY: float = 1.0
+    _instance: "Settings" = None
+    _instance_lock = threading.Lock()
+
+    def __new__(cls) -> "Settings":
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = super().__new__(cls)
+                cls._instance.initialized = False
+            return cls._instance
+
     def __init__(self) -> None:
+        if self.initialized:
+            return
+        self.initialized = True
         self.data = {}
         self.file_name: str = "settings"
         self.FOLDER_LOCATION: str = f"{os.getcwd()}/"
-        self.__create_file()
+        self.lock = threading.RLock()
+        # Held for the whole write, so an older snapshot can never replace a newer one on disk
+        self.write_lock = threading.Lock()
+        self.dirty: bool = False
+        self.file_signature: list[int] = None
+        self.flush_timer: threading.Timer = None
+        self.listeners: list[Callable[[str, object], None]] = []
         self.load_data()
-        self.default_settings()
+        atexit.register(self.flush)
 
-    def __create_file(self) -> None:
-        if not os.path.exists(f"{self.FOLDER_LOCATION}/{self.file_name}.json"):
-            with open(f"{self.FOLDER_LOCATION}/{self.file_name}.json", "w", encoding="utf-8") as json_file:
-                json_file.write("{}")
+    def get_file_path(self) -> str:
+        return f"{self.FOLDER_LOCATION}/{self.file_name}.json"
 
-    def load_data(self) -> None:
+    def get_file_signature(self) -> list[int]:
         try:
-            with open(f"{self.FOLDER_LOCATION}/{self.file_name}.json", "r", encoding="utf-8") as json_file:
-                self.data = json.load(json_file)
-        except json.JSONDecodeError as error:
-            print(f"{self.file_name}.JsonFile.load_data: {error}")
+            stat = os.stat(self.get_file_path())
+        except FileNotFoundError:
+            return None
+        return [stat.st_mtime_ns, stat.st_size]
+
+    def load_data(self) -> None:
+        """Re-reads the file if something else changed it, unsaved changes in memory always win."""
+        with self.lock:
+            if self.dirty or (self.file_signature is not None and self.file_signature == self.get_file_signature()):
+                return
+            try:
+                with open(self.get_file_path(), "r", encoding="utf-8") as json_file:
+                    self.data = json.load(json_file)
+            except FileNotFoundError:
+                self.data = {}
+            except json.JSONDecodeError as error:
+                print(f"{self.file_name}.JsonFile.load_data: {error}")
+                self.data = {}
+            self.file_signature = self.get_file_signature()
             self.default_settings()
 
     def save_data(self) -> None:
-        with open(f"{self.FOLDER_LOCATION}/{self.file_name}.json", "w", encoding="utf-8") as json_file:
-            json.dump(self.data, json_file, ensure_ascii=False, indent=4)
+        with self.write_lock:
+            # Written from a copy, the flush timer's thread would otherwise serialize nested values (like "geometry")
+            # while the UI thread changes them, and set_value() does not have to wait for the disk
+            with self.lock:
+                self.cancel_flush()
+                data = copy.deepcopy(self.data)
+                self.dirty = False
+            try:
+                with open(f"{self.get_file_path()}.tmp", "w", encoding="utf-8") as json_file:
+                    json.dump(data, json_file, ensure_ascii=False, indent=4)
+                os.replace(f"{self.get_file_path()}.tmp", self.get_file_path())
+            except OSError:
+                with self.lock:
+                    self.dirty = True
+                raise
+            with self.lock:
+                self.file_signature = self.get_file_signature()
+
+    def flush(self) -> None:
+        # Not under lock, save_data() takes write_lock first
+        if self.dirty:
+            self.save_data()
+
+    def cancel_flush(self) -> None:
+        if self.flush_timer is not None:
+            self.flush_timer.cancel()
+            self.flush_timer = None
+
+    def schedule_flush(self) -> None:
+        with self.lock:
+            self.cancel_flush()
+            self.flush_timer = threading.Timer(self.FLUSH_DELAY, self.flush)
+            self.flush_timer.daemon = True
+            self.flush_timer.start()
+
+    def add_listener(self, listener: Callable[[str, object], None]) -> None:
+        """listener(setting_name, setting_value) is called after every set_value()."""
+        self.listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[str, object], None]) -> None:
+        self.listeners.remove(listener)
 
     def get_value(self, setting_name: str) -> None | dict[str, dict[str, int]] | int | bool | str | float:
         try:
@@ -38,9 +120,12 @@ class Settings:
             return None
 
     def set_value(self, setting_name: str, setting_value: object):
-        self.load_data()
-        self.data[setting_name] = setting_value
-        self.save_data()
+        with self.lock:
+            self.data[setting_name] = setting_value
+            self.dirty = True
+        self.schedule_flush()
+        for listener in list(self.listeners):
+            listener(setting_name, setting_value)
 
     def default_settings(self) -> None:
         self.data.setdefault("open_quote_when_generated", True)
@@ -62,6 +147,7 @@ class Settings:
         self.data.setdefault("change_quantities_by", "Category")
         self.data.setdefault("inventory_file_name", "inventory")
         self.data.setdefault("path_to_order_number", "order_number.json")
+        self.data.setdefault("storage_backend", "json")
         self.data.setdefault(
             "trusted_users",
             ["lynden", "jared", "laserpc", "laser pc", "justin", "jordan"],
@@ -101,4 +187,3 @@ class Settings:
         )
         self.data.setdefault("price_history_file_name", str(datetime.now().strftime("%B %d %A %Y")))
         self.data.setdefault("days_until_new_price_history_assessment", 90)
-        self.save_data()
@@ -1,25 +1,33 @@
 from typing import Dict, Generic, Iterator, List, Tuple, TypeVar, Union
 
+from utils.name_index import NameIndex
+
 T = TypeVar("T")
 
 
 class Collection(Generic[T]):
     def __init__(self):
         self.items: List[T] = []
+        self.items_by_name = NameIndex[T](self.items)
 
     def add_item(self, item: T):
         self.items.append(item)
+        self.items_by_name.add(item)
 
     def remove_item(self, item: T):
         self.items.remove(item)
+        self.items_by_name.remove(item)
+
+    def rename_item(self, item: T, new_name: str):
+        item.name = new_name
+        self.items_by_name.mark_stale()
 
     def get(self, name: str) -> T:
-        for item in self.items:
-            if item.name == name:
-                return item
+        return self.items_by_name.get(name)
 
     def clear(self):
         self.items.clear()
+        self.items_by_name.clear()
 
     def to_dict(self) -> List[str]:
         return [item.name for item in self.items]
@@ -1,12 +1,12 @@
 import os
 
-import ujson as json
-
 from utils.sheet_settings.collection import Collection
 from utils.sheet_settings.material import Material
 from utils.sheet_settings.pounds_per_square_foot import PoundsPerSquareFoot
 from utils.sheet_settings.price_per_pound import PricePerPound
 from utils.sheet_settings.thickness import Thickness
+from utils.storage.storage import get_storage_backend
+from utils.storage.storage_backend import StorageBackend
 
 
 class SheetSettings:
@@ -19,7 +19,13 @@ class SheetSettings:
         self.pounds_per_square_foot: PoundsPerSquareFoot = PoundsPerSquareFoot()
         self.price_per_pound: PricePerPound = PricePerPound()
         self.cost_for_laser: dict[str, float] = {}
+        # Bumped whenever the settings are changed here, saved or reloaded, anything computed from them is stale once it changes
+        self.revision: int = 0
+        # (material, thickness) -> (pounds per square foot, price per pound), filled as sheets ask for it and dropped with every revision
+        self.sheet_price_factors: dict[tuple[str, str], tuple[float, float]] = {}
+        self.sheet_price_factors_revision: int = -1
         self.FOLDER_LOCATION: str = f"{os.getcwd()}/data"
+        self.storage: StorageBackend = get_storage_backend(self.filename, self.FOLDER_LOCATION)
         self.load_data()
 
     def get_materials(self) -> list[str]:
@@ -34,28 +40,43 @@ class SheetSettings:
         self.materials.add_item(new_material)
         for thickness in self.thicknesses:
             self.pounds_per_square_foot.add_square_foot_object(new_material, thickness)
+        self.revision += 1
 
     def remove_material(self, material_name: str):
         material_to_remove = self.materials.get(material_name)
         self.price_per_pound.remove_price_per_pound(material_to_remove)
         self.pounds_per_square_foot.remove_material(material_to_remove)
         self.materials.remove_item(material_to_remove)
+        self.revision += 1
+
+    def rename_material(self, material_name: str, new_name: str):
+        if material := self.materials.get(material_name):
+            self.materials.rename_item(material, new_name)
+            self.revision += 1
 
     def add_thickness(self, thickness_name: str):
         new_thickness = Thickness(thickness_name)
         self.thicknesses.add_item(new_thickness)
         for material in self.materials:
             self.pounds_per_square_foot.add_square_foot_object(material, new_thickness)
+        self.revision += 1
 
     def remove_thickness(self, thickness_name: str):
         thickness_to_remove = self.thicknesses.get(thickness_name)
         self.thicknesses.remove_item(thickness_to_remove)
         for material in self.materials:
             self.pounds_per_square_foot.remove_square_foot_object(material, thickness_to_remove)
+        self.revision += 1
+
+    def rename_thickness(self, thickness_name: str, new_name: str):
+        if thickness := self.thicknesses.get(thickness_name):
+            self.thicknesses.rename_item(thickness, new_name)
+            self.revision += 1
 
     def set_price_per_pound(self, material_name: str, new_price: float):
         if material := self.materials.get(material_name):
             self.price_per_pound.set_price_per_pound(material, new_price)
+            self.revision += 1
 
     def set_price_per_pound_modified_date(self, material_name: str, modified_date: str):
         if material := self.materials.get(material_name):
@@ -80,13 +101,27 @@ class SheetSettings:
                     return pounds_per_square_foot
         return 0.0
 
+    def get_sheet_price_factors(self, material_name: str, thickness_name: str) -> tuple[float, float]:
+        """Pounds per square foot and price per pound of a sheet, the same as get_pounds_per_square_foot() and get_price_per_pound()."""
+        if self.sheet_price_factors_revision != self.revision:
+            self.sheet_price_factors.clear()
+            self.sheet_price_factors_revision = self.revision
+        key = (material_name, thickness_name)
+        if (price_factors := self.sheet_price_factors.get(key)) is None:
+            price_factors = (self.get_pounds_per_square_foot(material_name, thickness_name), self.get_price_per_pound(material_name))
+            self.sheet_price_factors[key] = price_factors
+        return price_factors
+
     def save_data(self):
-        with open(f"{self.FOLDER_LOCATION}/{self.filename}.json", "w", encoding="utf-8") as file:
-            json.dump(self.to_dict(), file, ensure_ascii=False, indent=4)
+        self.revision += 1
+        self.storage.save(self.to_dict())
+
+    def compact(self):
+        self.storage.compact()
 
     def load_data(self):
-        with open(f"{self.FOLDER_LOCATION}/{self.filename}.json", "r", encoding="utf-8") as file:
-            data = json.load(file)
+        data = self.storage.load()
+        self.revision += 1
 
         self.cost_for_laser.clear()
         for cutting_method in data["cost_for_laser"]:
@@ -120,6 +155,8 @@ class SheetSettings:
         for thickness_id, thickness in data["thickness_ids"].items():
             self.material_id["thickness_ids"].update({thickness_id: thickness})
 
+        self.storage.update_cache(self.to_dict())
+
     def to_dict(self):
         return {
             "cost_for_laser": self.cost_for_laser,
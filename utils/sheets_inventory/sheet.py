@@ -10,8 +10,23 @@ if TYPE_CHECKING:
 
 
 class Sheet(InventoryItem):
+    __slots__ = (
+        "sheets_inventory",
+        "latest_change_quantity",
+        "red_quantity_limit",
+        "yellow_quantity_limit",
+        "has_sent_warning",
+        "notes",
+        "orders",
+        "_quantity",
+        "_length",
+        "_width",
+        "_thickness",
+        "_material",
+    )
+
     def __init__(self, name: str, data: dict, sheets_inventory):
-        super().__init__(name)
+        super().__init__(name, sheets_inventory)
         self.sheets_inventory: SheetsInventory = sheets_inventory
         self.quantity: int = 0
         self.length: float = 0.0
@@ -26,6 +41,56 @@ class Sheet(InventoryItem):
         self.orders: list[Order] = []
         self.load_data(data)
 
+    @property
+    def quantity(self) -> int:
+        return self._quantity
+
+    @quantity.setter
+    def quantity(self, quantity: int):
+        self._quantity = quantity
+        self.stock_cost_changed()
+
+    # The name and the stock cost are built from these, so changing one of them renames the sheet and changes its stock cost
+    @property
+    def length(self) -> float:
+        return self._length
+
+    @length.setter
+    def length(self, length: float):
+        self._length = length
+        self.key_changed()
+        self.stock_cost_changed()
+
+    @property
+    def width(self) -> float:
+        return self._width
+
+    @width.setter
+    def width(self, width: float):
+        self._width = width
+        self.key_changed()
+        self.stock_cost_changed()
+
+    @property
+    def thickness(self) -> str:
+        return self._thickness
+
+    @thickness.setter
+    def thickness(self, thickness: str):
+        self._thickness = thickness
+        self.key_changed()
+        self.stock_cost_changed()
+
+    @property
+    def material(self) -> str:
+        return self._material
+
+    @material.setter
+    def material(self, material: str):
+        self._material = material
+        self.key_changed()
+        self.stock_cost_changed()
+
     def get_sheet_dimension(self) -> str:
         return f"{self.length:.3f}x{self.width:.3f}"
 
@@ -33,7 +98,9 @@ class Sheet(InventoryItem):
         return f"{self.thickness} {self.material} {self.get_sheet_dimension()}"
 
     def get_copy(self) -> "Sheet":
-        return copy.deepcopy(self)
+        sheet_copy: Sheet = super().get_copy()
+        sheet_copy.orders = [copy.copy(order) for order in self.orders]
+        return sheet_copy
 
     def remove_from_category(self, category: Category):
         super().remove_from_category(category)
@@ -74,6 +141,7 @@ class Sheet(InventoryItem):
                     self.categories.append(category)
         except AttributeError:  # Because these sheets come from utils.threads.load_nests.py
             self.categories = []
+        self.categories_changed()
 
     def to_dict(self) -> dict[str, dict]:
         return {
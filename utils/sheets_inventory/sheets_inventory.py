@@ -1,18 +1,29 @@
+import numpy as np
 import ujson as json
-from natsort import natsorted
 
 from utils.inventory.category import Category
 from utils.inventory.inventory import Inventory
+from utils.inventory.stock_columns import StockColumns, get_column
+from utils.inventory.stock_cost_totals import StockCostTotals
+from utils.natural_sort import insert_natural_sorted, natural_sorted
 from utils.sheet_settings.sheet_settings import SheetSettings
 from utils.sheets_inventory.sheet import Sheet
 
 
 class SheetsInventory(Inventory):
+    SORT_VALUES = {
+        "material": lambda sheet: sheet.material,
+        "thickness": lambda sheet: sheet.thickness,
+    }
+
     def __init__(self, parent):
         super().__init__("sheets_inventory")
         self.parent = parent
         self.sheets: list[Sheet] = []
+        self.sheets_by_name = self.add_item_index(lambda sheet: sheet.get_name())
         self.sheet_settings: SheetSettings = self.parent.sheet_settings
+        self.stock_costs = self.add_stock_cost_totals(lambda sheet: self.get_sheet_cost(sheet) * sheet.quantity)
+        self.stock_costs_revision: int = None
         self.load_data()
 
     def get_all_sheets_material(self, sheets: list[Sheet] = None) -> list[str]:
@@ -25,13 +36,25 @@ class SheetsInventory(Inventory):
     def get_sheets_by_category(self, category: str | Category) -> list[Sheet]:
         if isinstance(category, str):
             category = self.get_category(category)
-        return [sheet for sheet in self.sheets if category in sheet.categories]
+        return self.get_items_in_category(category)
 
     def add_sheet(self, sheet: Sheet):
-        self.sheets.append(sheet)
+        if self.sort_order is None:
+            self.sheets.append(sheet)
+        else:
+            sort_name, reverse = self.sort_order
+            insert_natural_sorted(self.sheets, sheet, self.SORT_VALUES[sort_name], reverse)
+        self.sheets_by_name.add(sheet)
+        self.categories.category_items.add(sheet)
+        if self.sort_order is not None:
+            self.categories.category_items.reorder(self.sheets)
+        self.stock_costs.add(sheet)
 
     def remove_sheet(self, sheet: Sheet):
         self.sheets.remove(sheet)
+        self.sheets_by_name.remove(sheet)
+        self.categories.category_items.remove(sheet)
+        self.stock_costs.remove(sheet)
 
     def duplicate_category(self, category_to_duplicate: Category, new_category_name: str) -> Category:
         new_category = Category(new_category_name)
@@ -41,47 +64,76 @@ class SheetsInventory(Inventory):
         return new_category
 
     def delete_category(self, category: str | Category) -> Category:
+        sheets = self.get_sheets_by_category(category)
         deleted_category = super().delete_category(category)
-        for sheet in self.get_sheets_by_category(deleted_category):
+        for sheet in sheets:
             sheet.remove_from_category(deleted_category)
         return deleted_category
 
     def get_sheet_cost(self, sheet: Sheet) -> float:
-        pounds_per_square_foot = self.sheet_settings.get_pounds_per_square_foot(sheet.material, sheet.thickness)
+        pounds_per_square_foot, price_per_pound = self.sheet_settings.get_sheet_price_factors(sheet.material, sheet.thickness)
         pounds_per_sheet = ((sheet.length * sheet.width) / 144) * pounds_per_square_foot
-        price_per_pound = self.sheet_settings.get_price_per_pound(sheet.material)
         return pounds_per_sheet * price_per_pound
 
+    def get_sheet_costs(self, sheets: list[Sheet]) -> np.ndarray:
+        """Same as get_sheet_cost() for every sheet, the sheet settings are only looked up once per material and thickness."""
+        codes: dict[tuple[str, str], int] = {}
+        sheet_codes = get_column(sheets, lambda sheet: codes.setdefault((sheet.material, sheet.thickness), len(codes)), np.intp)
+        cost_per_square_foot = np.array(
+            [np.prod(self.sheet_settings.get_sheet_price_factors(material, thickness)) for material, thickness in codes],
+            dtype=np.float64,
+        )
+        return get_column(sheets, lambda sheet: sheet.length * sheet.width) / 144 * cost_per_square_foot[sheet_codes]
+
+    def get_stock_columns(self) -> StockColumns:
+        quantities = get_column(self.sheets, lambda sheet: sheet.quantity)
+        return StockColumns(self.sheets, quantities, self.get_sheet_costs(self.sheets) * quantities)
+
+    def get_stock_costs(self) -> StockCostTotals:
+        # Prices and weights live in the sheet settings, every sheet costs something else once they change
+        if self.stock_costs_revision != self.sheet_settings.revision:
+            self.stock_costs.rebuild(self.sheets, self.get_stock_columns().stock_costs)
+            self.stock_costs_revision = self.sheet_settings.revision
+        return self.stock_costs
+
     def get_category_stock_cost(self, category: Category) -> float:
-        total = 0.0
-        for sheet in self.get_sheets_by_category(category):
-            total += self.get_sheet_cost(sheet) * sheet.quantity
-        return total
+        return self.get_stock_costs().get_category_total(category)
+
+    def get_category_stock_costs(self) -> dict[Category, float]:
+        stock_costs = self.get_stock_costs()
+        return {category: stock_costs.get_category_total(category) for category in self.get_categories()}
 
     def get_sheet_by_name(self, sheet_name: str) -> Sheet:
-        return next((sheet for sheet in self.sheets if sheet.get_name() == sheet_name), None)
+        return self.sheets_by_name.get(sheet_name)
 
     def exists(self, other: Sheet) -> bool:
-        return any(sheet.get_name() == other.get_name() for sheet in self.sheets)
+        return other.get_name() in self.sheets_by_name
 
     def sort_by_material(self) -> list[Sheet]:
-        self.sheets = natsorted(self.sheets, key=lambda sheet: sheet.material)
+        self.sort_sheets("material")
 
     def sort_by_thickness(self) -> list[Sheet]:
-        self.sheets = natsorted(self.sheets, key=lambda sheet: sheet.thickness)
+        self.sort_sheets("thickness")
 
-    def save(self):
-        with open(f"{self.FOLDER_LOCATION}/{self.filename}.json", "w", encoding="utf-8") as file:
-            json.dump(self.to_dict(), file, ensure_ascii=False, indent=4)
+    def sort_sheets(self, sort_name: str, reverse: bool = False):
+        if self.sort_order == (sort_name, reverse):
+            return
+        self.sheets = natural_sorted(self.sheets, self.SORT_VALUES[sort_name], reverse)
+        self.categories.category_items.reorder(self.sheets)
+        self.sort_order = (sort_name, reverse)
 
     def load_data(self):
         try:
-            with open(f"{self.FOLDER_LOCATION}/{self.filename}.json", "r", encoding="utf-8") as file:
-                data: dict[str, dict[str, object]] = json.load(file)
+            data: dict[str, dict[str, object]] = self._read_data()
             self.categories.from_dict(data["categories"])
             self.sheets.clear()
-            for sheet_name, sheet_data in data["sheets"].items():
-                self.add_sheet(Sheet(sheet_name, sheet_data, self))
+            self.sheets.extend(Sheet(sheet_name, sheet_data, self) for sheet_name, sheet_data in data["sheets"].items())
+            self.sort_order = None
+            self.sheets_by_name.rebuild(self.sheets)
+            self.categories.category_items.rebuild(self.sheets)
+            self.stock_costs.rebuild(self.sheets, self.get_stock_columns().stock_costs)
+            self.stock_costs_revision = self.sheet_settings.revision
+            self._update_storage_cache()
         except KeyError:  # Inventory was just created
             return
         except json.JSONDecodeError:  # Inventory file got cleared
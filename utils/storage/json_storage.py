@@ -0,0 +1,113 @@
+import threading
+
+import ujson as json
+
+from utils.storage.storage_backend import Change, StorageBackend
+
+
+class JsonStorage(StorageBackend):
+    """The JSON file is the snapshot, save() appends changed records to a journal next to it."""
+
+    JOURNAL_COMPACT_THRESHOLD: int = 500
+
+    def __init__(self, filename: str, folder_location: str):
+        super().__init__(filename, folder_location)
+        self.journal_record_count: int = 0
+
+    def get_journal_path(self) -> str:
+        return f"{self.FOLDER_LOCATION}/{self.filename}.journal"
+
+    def reset(self):
+        with self.lock:
+            super().reset()
+            self.reset_journal()
+
+    def reset_journal(self):
+        # The header ties the journal to the snapshot it was written against, if the snapshot gets replaced (download, reset) the journal is stale
+        with open(self.get_journal_path(), "w", encoding="utf-8") as file:
+            file.write(json.dumps({"op": "base", "snapshot": self.get_file_signature()}) + "\n")
+        self.journal_record_count = 0
+
+    def replay_journal(self, data: dict[str, object]) -> bool:
+        try:
+            with open(self.get_journal_path(), "r", encoding="utf-8") as file:
+                lines = file.readlines()
+        except FileNotFoundError:
+            return False
+        try:
+            header = json.loads(lines[0])
+        except (IndexError, ValueError):
+            return False
+        if header.get("snapshot") != self.get_file_signature():
+            return False
+
+        self.journal_record_count = 0
+        for line in lines[1:]:
+            try:
+                record: dict[str, object] = json.loads(line)
+            except ValueError:  # Torn write from a crash, everything after it is lost anyway
+                break
+            if record["op"] == "set":
+                data.setdefault(record["section"], {})[record["name"]] = record["data"]
+            elif record["op"] == "delete":
+                data.get(record["section"], {}).pop(record["name"], None)
+            elif record["op"] == "order":
+                section = data.get(record["section"], {})
+                data[record["section"]] = {name: section[name] for name in record["names"] if name in section}
+            elif record["op"] == "value":
+                data[record["key"]] = record["data"]
+            elif record["op"] == "remove":
+                data.pop(record["key"], None)
+            self.journal_record_count += 1
+        return True
+
+    def prepare_snapshot_read(self) -> bool:
+        with self.lock:
+            try:
+                with open(self.get_journal_path(), "r", encoding="utf-8") as file:
+                    header_line = file.readline()
+                    has_records = bool(file.readline())
+                header = json.loads(header_line)
+            except (FileNotFoundError, ValueError):
+                header = {}
+                has_records = False
+            if header.get("snapshot") == self.get_file_signature():
+                return not has_records
+            self.reset_journal()  # Stale, new records have to be written against the current snapshot
+            return True
+
+    def load(self) -> dict[str, object]:
+        with self.lock:
+            with open(self.get_file_path(), "r", encoding="utf-8") as file:
+                data: dict[str, object] = json.load(file)
+            if not self.replay_journal(data):
+                self.reset_journal()
+            return data
+
+    def get_journal_record(self, change: Change) -> str:
+        if change[0] == "set":
+            return f'{{"op":"set","section":{json.dumps(change[1], ensure_ascii=False)},"name":{json.dumps(change[2], ensure_ascii=False)},"data":{change[3]}}}'
+        elif change[0] == "delete":
+            return f'{{"op":"delete","section":{json.dumps(change[1], ensure_ascii=False)},"name":{json.dumps(change[2], ensure_ascii=False)}}}'
+        elif change[0] == "order":
+            return f'{{"op":"order","section":{json.dumps(change[1], ensure_ascii=False)},"names":{json.dumps(change[2], ensure_ascii=False)}}}'
+        elif change[0] == "remove":
+            return f'{{"op":"remove","key":{json.dumps(change[1], ensure_ascii=False)}}}'
+        return f'{{"op":"value","key":{json.dumps(change[1], ensure_ascii=False)},"data":{change[2]}}}'
+
+    def save(self, data: dict[str, object]):
+        with self.lock:
+            if changes := self.get_changes(data):
+                with open(self.get_journal_path(), "a", encoding="utf-8") as file:
+                    file.write("\n".join(self.get_journal_record(change) for change in changes) + "\n")
+                self.journal_record_count += len(changes)
+            needs_compaction = self.journal_record_count >= self.JOURNAL_COMPACT_THRESHOLD
+        if needs_compaction:
+            threading.Thread(target=self.compact, daemon=True).start()
+
+    def compact(self):
+        with self.lock:
+            if self.journal_record_count == 0:
+                return
+            self.write_snapshot()
+            self.reset_journal()
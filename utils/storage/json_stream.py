@@ -0,0 +1,137 @@
+import json as std_json
+import re
+from typing import Iterator
+
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+STRUCTURE = re.compile(r'["{}\[\]]')
+STRING_END = re.compile(r'["\\]')
+
+
+class JsonObjectReader:
+    """Walks the top level object of a JSON file one member at a time.
+
+    Only the member being decoded and the unread part of the current chunk are held in memory,
+    so a file of many jobs never has to be parsed into one document first.
+    """
+
+    CHUNK_SIZE: int = 1 << 16
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self.file = None
+        self.buffer: str = ""
+        self.position: int = 0
+        self.values_read: int = 0
+        self.decoder = std_json.JSONDecoder()
+
+    def read_more(self, size: int = None) -> bool:
+        if self.position:
+            self.buffer = self.buffer[self.position :]
+            self.position = 0
+        chunk = self.file.read(max(size or 0, self.CHUNK_SIZE))
+        self.buffer += chunk
+        return bool(chunk)
+
+    def peek(self) -> str:
+        while True:
+            self.position = WHITESPACE.match(self.buffer, self.position).end()
+            if self.position < len(self.buffer):
+                return self.buffer[self.position]
+            if not self.read_more():
+                raise std_json.JSONDecodeError("Unexpected end of file", self.buffer, self.position)
+
+    def expect(self, character: str):
+        if self.peek() != character:
+            raise std_json.JSONDecodeError(f"Expected {character!r}", self.buffer, self.position)
+        self.position += 1
+
+    def decode_value(self) -> object:
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.position)
+            except std_json.JSONDecodeError:
+                # Most likely the value runs past the chunk, grow the buffer geometrically so big values are not re-parsed too often
+                if not self.read_more(len(self.buffer) - self.position):
+                    raise
+                continue
+            # A number at the end of the chunk could still be cut in half, every value inside an object is followed by a delimiter
+            if (end < len(self.buffer) and self.buffer[end] in ",:]} \t\n\r") or not self.read_more():
+                self.position = end
+                self.values_read += 1
+                return value
+
+    def skip_value(self):
+        if self.peek() not in "{[":
+            self.decode_value()
+            return
+        depth = 0
+        position = self.position
+        while True:
+            match = STRUCTURE.search(self.buffer, position)
+            if match is None:
+                offset = len(self.buffer) - self.position
+                if not self.read_more():
+                    raise std_json.JSONDecodeError("Unexpected end of file", self.buffer, len(self.buffer))
+                position = offset
+                continue
+            position = match.end()
+            character = match.group()
+            if character == '"':
+                position = self.skip_string(position)
+            elif character in "{[":
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    self.position = position
+                    self.values_read += 1
+                    return
+
+    def skip_string(self, position: int) -> int:
+        while True:
+            match = STRING_END.search(self.buffer, position)
+            if match is None or match.end() >= len(self.buffer):
+                offset = position - self.position
+                if not self.read_more():
+                    raise std_json.JSONDecodeError("Unterminated string", self.buffer, position)
+                position = offset
+                continue
+            if match.group() == '"':
+                return match.end()
+            position = match.end() + 1  # Skip the escaped character
+
+    def iter_members(self) -> Iterator[str]:
+        """Yields the key of every member of the object at the current position, the caller has to decode or skip each value."""
+        self.expect("{")
+        if self.peek() == "}":
+            self.position += 1
+            self.values_read += 1
+            return
+        while True:
+            key = self.decode_value()
+            self.expect(":")
+            values_read = self.values_read
+            yield key
+            if self.values_read == values_read:  # The caller did not consume the value
+                self.skip_value()
+            if self.peek() == ",":
+                self.position += 1
+                continue
+            self.expect("}")
+            self.values_read += 1
+            return
+
+    def __enter__(self) -> "JsonObjectReader":
+        self.file = open(self.file_path, "r", encoding="utf-8")
+        return self
+
+    def __exit__(self, *args):
+        self.file.close()
+
+
+def iter_items(file_path: str) -> Iterator[tuple[str, object]]:
+    with JsonObjectReader(file_path) as reader:
+        for key in reader.iter_members():
+            yield key, reader.decode_value()
+
@@ -0,0 +1,39 @@
+import os
+
+from utils.storage.sqlite_storage import SQLiteStorage
+
+DOCUMENTS: list[str] = [
+    "components_inventory",
+    "laser_cut_inventory",
+    "sheets_inventory",
+    "paint_inventory",
+    "sheet_settings",
+    "workspace_settings",
+    "admin_workspace",
+    "user_workspace",
+    "history_workspace",
+]
+
+
+def migrate_json_to_sqlite(folder_location: str = f"{os.getcwd()}/data", documents: list[str] = None) -> list[str]:
+    migrated_documents: list[str] = []
+    for document in documents or DOCUMENTS:
+        storage = SQLiteStorage(document, folder_location)
+        if os.path.exists(storage.get_file_path()):
+            storage.import_json()
+            migrated_documents.append(document)
+    return migrated_documents
+
+
+def export_sqlite_to_json(folder_location: str = f"{os.getcwd()}/data", documents: list[str] = None) -> list[str]:
+    exported_documents: list[str] = []
+    for document in documents or DOCUMENTS:
+        storage = SQLiteStorage(document, folder_location)
+        if storage.get_document_row() is not None:
+            storage.export_json()
+            exported_documents.append(document)
+    return exported_documents
+
+
+if __name__ == "__main__":
+    print(f"Migrated: {', '.join(migrate_json_to_sqlite())}")
@@ -0,0 +1,309 @@
+import os
+import sqlite3
+import threading
+
+import ujson as json
+
+from utils.storage.storage_backend import Change, StorageBackend
+
+
+class SQLiteStorage(StorageBackend):
+    """Stores documents in data/inventory.db, the JSON file is only written by compact() for the server upload format.
+
+    If the JSON file changes underneath us (downloaded from the server) it is imported again on the next load().
+    """
+
+    DATABASE_NAME: str = "inventory.db"
+    connections: dict[str, sqlite3.Connection] = {}
+    connections_lock = threading.Lock()
+
+    def __init__(self, filename: str, folder_location: str):
+        super().__init__(filename, folder_location)
+        self.connection = self.get_connection(f"{self.FOLDER_LOCATION}/{self.DATABASE_NAME}")
+
+    @classmethod
+    def get_connection(cls, database_path: str) -> sqlite3.Connection:
+        with cls.connections_lock:
+            if database_path not in cls.connections:
+                connection = sqlite3.connect(database_path, check_same_thread=False)
+                connection.row_factory = sqlite3.Row
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.execute("PRAGMA synchronous=NORMAL")
+                cls.create_tables(connection)
+                cls.connections[database_path] = connection
+            return cls.connections[database_path]
+
+    @staticmethod
+    def create_tables(connection: sqlite3.Connection):
+        with connection:
+            connection.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS documents (
+                    document TEXT PRIMARY KEY,
+                    keys TEXT NOT NULL,
+                    json_signature TEXT NOT NULL,
+                    exported INTEGER NOT NULL DEFAULT 1
+                );
+                CREATE TABLE IF NOT EXISTS document_values (
+                    document TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    data TEXT NOT NULL,
+                    PRIMARY KEY (document, key)
+                );
+                CREATE TABLE IF NOT EXISTS items (
+                    document TEXT NOT NULL,
+                    section TEXT NOT NULL,
+                    name TEXT NOT NULL,
+                    position INTEGER NOT NULL,
+                    part_number TEXT,
+                    part_name TEXT,
+                    price REAL,
+                    quantity REAL,
+                    use_exchange_rate INTEGER NOT NULL DEFAULT 0,
+                    data TEXT NOT NULL,
+                    PRIMARY KEY (document, section, name)
+                );
+                CREATE INDEX IF NOT EXISTS items_part_number ON items (document, part_number);
+                CREATE INDEX IF NOT EXISTS items_part_name ON items (document, part_name);
+                CREATE TABLE IF NOT EXISTS categories (
+                    document TEXT NOT NULL,
+                    name TEXT NOT NULL,
+                    position INTEGER NOT NULL,
+                    PRIMARY KEY (document, name)
+                );
+                CREATE TABLE IF NOT EXISTS category_items (
+                    document TEXT NOT NULL,
+                    category TEXT NOT NULL,
+                    section TEXT NOT NULL,
+                    name TEXT NOT NULL,
+                    PRIMARY KEY (document, category, section, name)
+                );
+                CREATE INDEX IF NOT EXISTS category_items_item ON category_items (document, section, name);
+                CREATE TABLE IF NOT EXISTS orders (
+                    document TEXT NOT NULL,
+                    section TEXT NOT NULL,
+                    name TEXT NOT NULL,
+                    position INTEGER NOT NULL,
+                    order_pending_quantity REAL,
+                    order_pending_date TEXT,
+                    expected_arrival_time TEXT,
+                    notes TEXT
+                );
+                CREATE INDEX IF NOT EXISTS orders_item ON orders (document, section, name);
+                """
+            )
+
+    def get_document_row(self) -> sqlite3.Row:
+        return self.connection.execute("SELECT * FROM documents WHERE document = ?", (self.filename,)).fetchone()
+
+    def exists(self) -> bool:
+        return self.get_document_row() is not None or super().exists()
+
+    def reset(self):
+        with self.lock:
+            super().reset()
+            with self.connection:
+                self.delete_document_rows()
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO documents (document, keys, json_signature, exported) VALUES (?, '[]', ?, 1)",
+                    (self.filename, json.dumps(self.get_file_signature())),
+                )
+
+    def delete_document_rows(self):
+        for table in ("document_values", "items", "categories", "category_items", "orders"):
+            self.connection.execute(f"DELETE FROM {table} WHERE document = ?", (self.filename,))
+
+    def import_json_if_replaced(self):
+        row = self.get_document_row()
+        if super().exists() and (row is None or json.loads(row["json_signature"]) != self.get_file_signature()):
+            self.import_json()
+
+    def prepare_snapshot_read(self) -> bool:
+        with self.lock:
+            self.import_json_if_replaced()
+            row = self.get_document_row()
+            return row is None or bool(row["exported"])
+
+    def load(self) -> dict[str, object]:
+        with self.lock:
+            self.import_json_if_replaced()
+            return self.read_document()
+
+    def read_document(self) -> dict[str, object]:
+        row = self.get_document_row()
+        if row is None:
+            return {}
+        values: dict[str, str] = {value_row["key"]: value_row["data"] for value_row in self.connection.execute("SELECT key, data FROM document_values WHERE document = ?", (self.filename,))}
+        data: dict[str, object] = {}
+        for key in json.loads(row["keys"]):
+            data[key] = json.loads(values[key]) if key in values else {}
+        for item_row in self.connection.execute("SELECT section, name, data FROM items WHERE document = ? ORDER BY section, position", (self.filename,)):
+            data.setdefault(item_row["section"], {})[item_row["name"]] = json.loads(item_row["data"])
+        return data
+
+    def import_json(self):
+        """One-shot import of the JSON file, used by the migrator and whenever the JSON file was replaced."""
+        with self.lock:
+            with open(self.get_file_path(), "r", encoding="utf-8") as file:
+                data: dict[str, object] = json.load(file)
+            with self.connection:
+                self.delete_document_rows()
+                for key, value in data.items():
+                    if isinstance(value, dict):
+                        for position, (name, item_data) in enumerate(value.items()):
+                            self.write_item(key, name, position, json.dumps(item_data, ensure_ascii=False), item_data)
+                    else:
+                        self.write_value(key, json.dumps(value, ensure_ascii=False), value)
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO documents (document, keys, json_signature, exported) VALUES (?, ?, ?, 1)",
+                    (self.filename, json.dumps(list(data), ensure_ascii=False), json.dumps(self.get_file_signature())),
+                )
+
+    def write_item(self, section: str, name: str, position: int, item_json: str, item_data: object):
+        if isinstance(item_data, dict):
+            price = item_data.get("price")
+            quantity = item_data.get("quantity")
+            columns = (
+                item_data.get("part_number") or name,
+                item_data.get("part_name", ""),
+                price if isinstance(price, (int, float)) else None,
+                quantity if isinstance(quantity, (int, float)) else None,
+                int(bool(item_data.get("use_exchange_rate", False))),
+            )
+        else:
+            columns = (name, "", None, None, 0)
+        self.connection.execute(
+            """
+            INSERT INTO items (document, section, name, position, part_number, part_name, price, quantity, use_exchange_rate, data)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (document, section, name) DO UPDATE SET
+                part_number = excluded.part_number,
+                part_name = excluded.part_name,
+                price = excluded.price,
+                quantity = excluded.quantity,
+                use_exchange_rate = excluded.use_exchange_rate,
+                data = excluded.data
+            """,
+            (self.filename, section, name, position, *columns, item_json),
+        )
+        self.connection.execute("DELETE FROM category_items WHERE document = ? AND section = ? AND name = ?", (self.filename, section, name))
+        self.connection.execute("DELETE FROM orders WHERE document = ? AND section = ? AND name = ?", (self.filename, section, name))
+        if not isinstance(item_data, dict):
+            return
+        self.connection.executemany(
+            "INSERT OR IGNORE INTO category_items (document, category, section, name) VALUES (?, ?, ?, ?)",
+            [(self.filename, category, section, name) for category in item_data.get("categories", []) if isinstance(category, str)],
+        )
+        self.connection.executemany(
+            "INSERT INTO orders (document, section, name, position, order_pending_quantity, order_pending_date, expected_arrival_time, notes) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (self.filename, section, name, position, order.get("order_pending_quantity"), order.get("order_pending_date"), order.get("expected_arrival_time"), order.get("notes"))
+                for position, order in enumerate(item_data.get("orders", []))
+                if isinstance(order, dict)
+            ],
+        )
+
+    def delete_item(self, section: str, name: str):
+        for table in ("items", "category_items", "orders"):
+            self.connection.execute(f"DELETE FROM {table} WHERE document = ? AND section = ? AND name = ?", (self.filename, section, name))
+
+    def remove_key(self, key: str):
+        self.connection.execute("DELETE FROM document_values WHERE document = ? AND key = ?", (self.filename, key))
+        for table in ("items", "category_items", "orders"):
+            self.connection.execute(f"DELETE FROM {table} WHERE document = ? AND section = ?", (self.filename, key))
+
+    def write_value(self, key: str, value_json: str, value: object):
+        self.connection.execute("INSERT OR REPLACE INTO document_values (document, key, data) VALUES (?, ?, ?)", (self.filename, key, value_json))
+        if key == "categories" and isinstance(value, list):
+            self.connection.execute("DELETE FROM categories WHERE document = ?", (self.filename,))
+            self.connection.executemany(
+                "INSERT OR IGNORE INTO categories (document, name, position) VALUES (?, ?, ?)",
+                [(self.filename, category, position) for position, category in enumerate(value)],
+            )
+
+    def write_positions(self, section: str, names: list[str]):
+        self.connection.executemany(
+            "UPDATE items SET position = ? WHERE document = ? AND section = ? AND name = ?",
+            [(position, self.filename, section, name) for position, name in enumerate(names)],
+        )
+
+    def save(self, data: dict[str, object]):
+        with self.lock:
+            section_sizes: dict[str, int] = {key: len(value) for key, value in self.cached_data.items() if isinstance(value, dict)}
+            changes: list[Change] = self.get_changes(data)
+            if not changes:
+                return
+            positions: dict[str, dict[str, int]] = {}
+            # Adding or deleting an item shifts the positions of every item after it
+            sections_to_renumber: set[str] = set()
+            with self.connection:
+                for change in changes:
+                    if change[0] == "set":
+                        if change[1] not in positions:
+                            positions[change[1]] = {name: position for position, name in enumerate(self.cached_data[change[1]])}
+                            if len(positions[change[1]]) != section_sizes.get(change[1], 0):
+                                sections_to_renumber.add(change[1])
+                        self.write_item(change[1], change[2], positions[change[1]][change[2]], change[3], json.loads(change[3]))
+                    elif change[0] == "delete":
+                        self.delete_item(change[1], change[2])
+                        sections_to_renumber.add(change[1])
+                    elif change[0] == "order":
+                        self.write_positions(change[1], change[2])
+                        sections_to_renumber.discard(change[1])
+                    elif change[0] == "value":
+                        self.write_value(change[1], change[2], json.loads(change[2]))
+                    elif change[0] == "remove":
+                        self.remove_key(change[1])
+                        sections_to_renumber.discard(change[1])
+                for section in sections_to_renumber:
+                    self.write_positions(section, list(self.cached_data[section]))
+                self.connection.execute("UPDATE documents SET keys = ?, exported = 0 WHERE document = ?", (json.dumps(list(data), ensure_ascii=False), self.filename))
+
+    def compact(self):
+        with self.lock:
+            row = self.get_document_row()
+            if row is None or (row["exported"] and json.loads(row["json_signature"]) == self.get_file_signature()):
+                return
+            with open(f"{self.get_file_path()}.tmp", "w", encoding="utf-8") as file:
+                json.dump(self.read_document(), file, ensure_ascii=False)
+            os.replace(f"{self.get_file_path()}.tmp", self.get_file_path())
+            with self.connection:
+                self.connection.execute("UPDATE documents SET json_signature = ?, exported = 1 WHERE document = ?", (json.dumps(self.get_file_signature()), self.filename))
+
+    def export_json(self):
+        self.compact()
+
+    def get_item(self, section: str, name: str) -> dict[str, object] | None:
+        row = self.connection.execute("SELECT data FROM items WHERE document = ? AND section = ? AND name = ?", (self.filename, section, name)).fetchone()
+        return json.loads(row["data"]) if row else None
+
+    def find_item_name(self, field: str, value: str, section: str = None) -> str | None:
+        if field not in {"part_number", "part_name", "name"}:
+            raise ValueError(f"{field} is not an indexed column")
+        query = f"SELECT name FROM items WHERE document = ? AND {field} = ?"
+        parameters: tuple = (self.filename, value)
+        if section:
+            query += " AND section = ?"
+            parameters += (section,)
+        row = self.connection.execute(f"{query} ORDER BY position LIMIT 1", parameters).fetchone()
+        return row["name"] if row else None
+
+    def get_category_item_names(self, category: str, section: str = None) -> list[str]:
+        query = "SELECT category_items.name FROM category_items JOIN items USING (document, section, name) WHERE category_items.document = ? AND category_items.category = ?"
+        parameters: tuple = (self.filename, category)
+        if section:
+            query += " AND category_items.section = ?"
+            parameters += (section,)
+        return [row["name"] for row in self.connection.execute(f"{query} ORDER BY items.position", parameters)]
+
+    def get_stock_cost(self, category: str = None, exchange_rate: float = 1.0) -> float:
+        query = "SELECT SUM(MAX(items.price * items.quantity * CASE WHEN items.use_exchange_rate THEN ? ELSE 1 END, 0)) AS total FROM items"
+        parameters: tuple = (exchange_rate,)
+        if category:
+            query += " JOIN category_items USING (document, section, name) WHERE items.document = ? AND category_items.category = ?"
+            parameters += (self.filename, category)
+        else:
+            query += " WHERE items.document = ?"
+            parameters += (self.filename,)
+        row = self.connection.execute(query, parameters).fetchone()
+        return row["total"] or 0.0
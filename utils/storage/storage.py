@@ -0,0 +1,12 @@
+from utils.settings import Settings
+from utils.storage.json_storage import JsonStorage
+from utils.storage.sqlite_storage import SQLiteStorage
+from utils.storage.storage_backend import StorageBackend
+
+settings_file = Settings()
+
+
+def get_storage_backend(filename: str, folder_location: str) -> StorageBackend:
+    if settings_file.get_value("storage_backend") == "sqlite":
+        return SQLiteStorage(filename, folder_location)
+    return JsonStorage(filename, folder_location)
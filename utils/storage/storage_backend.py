@@ -0,0 +1,120 @@
+import os
+import threading
+from abc import ABC, abstractmethod
+
+import ujson as json
+
+# A change is one of:
+#   ("set", section, name, item_json)
+#   ("delete", section, name)
+#   ("order", section, names)
+#   ("value", key, value_json)
+#   ("remove", key)
+Change = tuple
+
+
+class StorageBackend(ABC):
+    """Persists one JSON document (an inventory or a settings file).
+
+    Top level dict values are treated as sections of named items, every other value is stored as a whole.
+    The serialized form of the last saved document is cached so save() only has to persist what changed.
+    """
+
+    def __init__(self, filename: str, folder_location: str):
+        self.filename: str = filename.replace(".json", "")
+        self.FOLDER_LOCATION: str = folder_location
+        self.lock = threading.RLock()
+        self.cached_data: dict[str, dict[str, str] | str] = {}
+
+    def get_file_path(self) -> str:
+        return f"{self.FOLDER_LOCATION}/{self.filename}.json"
+
+    def get_file_signature(self) -> list[int]:
+        try:
+            stat = os.stat(self.get_file_path())
+        except FileNotFoundError:
+            return [0, 0]
+        return [stat.st_mtime_ns, stat.st_size]
+
+    def exists(self) -> bool:
+        return os.path.exists(self.get_file_path())
+
+    def reset(self):
+        with self.lock:
+            with open(self.get_file_path(), "w", encoding="utf-8") as file:
+                file.write("{}")
+            self.cached_data.clear()
+
+    @abstractmethod
+    def load(self) -> dict[str, object]:
+        pass
+
+    @abstractmethod
+    def save(self, data: dict[str, object]):
+        pass
+
+    @abstractmethod
+    def compact(self):
+        """Brings the JSON file on disk up to date with everything that was saved."""
+
+    def prepare_snapshot_read(self) -> bool:
+        """Returns True if the JSON file already holds everything that was saved, so it can be read directly instead of through load()."""
+        return True
+
+    def update_cache(self, data: dict[str, object]):
+        with self.lock:
+            self.cached_data.clear()
+            for key, value in data.items():
+                self.cache_value(key, value)
+
+    def cache_value(self, key: str, value: object):
+        with self.lock:
+            if isinstance(value, dict):
+                self.cached_data[key] = {name: json.dumps(item_data, ensure_ascii=False) for name, item_data in value.items()}
+            else:
+                self.cached_data[key] = json.dumps(value, ensure_ascii=False)
+
+    def get_changes(self, data: dict[str, object]) -> list[Change]:
+        changes: list[Change] = []
+        for key, value in data.items():
+            if isinstance(value, dict):
+                cached_items = self.cached_data.get(key, {})
+                if not isinstance(cached_items, dict):
+                    cached_items = {}
+                items: dict[str, str] = {}
+                for name, item_data in value.items():
+                    item_json = json.dumps(item_data, ensure_ascii=False)
+                    items[name] = item_json
+                    if cached_items.get(name) != item_json:
+                        changes.append(("set", key, name, item_json))
+                changes.extend(("delete", key, name) for name in cached_items if name not in items)
+                remaining_names = [name for name in cached_items if name in items]
+                new_names = [name for name in items if name in cached_items]
+                if remaining_names != new_names or (not items and not isinstance(self.cached_data.get(key), dict)):
+                    # An empty section that is new has no items to be created by, but it still has to exist when loaded
+                    changes.append(("order", key, list(items)))
+                self.cached_data[key] = items
+            else:
+                value_json = json.dumps(value, ensure_ascii=False)
+                if self.cached_data.get(key) != value_json:
+                    changes.append(("value", key, value_json))
+                    self.cached_data[key] = value_json
+        for key in [key for key in self.cached_data if key not in data]:
+            changes.append(("remove", key))
+            del self.cached_data[key]
+        return changes
+
+    def get_snapshot_text(self) -> str:
+        sections: list[str] = []
+        for key, value in self.cached_data.items():
+            if isinstance(value, dict):
+                items = ",".join(f"{json.dumps(name, ensure_ascii=False)}:{item_json}" for name, item_json in value.items())
+                sections.append(f"{json.dumps(key, ensure_ascii=False)}:{{{items}}}")
+            else:
+                sections.append(f"{json.dumps(key, ensure_ascii=False)}:{value}")
+        return "{" + ",".join(sections) + "}"
+
+    def write_snapshot(self):
+        with open(f"{self.get_file_path()}.tmp", "w", encoding="utf-8") as file:
+            file.write(self.get_snapshot_text())
+        os.replace(f"{self.get_file_path()}.tmp", self.get_file_path())
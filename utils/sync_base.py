@@ -0,0 +1,60 @@
+import hashlib
+import threading
+
+import ujson as json
+
+
+class SyncBase:
+    """Process-wide record of the last version of each data file the server acknowledged, every SyncBase() returns the same instance.
+
+    A version is the SHA-256 of the file the server has, it is set whenever a file is downloaded or fully uploaded,
+    and replaced by the version the server reports after a patch upload.
+    The data is kept parsed so a patch against it does not need to read anything from disk.
+    """
+
+    _instance: "SyncBase" = None
+    _instance_lock = threading.Lock()
+
+    def __new__(cls) -> "SyncBase":
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = super().__new__(cls)
+                cls._instance.initialized = False
+            return cls._instance
+
+    def __init__(self) -> None:
+        if self.initialized:
+            return
+        self.initialized = True
+        self.lock = threading.Lock()
+        # file name: (version, data)
+        self.bases: dict[str, tuple[str, object]] = {}
+
+    @staticmethod
+    def get_version(content: bytes) -> str:
+        return hashlib.sha256(content).hexdigest()
+
+    def get_base(self, file_name: str) -> tuple[str, object] | None:
+        with self.lock:
+            return self.bases.get(file_name)
+
+    def get_base_version(self, file_name: str) -> str | None:
+        with self.lock:
+            base = self.bases.get(file_name)
+        return base[0] if base else None
+
+    def set_base(self, file_name: str, version: str, data: object):
+        with self.lock:
+            self.bases[file_name] = (version, data)
+
+    def set_base_content(self, file_name: str, content: bytes, version: str = None):
+        try:
+            data = json.loads(content)
+        except ValueError:
+            self.remove_base(file_name)
+            return
+        self.set_base(file_name, version or self.get_version(content), data)
+
+    def remove_base(self, file_name: str):
+        with self.lock:
+            self.bases.pop(file_name, None)
@@ -1,8 +1,9 @@
 import time
 
-import requests
 from PyQt6.QtCore import QThread, pyqtSignal
 
+from utils.server_client import ServerClient
+
 
 class CheckForUpdatesThread(QThread):
     signal = pyqtSignal(object, object)
@@ -10,13 +11,14 @@ class CheckForUpdatesThread(QThread):
     def __init__(self, parent, current_version: str) -> None:
         self.parent = parent
         self.current_version = current_version
+        self.server_client = ServerClient()
         QThread.__init__(self)
 
     def run(self) -> None:
         while True:
             try:
-                response_version = requests.get("http://10.0.0.10:5051/version", timeout=10)
-                response_message = requests.get("http://10.0.0.10:5051/update_message", timeout=10)
+                response_version = self.server_client.get("http://10.0.0.10:5051/version")
+                response_message = self.server_client.get("http://10.0.0.10:5051/update_message")
                 if response_version.status_code != 200 or response_message.status_code != 200:
                     continue
                 version = response_version.text
@@ -1,30 +1,30 @@
 from PyQt6.QtCore import QThread, pyqtSignal
-from requests import Session
 
-from utils.ip_utils import get_server_ip_address, get_server_port
+from utils.file_downloader import DownloadResult, FileDownloader
 
 
 class DownloadImagesThread(QThread):
     signal = pyqtSignal(object)
+    # file path, downloaded count, total count
+    progress_signal = pyqtSignal(str, int, int)
 
     def __init__(self, files_to_download: list[str]) -> None:
         QThread.__init__(self)
-        self.SERVER_IP: str = get_server_ip_address()
-        self.SERVER_PORT: int = get_server_port()
+        self.file_downloader = FileDownloader()
         self.files_to_download = files_to_download
-        self.session = Session()
-        self.file_url = f"http://{self.SERVER_IP}:{self.SERVER_PORT}/images/"
+        self.file_url = "/images/"
 
     def run(self) -> None:
-        for file_to_download in self.files_to_download:
-            try:
-                response = self.session.get(self.file_url + file_to_download, timeout=10)
-                if response.status_code == 200:
-                    with open(file_to_download, "wb") as file:
-                        file.write(response.content)
-                else:
-                    self.signal.emit(f"{response.status_code} {file_to_download} not found")
-            except Exception as e:
-                self.signal.emit(f"{e} - {file_to_download}")
+        self.file_downloader.download_files(
+            [(self.file_url + file_to_download, file_to_download) for file_to_download in self.files_to_download],
+            self.file_downloaded,
+        )
         self.signal.emit("Successfully downloaded")
-        self.session.close()
+
+    def file_downloaded(self, result: DownloadResult, downloaded_count: int, total_count: int):
+        if result.succeeded:
+            self.progress_signal.emit(result.file_path, downloaded_count, total_count)
+        elif result.status_code is not None:
+            self.signal.emit(result.error)
+        else:
+            self.signal.emit(f"{result.error} - {result.file_path}")
@@ -2,7 +2,7 @@ import requests
 import ujson as json
 from PyQt6.QtCore import QThread, pyqtSignal
 
-from utils.ip_utils import get_server_ip_address, get_server_port
+from utils.server_client import ServerClient
 
 
 class DownloadJobThread(QThread):
@@ -10,20 +10,22 @@ class DownloadJobThread(QThread):
 
     def __init__(self, folder_name: str) -> None:
         QThread.__init__(self)
-        self.SERVER_IP: str = get_server_ip_address()
-        self.SERVER_PORT: int = get_server_port()
+        self.server_client = ServerClient()
         self.folder_name: str = folder_name
-        self.url = f"http://{self.SERVER_IP}:{self.SERVER_PORT}/download_job/{self.folder_name}"
+        self.url = f"/download_job/{self.folder_name}"
 
     def run(self) -> None:
+        self.signal.emit(self.download_job(), self.folder_name)
+
+    def download_job(self) -> dict | str:
+        """The job data, or what went wrong."""
         try:
-            response = requests.get(self.url, timeout=10)
+            response = self.server_client.get(self.url)
             response.raise_for_status()
-            self.signal.emit(response.json(), self.folder_name)
+            return response.json()
         except requests.HTTPError as http_err:
-            self.signal.emit(f"HTTP error occurred: {http_err}", self.folder_name)
+            return f"HTTP error occurred: {http_err}"
         except requests.RequestException as err:
-            self.signal.emit(f"An error occurred: {err}", self.folder_name)
+            return f"An error occurred: {err}"
         except json.JSONDecodeError:
-            self.signal.emit("Failed to parse JSON response", self.folder_name)
-        return None
+            return "Failed to parse JSON response"
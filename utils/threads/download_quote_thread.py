@@ -2,7 +2,7 @@ import requests
 import ujson as json
 from PyQt6.QtCore import QThread, pyqtSignal
 
-from utils.ip_utils import get_server_ip_address, get_server_port
+from utils.server_client import ServerClient
 
 
 class DownloadQuoteThread(QThread):
@@ -10,14 +10,13 @@ class DownloadQuoteThread(QThread):
 
     def __init__(self, folder_name: str) -> None:
         QThread.__init__(self)
-        self.SERVER_IP: str = get_server_ip_address()
-        self.SERVER_PORT: int = get_server_port()
+        self.server_client = ServerClient()
         self.folder_name: str = folder_name
-        self.url = f"http://{self.SERVER_IP}:{self.SERVER_PORT}/download_quote/{self.folder_name}"
+        self.url = f"/download_quote/{self.folder_name}"
 
     def run(self) -> None:
         try:
-            response = requests.get(self.url, timeout=10)
+            response = self.server_client.get(self.url)
             response.raise_for_status()
             self.signal.emit(response.json(), self.folder_name)
         except requests.HTTPError as http_err:
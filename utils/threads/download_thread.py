@@ -1,41 +1,55 @@
 from PyQt6.QtCore import QThread, pyqtSignal
-from requests import Session
 
-from utils.ip_utils import get_server_ip_address, get_server_port
+from utils.download_manifest import DownloadManifest
+from utils.file_downloader import DownloadResult, FileDownloader
+from utils.sync_base import SyncBase
 
 
 class DownloadThread(QThread):
     signal = pyqtSignal(object, list)
+    # Shared by every DownloadThread so they do not overwrite each other's entries
+    manifest: DownloadManifest = None
 
     def __init__(self, files_to_download: list[str]) -> None:
         QThread.__init__(self)
-        self.SERVER_IP: str = get_server_ip_address()
-        self.SERVER_PORT: int = get_server_port()
+        if DownloadThread.manifest is None:
+            DownloadThread.manifest = DownloadManifest()
+        self.file_downloader = FileDownloader(manifest=DownloadThread.manifest)
+        self.sync_base = SyncBase()
         self.files_to_download = files_to_download
-        self.session = Session()
-        self.file_url = f"http://{self.SERVER_IP}:{self.SERVER_PORT}/file/"
+        self.file_url = "/file/"
 
     def run(self) -> None:
         successful_downloads = []
+        changed_downloads = []
         failed_downloads = []
 
-        for file_to_download in self.files_to_download:
-            try:
-                response = self.session.get(self.file_url + file_to_download, timeout=10)
-
-                if response.status_code == 200:
-                    filepath = f"data/{file_to_download}"
-                    with open(filepath, "wb") as file:
-                        file.write(response.content)
-                    successful_downloads.append(file_to_download)
-                else:
-                    failed_downloads.append(file_to_download)
-            except Exception as e:
-                failed_downloads.append((file_to_download, str(e)))
-
-        if failed_downloads:
-            self.signal.emit({"status": "failed", "failed_files": failed_downloads}, self.files_to_download)
-        else:
-            self.signal.emit({"status": "success", "successful_files": successful_downloads}, self.files_to_download)
-
-        self.session.close()
+        results = self.file_downloader.download_files([(self.file_url + file_to_download, f"data/{file_to_download}") for file_to_download in self.files_to_download])
+        for file_to_download, result in zip(self.files_to_download, results):
+            if result.succeeded:
+                successful_downloads.append(file_to_download)
+                if result.changed:
+                    changed_downloads.append(file_to_download)
+                self.update_sync_base(file_to_download, result)
+            elif result.status_code is not None:
+                failed_downloads.append(file_to_download)
+            else:
+                failed_downloads.append((file_to_download, result.error))
+
+        # Changed files are already on disk and in the manifest, they have to be reloaded even if others failed
+        self.signal.emit(
+            {
+                "status": "failed" if failed_downloads else "success",
+                "successful_files": successful_downloads,
+                "changed_files": changed_downloads,
+                "failed_files": failed_downloads,
+            },
+            self.files_to_download,
+        )
+
+    def update_sync_base(self, file_to_download: str, result: DownloadResult):
+        """What was just downloaded is what the server has, uploads are patched against it."""
+        if not file_to_download.endswith(".json") or (result.sha256 is not None and result.sha256 == self.sync_base.get_base_version(file_to_download)):
+            return
+        with open(result.file_path, "rb") as file:
+            self.sync_base.set_base_content(file_to_download, file.read(), result.sha256)
@@ -1,7 +1,7 @@
 import requests
 from PyQt6.QtCore import QThread, pyqtSignal
 
-from utils.ip_utils import get_server_ip_address, get_server_port
+from utils.server_client import ServerClient
 
 
 class GetSavedQuotesThread(QThread):
@@ -9,13 +9,12 @@ class GetSavedQuotesThread(QThread):
 
     def __init__(self) -> None:
         QThread.__init__(self)
-        self.SERVER_IP: str = get_server_ip_address()
-        self.SERVER_PORT: int = get_server_port()
-        self.url = f"http://{self.SERVER_IP}:{self.SERVER_PORT}/get_saved_quotes"
+        self.server_client = ServerClient()
+        self.url = "/get_saved_quotes"
 
     def run(self) -> None:
         try:
-            response = requests.get(self.url, timeout=10)
+            response = self.server_client.get(self.url)
             data = response.json()
 
             if response.status_code == 200:
@@ -1,8 +1,8 @@
 import contextlib
 
-from PyQt6.QtCore import QObject, QThread, pyqtSignal
+from PyQt6.QtCore import QThread, pyqtSignal
 
-from utils.threads.download_images_thread import DownloadImagesThread
+from utils.file_downloader import DownloadResult, FileDownloader
 from utils.threads.download_job_thread import DownloadJobThread
 from utils.threads.workspace_get_file_thread import WorkspaceDownloadFile
 from utils.workspace.job import Job
@@ -10,17 +10,48 @@ from utils.workspace.job_manager import JobManager
 
 
 class JobLoaderThread(QThread):
-    signal = pyqtSignal(object)
+    """Downloads a job and every image and file it needs.
+
+    Emits the job (None if its data or every one of its downloads failed) and the paths of the files that failed to download.
+    """
+
+    # job, failed file paths
+    signal = pyqtSignal(object, list)
+    # file path, downloaded count, total count
+    progress_signal = pyqtSignal(str, int, int)
 
     def __init__(self, job_manager: JobManager, folder_name: str) -> None:
         super().__init__()
         self.folder_name = folder_name
         self.job_manager = job_manager
         self.job: Job = None
-        self.threads: list[DownloadImagesThread | DownloadJobThread | WorkspaceDownloadFile] = []
+        self.file_downloader = FileDownloader()
+        self.failed_downloads: list[DownloadResult] = []
 
     def run(self):
-        self.download_job_data_thread(self.folder_name)
+        # The images and files of a job only depend on the job data, so they are all downloaded together
+        data = DownloadJobThread(self.folder_name).download_job()
+        if not isinstance(data, dict):
+            self.signal.emit(None, [])
+            return
+        job_name = self.folder_name.split("\\")[-1]
+        self.job = Job(job_name, data, self.job_manager)
+        self.job.downloaded_from_server = True
+
+        downloads = [(f"/images/{image}", image) for image in self.get_all_images(self.job)]
+        downloads.extend((f"/workspace_get_file/{file}", WorkspaceDownloadFile.get_file_path(file)) for file in self.get_all_files(self.job))
+        self.file_downloader.download_files(downloads, self.file_downloaded)
+        failed_files = [result.file_path for result in self.failed_downloads]
+        # Nothing came through, most likely the server went away after sending the job data
+        if downloads and len(failed_files) == len(downloads):
+            self.signal.emit(None, failed_files)
+        else:
+            self.signal.emit(self.job, failed_files)
+
+    def file_downloaded(self, result: DownloadResult, downloaded_count: int, total_count: int):
+        if not result.succeeded:
+            self.failed_downloads.append(result)
+        self.progress_signal.emit(result.file_path, downloaded_count, total_count)
 
     def get_all_images(self, job: Job) -> list[str]:
         images: set[str] = set()
@@ -46,49 +77,3 @@ class JobLoaderThread(QThread):
                 if not laser_cut_part_file.lower().endswith((".pdf", ".jpeg", ".jpg", ".png")):
                     files.add(laser_cut_part_file)
         return list(files)
-
-    def download_job_data_thread(self, folder_name: str) -> None:
-        download_job_thread = DownloadJobThread(folder_name)
-        self.threads.append(download_job_thread)
-        download_job_thread.signal.connect(self.download_job_data_response)
-        download_job_thread.start()
-        download_job_thread.wait()
-
-    def download_job_data_response(self, data: dict, folder_name: str) -> None:
-        if isinstance(data, dict):
-            job_name = folder_name.split("\\")[-1]
-            self.job = Job(job_name, data, self.job_manager)
-            self.job.downloaded_from_server = True
-
-            required_images = self.get_all_images(self.job)
-
-            self.download_required_images_thread(required_images)
-        else:
-            self.signal.emit(None)
-
-    def download_required_images_thread(self, image_paths: list[str]) -> None:
-        download_images_thread = DownloadImagesThread(image_paths)
-        self.threads.append(download_images_thread)
-        download_images_thread.signal.connect(self.download_images_response)
-        download_images_thread.start()
-        download_images_thread.wait()
-
-    def download_images_response(self, response: str) -> None:
-        if response == "Successfully downloaded":
-            all_files = self.get_all_files(self.job)
-            self.download_required_files_thread(all_files)
-        else:
-            self.signal.emit(None)
-
-    def download_required_files_thread(self, files: list[str]) -> None:
-        download_files_thread = WorkspaceDownloadFile(files, False)
-        self.threads.append(download_files_thread)
-        download_files_thread.signal.connect(self.download_files_response)
-        download_files_thread.start()
-        download_files_thread.wait()
-
-    def download_files_response(self, file_ext: str, file_name: str, open_when_done: bool):
-        if file_ext == "Successfully downloaded" or file_name == "Successfully downloaded":
-            self.signal.emit(self.job)
-        else:
-            self.signal.emit(None)
@@ -1,5 +1,4 @@
 import contextlib
-import itertools
 import os
 import threading
 from datetime import datetime
@@ -27,38 +26,50 @@ class RemoveQuantityThread(QThread):
         self.completion_count: int = 0
         self.multiplier: int = multiplier
         self.max_item_count = inventory.get_sum_of_items()
+        self.progress_step: int = 1
         self.inventory = inventory
 
+    def get_items_by_part_number(self, inventory: dict[str, dict[str, dict]]) -> dict[str, list[tuple[str, str]]]:
+        """Every (category, item) outside of self.category, by part number."""
+        items_by_part_number: dict[str, list[tuple[str, str]]] = {}
+        for category, items in inventory.items():
+            if category == self.category:
+                continue
+            for item, item_data in items.items():
+                items_by_part_number.setdefault(item_data["part_number"], []).append((category, item))
+        return items_by_part_number
+
+    def remove_quantity(self, item_data: dict[str, object], changed_at: str):
+        unit_quantity: int = item_data["unit_quantity"]
+        current_quantity: int = item_data["current_quantity"]
+        item_data["current_quantity"] = current_quantity - (unit_quantity * self.multiplier)
+        item_data["latest_change_current_quantity"] = f"{self.username} - Changed from {current_quantity} to {current_quantity - (unit_quantity * self.multiplier)} at {changed_at}"
+
+    def item_completed(self):
+        self.completion_count += 1
+        # Reporting every item would flood the event loop on large inventories, a hundred steps is smooth enough for a progress bar
+        if self.completion_count % self.progress_step == 0 or self.completion_count == self.max_item_count:
+            self.signal.emit(f"{self.completion_count}, {self.max_item_count}")
+
     def run(self) -> None:
         print("thread running")
-        self.signal.emit(f"{self.completion_count}, {self.max_item_count}")
         try:
             inventory = self.inventory.get_data()
-            part_numbers = []
-            for item in list(inventory[self.category].keys()):
-                unit_quantity: int = inventory[self.category][item]["unit_quantity"]
-                current_quantity: int = inventory[self.category][item]["current_quantity"]
-                part_numbers.append(inventory[self.category][item]["part_number"])
-                inventory[self.category][item]["current_quantity"] = current_quantity - (unit_quantity * self.multiplier)
-                inventory[self.category][item]["latest_change_current_quantity"] = f"{self.username} - Changed from {current_quantity} to {current_quantity - (unit_quantity * self.multiplier)} at {datetime.now().strftime('%B %d %A %Y %I:%M:%S %p')}"
-                self.completion_count += 1
-                # self.signal.emit(f"{self.completion_count}, {self.max_item_count}")
-            part_numbers = list(set(part_numbers))
-            for category in self.inventory.get_keys():
-                if category == self.category:
-                    continue
-                self.max_item_count += len(list(inventory[category].keys())) * len(part_numbers)
-            for category in self.inventory.get_keys():
-                if category == self.category:
-                    continue
-                for item, part_number in itertools.product(list(inventory[category].keys()), part_numbers):
-                    if part_number == inventory[category][item]["part_number"]:
-                        unit_quantity: int = inventory[category][item]["unit_quantity"]
-                        current_quantity: int = inventory[category][item]["current_quantity"]
-                        inventory[category][item]["current_quantity"] = current_quantity - (unit_quantity * self.multiplier)
-                        inventory[category][item]["latest_change_current_quantity"] = f"{self.username} - Changed from {current_quantity} to {current_quantity - (unit_quantity * self.multiplier)} at {datetime.now().strftime('%B %d %A %Y %I:%M:%S %p')}"
-                    self.completion_count += 1
-                    # self.signal.emit(f"{self.completion_count}, {self.max_item_count}")
+            changed_at = datetime.now().strftime("%B %d %A %Y %I:%M:%S %p")
+            category_items = inventory[self.category]
+            part_numbers = {item_data["part_number"] for item_data in category_items.values()}
+            items_by_part_number = self.get_items_by_part_number(inventory)
+            # Same part in other categories, each of them only changes once no matter how often its part number shows up here
+            linked_items = [linked_item for part_number in part_numbers for linked_item in items_by_part_number.get(part_number, [])]
+            self.max_item_count = len(category_items) + len(linked_items)
+            self.progress_step = max(self.max_item_count // 100, 1)
+            self.signal.emit(f"{self.completion_count}, {self.max_item_count}")
+            for item_data in category_items.values():
+                self.remove_quantity(item_data, changed_at)
+                self.item_completed()
+            for category, item in linked_items:
+                self.remove_quantity(inventory[category][item], changed_at)
+                self.item_completed()
             self.inventory.save_data(inventory)
             self.signal.emit("Done")
             print("thread done")
@@ -1,7 +1,7 @@
 import requests
 from PyQt6.QtCore import QThread, pyqtSignal
 
-from utils.ip_utils import get_server_ip_address, get_server_port
+from utils.server_client import ServerClient
 
 
 class SendEmailThread(QThread):
@@ -13,14 +13,13 @@ class SendEmailThread(QThread):
         self.message = message
         self.emails = ",".join(emails)
 
-        self.SERVER_IP: str = get_server_ip_address()
-        self.SERVER_PORT: int = get_server_port()
-        self.url = f"http://{self.SERVER_IP}:{self.SERVER_PORT}/send_email"
+        self.server_client = ServerClient()
+        self.url = "/send_email"
 
     def run(self):
         data = {"title": self.title, "message": self.message, "emails": self.emails}
         try:
-            response = requests.post(self.url, data=data, timeout=10)
+            response = self.server_client.post(self.url, data=data)
             if response.status_code == 200:
                 self.signal.emit("Email sent successfully")
             else:
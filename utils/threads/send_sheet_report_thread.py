@@ -1,7 +1,6 @@
-import requests
 from PyQt6.QtCore import QThread, pyqtSignal
 
-from utils.ip_utils import get_server_ip_address, get_server_port
+from utils.server_client import ServerClient
 
 
 class SendReportThread(QThread):
@@ -9,14 +8,13 @@ class SendReportThread(QThread):
 
     def __init__(self) -> None:
         QThread.__init__(self)
-        self.SERVER_IP: str = get_server_ip_address()
-        self.SERVER_PORT: int = get_server_port()
-        self.command_url = f"http://{self.SERVER_IP}:{self.SERVER_PORT}/command"
+        self.server_client = ServerClient()
+        self.command_url = "/command"
         self.data = {"command": "send_sheet_report"}
 
     def run(self) -> None:
         try:
-            response = requests.post(self.command_url, data=self.data)
+            response = self.server_client.post(self.command_url, data=self.data)
 
             if response.status_code == 200:
                 # Process the received response
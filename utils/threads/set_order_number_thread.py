@@ -1,7 +1,6 @@
-import requests
 from PyQt6.QtCore import QThread, pyqtSignal
 
-from utils.ip_utils import get_server_ip_address, get_server_port
+from utils.server_client import ServerClient
 
 
 class SetOrderNumberThread(QThread):
@@ -9,13 +8,12 @@ class SetOrderNumberThread(QThread):
 
     def __init__(self, order_number: float) -> None:
         QThread.__init__(self)
-        self.SERVER_IP: str = get_server_ip_address()
-        self.SERVER_PORT: int = get_server_port()
-        self.url = f"http://{self.SERVER_IP}:{self.SERVER_PORT}/set_order_number/{int(order_number)}"
+        self.server_client = ServerClient()
+        self.url = f"/set_order_number/{int(order_number)}"
 
     def run(self) -> None:
         try:
-            response = requests.post(self.url, timeout=10)
+            response = self.server_client.post(self.url)
 
             if response.status_code == 200:
                 self.signal.emit("success")
@@ -1,7 +1,6 @@
-import requests
 from PyQt6.QtCore import QThread, pyqtSignal
 
-from utils.ip_utils import get_server_ip_address, get_server_port
+from utils.server_client import ServerClient
 
 
 class UpdateJobSetting(QThread):
@@ -9,12 +8,11 @@ class UpdateJobSetting(QThread):
 
     def __init__(self, folder: str, key_to_change: str, new_value: str | float | int | bool) -> None:
         QThread.__init__(self)
-        self.SERVER_IP: str = get_server_ip_address()
-        self.SERVER_PORT: int = get_server_port()
+        self.server_client = ServerClient()
         self.folder = folder
         self.key_to_change = key_to_change
         self.new_value = new_value
-        self.upload_url = f"http://{self.SERVER_IP}:{self.SERVER_PORT}/update_job_settings"
+        self.upload_url = "/update_job_settings"
 
     def run(self) -> None:
         try:
@@ -23,7 +21,7 @@ class UpdateJobSetting(QThread):
                 "key": self.key_to_change,
                 "value": self.new_value,
             }
-            response = requests.post(self.upload_url, data=data, timeout=10)
+            response = self.server_client.post(self.upload_url, data=data)
             self.signal.emit(response.json(), self.folder)
         except Exception as e:
             self.signal.emit(str(e), self.folder)
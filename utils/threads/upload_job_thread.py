@@ -1,8 +1,7 @@
-import requests
 import ujson as json
 from PyQt6.QtCore import QThread, pyqtSignal
 
-from utils.ip_utils import get_server_ip_address, get_server_port
+from utils.server_client import ServerClient
 from utils.workspace.job import Job
 
 
@@ -11,12 +10,11 @@ class UploadJobThread(QThread):
 
     def __init__(self, folder: str, job: Job, html_file_contents: str) -> None:
         QThread.__init__(self)
-        self.SERVER_IP: str = get_server_ip_address()
-        self.SERVER_PORT: int = get_server_port()
+        self.server_client = ServerClient()
         self.folder = folder
         self.job = job
         self.html_file_contents = html_file_contents
-        self.upload_url = f"http://{self.SERVER_IP}:{self.SERVER_PORT}/upload_job"
+        self.upload_url = "/upload_job"
 
     def run(self) -> None:
         try:
@@ -25,7 +23,7 @@ class UploadJobThread(QThread):
                 "html_file_contents": self.html_file_contents,
             }
             files = {"job_data": ("job.json", json.dumps(self.job.to_dict()), "application/json")}
-            response = requests.post(self.upload_url, data=data, files=files, timeout=10)
+            response = self.server_client.post(self.upload_url, data=data, files=files, compress=True)
             if response.status_code == 200:
                 self.signal.emit("Job sent successfully")
             else:
@@ -1,9 +1,8 @@
-import requests
 import ujson as json
 from PyQt6.QtCore import QThread, pyqtSignal
 
-from utils.ip_utils import get_server_ip_address, get_server_port
 from utils.quote.quote import Quote
+from utils.server_client import ServerClient
 
 
 class UploadQuote(QThread):
@@ -11,12 +10,11 @@ class UploadQuote(QThread):
 
     def __init__(self, folder: str, quote: Quote, html_file_contents: str) -> None:
         QThread.__init__(self)
-        self.SERVER_IP: str = get_server_ip_address()
-        self.SERVER_PORT: int = get_server_port()
+        self.server_client = ServerClient()
         self.folder = folder
         self.quote = quote
         self.html_file_contents = html_file_contents
-        self.upload_url = f"http://{self.SERVER_IP}:{self.SERVER_PORT}/upload_quote"
+        self.upload_url = "/upload_quote"
 
     def run(self) -> None:
         try:
@@ -25,7 +23,7 @@ class UploadQuote(QThread):
                 "html_file_contents": self.html_file_contents,
             }
             files = {"quote_data": ("quote.json", json.dumps(self.quote.to_dict()), "application/json")}
-            response = requests.post(self.upload_url, data=data, files=files, timeout=10)
+            response = self.server_client.post(self.upload_url, data=data, files=files, compress=True)
             if response.status_code == 200:
                 self.signal.emit("Quote sent successfully")
             else:
@@ -1,37 +1,61 @@
+import contextlib
+
+import ujson as json
 from PyQt6.QtCore import QThread, pyqtSignal
-from requests import Session
 
-from utils.ip_utils import get_server_ip_address, get_server_port
+from utils.json_patch import make_json_patch
+from utils.server_client import ServerClient
+from utils.storage.storage_backend import StorageBackend
+from utils.sync_base import SyncBase
 
 
 class UploadThread(QThread):
+    """Uploads data files and images.
+
+    A JSON file the server already has a known version of is sent as a patch against that version to /upload_patch.
+    The server answers 409 when its file is no longer that version (someone else uploaded in between),
+    and 404 or 405 if it does not support patches, either way the whole file is uploaded instead.
+    """
+
     signal = pyqtSignal(object, list)
+    # Set to False the first time the server turns out not to support patches
+    patch_uploads_supported: bool = True
 
-    def __init__(self, files_to_upload: list[str]) -> None:
+    def __init__(self, files_to_upload: list[str], storages_to_compact: list[StorageBackend] = None) -> None:
         QThread.__init__(self)
-        self.SERVER_IP: str = get_server_ip_address()
-        self.SERVER_PORT: int = get_server_port()
-        self.upload_url = f"http://{self.SERVER_IP}:{self.SERVER_PORT}/upload"
-        self.session = Session()
+        self.server_client = ServerClient()
+        self.sync_base = SyncBase()
+        self.upload_url = "/upload"
+        self.upload_patch_url = "/upload_patch"
         self.files_to_upload = files_to_upload
+        self.storages_to_compact: list[StorageBackend] = storages_to_compact or []
 
     def run(self) -> None:
         try:
             successful_uploads = []
             failed_uploads = []
+            # Journaled/SQLite storage only brings the JSON file up to date on compact
+            for storage in self.storages_to_compact:
+                storage.compact()
             for file_to_upload in self.files_to_upload:
                 file = None
                 if file_to_upload.endswith(".json"):
                     with open(f"data/{file_to_upload}", "rb") as f:
-                        file = {"file": (file_to_upload, f.read(), "application/json")}
+                        content = f.read()
+                    if self.upload_patch(file_to_upload, content):
+                        successful_uploads.append(file_to_upload)
+                        continue
+                    file = {"file": (file_to_upload, content, "application/json")}
                 elif file_to_upload.endswith((".jpeg", ".png", ".jpg")):
                     with open(file_to_upload, "rb") as f:
                         file = {"file": (file_to_upload, f.read(), "image/jpeg")}
 
                 if file:
-                    response = self.session.post(self.upload_url, files=file, timeout=10)
+                    response = self.server_client.post(self.upload_url, files=file, compress=file_to_upload.endswith(".json"))
                     if response.status_code == 200:
                         successful_uploads.append(file_to_upload)
+                        if file_to_upload.endswith(".json"):
+                            self.sync_base.set_base_content(file_to_upload, file["file"][1])
                     else:
                         failed_uploads.append(file_to_upload)
 
@@ -41,5 +65,31 @@ class UploadThread(QThread):
                 self.signal.emit({"status": "success", "successful_files": successful_uploads}, self.files_to_upload)
         except Exception as e:
             self.signal.emit({"status": "error", "error": str(e)}, self.files_to_upload)
-        finally:
-            self.session.close()
+
+    def upload_patch(self, file_name: str, content: bytes) -> bool:
+        """Returns True if the server has content now, False if the whole file still has to be uploaded."""
+        base = self.sync_base.get_base(file_name)
+        if base is None or not UploadThread.patch_uploads_supported:
+            return False
+        base_version, base_data = base
+        version = self.sync_base.get_version(content)
+        if version == base_version:
+            return True
+        try:
+            data = json.loads(content)
+        except ValueError:
+            return False
+        patch = make_json_patch(base_data, data)
+        patch_content = json.dumps({"filename": file_name, "base_version": base_version, "version": version, "patch": patch}, ensure_ascii=False).encode("utf-8")
+        if len(patch_content) >= len(content):
+            return False
+        response = self.server_client.post(self.upload_patch_url, data=patch_content, headers={"Content-Type": "application/json"}, compress=True)
+        if response.status_code in {404, 405}:
+            UploadThread.patch_uploads_supported = False
+            return False
+        if response.status_code != 200:
+            return False
+        with contextlib.suppress(ValueError, AttributeError):  # Servers that do not report a version keep the file exactly as patched
+            version = response.json().get("version", version)
+        self.sync_base.set_base(file_name, version, data)
+        return True
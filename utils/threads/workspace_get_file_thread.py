@@ -1,43 +1,42 @@
 import os
-from pathlib import Path
 
 from PyQt6.QtCore import QThread, pyqtSignal
-from requests import Session
 
-from utils.ip_utils import get_server_ip_address, get_server_port
+from utils.file_downloader import DownloadResult, FileDownloader
 
 
 class WorkspaceDownloadFile(QThread):
     signal = pyqtSignal(str, str, bool)
+    # file path, downloaded count, total count
+    progress_signal = pyqtSignal(str, int, int)
 
     def __init__(self, files_to_download: list[str], open_when_done: bool) -> None:
         QThread.__init__(self)
-        self.SERVER_IP: str = get_server_ip_address()
-        self.SERVER_PORT: int = get_server_port()
+        self.file_downloader = FileDownloader()
         self.files_to_download = files_to_download
-        print(self.files_to_download)
-        self.session = Session()
         self.open_when_done = open_when_done
-        self.file_url = f"http://{self.SERVER_IP}:{self.SERVER_PORT}/workspace_get_file/"
+        self.file_url = "/workspace_get_file/"
+
+    @staticmethod
+    def get_file_path(file_to_download: str) -> str:
+        file_name = os.path.basename(file_to_download)
+        return f"data/workspace/{file_name.split('.')[-1].upper()}/{file_name}"
 
     def run(self) -> None:
-        for file_to_download in self.files_to_download:
-            try:
-                response = self.session.get(self.file_url + file_to_download, timeout=10)
-                file_name = os.path.basename(file_to_download)
-                file_ext = file_name.split(".")[-1].upper()
-                Path(f"data/workspace/{file_ext}").mkdir(parents=True, exist_ok=True)
-                if response.status_code == 200:
-                    # Save the received file to a local location
-                    with open(f"data/workspace/{file_ext}/{file_name}", "wb") as file:
-                        file.write(response.content)
-                    if self.open_when_done:
-                        self.signal.emit(file_ext, file_name, self.open_when_done)
-                        self.session.close()
-                        return
-                else:
-                    self.signal.emit(None, response.text, False)
-            except Exception as e:
-                self.signal.emit(None, str(e), False)
+        results = self.file_downloader.download_files(
+            [(self.file_url + file_to_download, self.get_file_path(file_to_download)) for file_to_download in self.files_to_download],
+            self.file_downloaded,
+        )
+        if self.open_when_done:
+            for result in results:
+                if result.succeeded:
+                    file_name = os.path.basename(result.file_path)
+                    self.signal.emit(file_name.split(".")[-1].upper(), file_name, self.open_when_done)
+                    return
         self.signal.emit("Successfully downloaded", "Successfully downloaded", self.open_when_done)
-        self.session.close()
+
+    def file_downloaded(self, result: DownloadResult, downloaded_count: int, total_count: int):
+        if result.succeeded:
+            self.progress_signal.emit(result.file_path, downloaded_count, total_count)
+        else:
+            self.signal.emit(None, result.error, False)
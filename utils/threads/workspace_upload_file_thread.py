@@ -1,8 +1,7 @@
-import requests
 from PyQt6.QtCore import QThread, pyqtSignal
 
-from utils.ip_utils import get_server_ip_address, get_server_port
 from utils.json_file import JsonFile
+from utils.server_client import ServerClient
 
 
 class WorkspaceUploadThread(QThread):
@@ -10,10 +9,8 @@ class WorkspaceUploadThread(QThread):
 
     def __init__(self, files_to_upload: list[str]) -> None:
         QThread.__init__(self)
-        # Declaring server IP and port
-        self.SERVER_IP: str = get_server_ip_address()
-        self.SERVER_PORT: int = get_server_port()
-        self.upload_url = f"http://{self.SERVER_IP}:{self.SERVER_PORT}/workspace_upload"
+        self.server_client = ServerClient()
+        self.upload_url = "/workspace_upload"
 
         self.files_to_upload = files_to_upload
 
@@ -24,7 +21,7 @@ class WorkspaceUploadThread(QThread):
                 with open(file_to_upload, "rb") as file:
                     files = {"file": (file_to_upload, file.read())}
                     # files = {"file": (file_to_upload, file.read(), "image/jpeg")}
-                response = requests.post(self.upload_url, files=files, timeout=10)
+                response = self.server_client.post(self.upload_url, files=files, compress=True)
                 if response.status_code == 200:
                     self.signal.emit("Successfully uploaded")
                 else:
@@ -1,5 +1,5 @@
 import copy
-from typing import TYPE_CHECKING, Any, Union
+from typing import TYPE_CHECKING, Any, Iterator, Union
 
 from utils.components_inventory.component import Component
 from utils.laser_cut_inventory.laser_cut_part import LaserCutPart
@@ -73,15 +73,22 @@ class Assembly:
 
     def add_laser_cut_part(self, laser_cut_part: LaserCutPart):
         self.laser_cut_parts.append(laser_cut_part)
+        self.tree_changed()
 
     def remove_laser_cut_part(self, laser_cut_part: LaserCutPart):
         self.laser_cut_parts.remove(laser_cut_part)
+        self.tree_changed()
 
     def add_component(self, component: Component):
         self.components.append(component)
+        self.tree_changed()
 
     def remove_component(self, component: Component):
         self.components.remove(component)
+        self.tree_changed()
+
+    def tree_changed(self):
+        self.group.job.tree_changed()
 
     def get_current_flow_state(self) -> str:
         return self.flow_tag[self.current_flow_state]
@@ -96,9 +103,11 @@ class Assembly:
         assembly.parent_assembly = self
         assembly.group = self.group
         self.sub_assemblies.append(assembly)
+        self.tree_changed()
 
     def remove_sub_assembly(self, assembly) -> "Assembly":
         self.sub_assemblies.remove(assembly)
+        self.tree_changed()
 
     def get_sub_assemblies(self) -> list["Assembly"]:
         return self.sub_assemblies
@@ -112,12 +121,13 @@ class Assembly:
     def rename(self, new_name: str) -> None:
         self.name = new_name
 
-    def get_all_sub_assemblies(self) -> list["Assembly"]:
-        assemblies: list["Assembly"] = []
-        assemblies.extend(self.sub_assemblies)
+    def get_all_sub_assemblies(self) -> tuple["Assembly", ...]:
+        return self.group.job.get_flattened_view((self, "sub_assemblies"), self.iter_all_sub_assemblies)
+
+    def iter_all_sub_assemblies(self) -> Iterator["Assembly"]:
+        yield from self.sub_assemblies
         for sub_assembly in self.sub_assemblies:
-            assemblies.extend(sub_assembly.get_all_sub_assemblies())
-        return assemblies
+            yield from sub_assembly.iter_all_sub_assemblies()
 
     def load_data(self, data: dict[str, Union[float, bool, str, dict]]):
         assembly_data = data.get("assembly_data", {})
@@ -176,6 +186,7 @@ class Assembly:
         for sub_assembly_name, sub_assembly_data in sub_assemblies.items():
             sub_assembly = Assembly(sub_assembly_name, sub_assembly_data, self.group)
             self.sub_assemblies.append(sub_assembly)
+        self.tree_changed()
 
     def to_dict(self, processed_assemblies: set["Assembly"] = None) -> dict:
         if processed_assemblies is None:
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, Iterator, Union
 
 from utils.workspace.assembly import Assembly
 from utils.workspace.workspace_settings import WorkspaceSettings
@@ -21,9 +21,11 @@ class Group:
 
     def add_assembly(self, assembly: Assembly):
         self.assemblies.append(assembly)
+        self.job.tree_changed()
 
     def remove_assembly(self, assembly: Assembly):
         self.assemblies.remove(assembly)
+        self.job.tree_changed()
 
     def get_assembly(self, assembly_name: str) -> Assembly:
         return next((assembly for assembly in self.assemblies if assembly.name == assembly_name), None)
@@ -34,12 +36,13 @@ class Group:
             self.load_assembly(sub_assembly_name, sub_assembly_data)
         return assembly
 
-    def get_all_assemblies(self) -> list[Assembly]:
-        assemblies: list[Assembly] = []
-        assemblies.extend(self.assemblies)
+    def get_all_assemblies(self) -> tuple[Assembly, ...]:
+        return self.job.get_flattened_view((self, "assemblies"), self.iter_all_assemblies)
+
+    def iter_all_assemblies(self) -> Iterator[Assembly]:
+        yield from self.assemblies
         for assembly in self.assemblies:
-            assemblies.extend(assembly.get_all_sub_assemblies())
-        return assemblies
+            yield from assembly.iter_all_sub_assemblies()
 
     def load_data(self, data: dict[str, dict[str, dict]]):
         if not data:
@@ -54,6 +57,7 @@ class Group:
         for assembly_name, assembly_data in assemblies.items():
             assembly = self.load_assembly(assembly_name, assembly_data)
             self.assemblies.append(assembly)
+        self.job.tree_changed()
 
     def to_dict(self) -> dict:
         return {"group_data": {"color": self.color}, "assemblies": {assembly.name: assembly.to_dict(set()) for assembly in self.assemblies}}
@@ -1,12 +1,11 @@
 from enum import Enum, auto
-from typing import TYPE_CHECKING
-
-from natsort import natsorted
+from typing import TYPE_CHECKING, Callable, Hashable, Iterable, Iterator
 
 from utils.components_inventory.component import Component
 from utils.components_inventory.components_inventory import ComponentsInventory
 from utils.laser_cut_inventory.laser_cut_inventory import LaserCutInventory
 from utils.laser_cut_inventory.laser_cut_part import LaserCutPart
+from utils.natural_sort import natural_sorted
 from utils.sheet_settings import SheetSettings
 from utils.workspace.assembly import Assembly
 from utils.workspace.group import Group
@@ -63,6 +62,12 @@ class Job:
         self.unsaved_changes = False
         self.downloaded_from_server = False
 
+        # Bumped whenever a group, assembly, laser cut part or component is added to or removed from the job,
+        # the flattened views below are only rebuilt once it moved
+        self.tree_generation: int = 0
+        self.flattened_views: dict[Hashable, tuple] = {}
+        self.flattened_views_generation: int = -1
+
         self.load_data(data)
 
     def get_color(self):
@@ -82,9 +87,23 @@ class Job:
 
     def add_group(self, group: Group):
         self.groups.append(group)
+        self.tree_changed()
 
     def remove_group(self, group: Group):
         self.groups.remove(group)
+        self.tree_changed()
+
+    def tree_changed(self):
+        self.tree_generation += 1
+
+    def get_flattened_view(self, key: Hashable, get_items: Callable[[], Iterable]) -> tuple:
+        """Shared tuple of get_items(), built once per tree generation. Do not modify what it holds through it."""
+        if self.flattened_views_generation != self.tree_generation:
+            self.flattened_views.clear()
+            self.flattened_views_generation = self.tree_generation
+        if (view := self.flattened_views.get(key)) is None:
+            view = self.flattened_views[key] = tuple(get_items())
+        return view
 
     def add_nest(self, nest: Nest):
         self.nests.append(nest)
@@ -108,31 +127,34 @@ class Job:
         self.sort_laser_cut_parts()
 
     def sort_nests(self):
-        self.nests = natsorted(self.nests, key=lambda nest: nest.name)
+        self.nests = natural_sorted(self.nests, lambda nest: nest.name)
 
     def sort_laser_cut_parts(self):
-        self.grouped_laser_cut_parts = natsorted(self.grouped_laser_cut_parts, key=lambda laser_cut_part: laser_cut_part.name)
+        self.grouped_laser_cut_parts = natural_sorted(self.grouped_laser_cut_parts, lambda laser_cut_part: laser_cut_part.name)
 
     def get_group(self, group_name: str) -> Group:
         return next((group for group in self.groups if group.name == group_name), None)
 
-    def get_all_assemblies(self) -> list[Assembly]:
-        assemblies: list[Assembly] = []
+    def get_all_assemblies(self) -> tuple[Assembly, ...]:
+        return self.get_flattened_view("assemblies", self.iter_all_assemblies)
+
+    def get_all_laser_cut_parts(self) -> tuple[LaserCutPart, ...]:
+        return self.get_flattened_view("laser_cut_parts", self.iter_all_laser_cut_parts)
+
+    def get_all_components(self) -> tuple[Component, ...]:
+        return self.get_flattened_view("components", self.iter_all_components)
+
+    def iter_all_assemblies(self) -> Iterator[Assembly]:
         for group in self.groups:
-            assemblies.extend(group.get_all_assemblies())
-        return assemblies
+            yield from group.iter_all_assemblies()
 
-    def get_all_laser_cut_parts(self) -> list[LaserCutPart]:
-        laser_cut_parts: list[LaserCutPart] = []
-        for assembly in self.get_all_assemblies():
-            laser_cut_parts.extend(assembly.laser_cut_parts)
-        return laser_cut_parts
+    def iter_all_laser_cut_parts(self) -> Iterator[LaserCutPart]:
+        for assembly in self.iter_all_assemblies():
+            yield from assembly.laser_cut_parts
 
-    def get_all_components(self) -> list[Component]:
-        components: list[Component] = []
-        for assembly in self.get_all_assemblies():
-            components.extend(assembly.components)
-        return components
+    def iter_all_components(self) -> Iterator[Component]:
+        for assembly in self.iter_all_assemblies():
+            yield from assembly.components
 
     def load_data(self, data: dict[str, dict[str, object]]):
         if not data:
@@ -159,6 +181,7 @@ class Job:
         for group_name, group_data in groups_data.items():
             group = Group(group_name, group_data, self)
             self.add_group(group)
+        self.tree_changed()
 
     def to_dict(self) -> dict:
         self.unsaved_changes = False
@@ -36,10 +36,10 @@ class Nest:
             return 0.0
 
     def get_sheet_cost(self) -> float:
-        if price_per_pound := self.sheet_settings.get_price_per_pound(self.sheet.material):
-            if pounds_per_square_foot := self.sheet_settings.get_pounds_per_square_foot(self.sheet.material, self.sheet.thickness):
-                pounds_per_sheet = ((self.sheet.length * self.sheet.width) / 144) * pounds_per_square_foot
-                return price_per_pound * pounds_per_sheet
+        pounds_per_square_foot, price_per_pound = self.sheet_settings.get_sheet_price_factors(self.sheet.material, self.sheet.thickness)
+        if price_per_pound and pounds_per_square_foot:
+            pounds_per_sheet = ((self.sheet.length * self.sheet.width) / 144) * pounds_per_square_foot
+            return price_per_pound * pounds_per_sheet
         return 0.0
 
     def get_machining_time(self) -> float:
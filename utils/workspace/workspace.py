@@ -1,7 +1,9 @@
 import os
+from typing import Iterator
 
-import ujson as json
-
+from utils.storage import json_stream
+from utils.storage.storage import get_storage_backend
+from utils.storage.storage_backend import StorageBackend
 from utils.workspace.job import Job
 from utils.workspace.workspace_settings import WorkspaceSettings
 
@@ -12,6 +14,7 @@ class Workspace:
 
         self.file_name: str = file_name
         self.FOLDER_LOCATION: str = f"{os.getcwd()}/data"
+        self.storage: StorageBackend = get_storage_backend(self.file_name, self.FOLDER_LOCATION)
 
         self.workspace_settings = WorkspaceSettings()
 
@@ -31,23 +34,29 @@ class Workspace:
         return {job.name: job.to_dict() for job in self.jobs}
 
     def __create_file(self) -> None:
-        if not os.path.exists(f"{self.FOLDER_LOCATION}/{self.file_name}.json"):
-            with open(f"{self.FOLDER_LOCATION}/{self.file_name}.json", "w", encoding="utf-8") as json_file:
-                json_file.write("{}")
+        if not self.storage.exists():
+            self.storage.reset()
 
     def save(self) -> None:
-        with open(f"{self.FOLDER_LOCATION}/{self.file_name}.json", "w", encoding="utf-8") as json_file:
-            json.dump(self.to_dict(), json_file, ensure_ascii=False)
+        self.storage.save(self.to_dict())
+
+    def compact(self) -> None:
+        self.storage.compact()
+
+    def iter_job_data(self) -> Iterator[tuple[str, dict[str, object]]]:
+        """Yields (job_name, job_data) one job at a time, straight from the file when it is up to date."""
+        if self.storage.prepare_snapshot_read():
+            yield from json_stream.iter_items(self.storage.get_file_path())
+        else:
+            yield from self.storage.load().items()
 
     def load_data(self) -> None:
+        self.jobs.clear()
+        self.storage.update_cache({})
         try:
-            with open(f"{self.FOLDER_LOCATION}/{self.file_name}.json", "r", encoding="utf-8") as json_file:
-                data = json.load(json_file)
-        except json.JSONDecodeError:
+            for job_name, job_data in self.iter_job_data():
+                self.storage.cache_value(job_name, job_data)
+                job = Job(job_name, job_data)
+                self.jobs.append(job)
+        except ValueError:  # Covers both decoders, the file got cleared
             return
-
-        self.jobs.clear()
-
-        for job_name, job_data in data.items():
-            job = Job(job_name, job_data)
-            self.jobs.append(job)
@@ -2,6 +2,9 @@ import os
 
 import ujson as json
 
+from utils.name_index import NameIndex
+from utils.storage.storage import get_storage_backend
+from utils.storage.storage_backend import StorageBackend
 from utils.workspace.flow_tag import FlowTag, Group
 from utils.workspace.flow_tags import FlowTags
 from utils.workspace.status import Status
@@ -12,30 +15,43 @@ class WorkspaceSettings:
     def __init__(self) -> None:
         self.filename: str = "workspace_settings"
         self.FOLDER_LOCATION: str = f"{os.getcwd()}/data"
+        self.storage: StorageBackend = get_storage_backend(self.filename, self.FOLDER_LOCATION)
         self.notes: str = ""
         self.tags: list[Tag] = []
         self.flow_tags_group: list[FlowTags] = []
+        self.tags_by_name = NameIndex[Tag](self.tags)
+        self.flow_tag_groups_by_name = NameIndex[FlowTags](self.flow_tags_group)
         self.__create_file()
         self.load_data()
 
     def create_group(self, name: str) -> FlowTags:
         flow_tags = FlowTags(name)
         self.flow_tags_group.append(flow_tags)
+        self.flow_tag_groups_by_name.add(flow_tags)
         return flow_tags
 
     def delete_group(self, group: FlowTags):
         self.flow_tags_group.remove(group)
+        self.flow_tag_groups_by_name.remove(group)
+
+    def rename_group(self, group: FlowTags, new_name: str):
+        group.name = new_name
+        self.flow_tag_groups_by_name.mark_stale()
 
     def get_flow_tag_group(self, name: str) -> FlowTags:
-        for group in self.flow_tags_group:
-            if group.name == name:
-                return group
+        return self.flow_tag_groups_by_name.get(name)
 
     def add_tag(self, tag: Tag):
         self.tags.append(tag)
+        self.tags_by_name.add(tag)
 
     def remove_tag(self, tag: Tag):
         self.tags.remove(tag)
+        self.tags_by_name.remove(tag)
+
+    def rename_tag(self, tag: Tag, new_name: str):
+        tag.name = new_name
+        self.tags_by_name.mark_stale()
 
     def get_all_tags(self) -> list[str]:
         return [tag.name for tag in self.tags]
@@ -47,13 +63,11 @@ class WorkspaceSettings:
         return statuses
 
     def get_tag(self, tag_name: str) -> Tag:
-        for tag in self.tags:
-            if tag.name == tag_name:
-                return tag
+        return self.tags_by_name.get(tag_name)
 
     def create_tag(self, name: str) -> Tag:
         tag = Tag(name, {"attribute": {}, "statuses": {}})
-        self.tags.append(tag)
+        self.add_tag(tag)
         return tag
 
     def create_flow_tag(self, flow_tags: FlowTags, name: str):
@@ -89,21 +103,21 @@ class WorkspaceSettings:
         flow_tags.remove_flow_tag(flow_tag)
 
     def save(self):
-        with open(f"{self.FOLDER_LOCATION}/{self.filename}.json", "w", encoding="utf-8") as file:
-            json.dump(self.to_dict(), file, ensure_ascii=False, indent=4)
+        self.storage.save(self.to_dict())
+
+    def compact(self):
+        self.storage.compact()
 
     def __create_file(self):
-        if not os.path.exists(f"{self.FOLDER_LOCATION}/{self.filename}.json"):
+        if not self.storage.exists():
             self._reset_file()
 
     def _reset_file(self):
-        with open(f"{self.FOLDER_LOCATION}/{self.filename}.json", "w", encoding="utf-8") as file:
-            file.write("{}")
+        self.storage.reset()
 
     def load_data(self):
         try:
-            with open(f"{self.FOLDER_LOCATION}/{self.filename}.json", "r", encoding="utf-8") as file:
-                data: dict[str, dict[str, object]] = json.load(file)
+            data: dict[str, dict[str, object]] = self.storage.load()
         except KeyError:  # Inventory was just created
             return
         except json.JSONDecodeError:  # Inventory file got cleared
@@ -119,19 +133,21 @@ Tags such as, "Staging", "Editing", and "Planning" cannot be used as flow tags,
         )
         self.tags.clear()
         self.flow_tags_group.clear()
+        self.tags_by_name.clear()
+        self.flow_tag_groups_by_name.clear()
 
         for tag, tag_data in data.get("tags", {}).items():
-            tag = Tag(tag, tag_data)
-            self.tags.append(tag)
+            self.add_tag(Tag(tag, tag_data))
 
         for group, flow_tags in data.get("flow_tags", {}).items():
-            flow_tag_group = FlowTags(group)
-            self.flow_tags_group.append(flow_tag_group)
+            flow_tag_group = self.create_group(group)
             for flow_tag_data in flow_tags:
                 flow_tag = FlowTag(flow_tag_data["name"], flow_tag_data, self)
                 flow_tag_group.group = flow_tag.group
                 flow_tag_group.add_flow_tag(flow_tag)
 
+        self.storage.update_cache(self.to_dict())
+
     def to_dict(self) -> dict[str, dict[str, dict[str, dict]]]:
         data: dict[str, dict[str, list]] = {"notes": self.notes, "tags": {}, "flow_tags": {}}
         for tag in self.tags: